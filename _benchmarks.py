@@ -0,0 +1,226 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import typing as ty
+
+from decimal import Decimal
+from mortgage_sim import __version__
+from mortgage_sim.AnnuityFollowUpCreator import AnnuityFollowUpCreator
+from mortgage_sim.CentsMoney import CentsMoney
+from mortgage_sim.Finances import Finances
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.FinancialDelta import FinancialDelta
+from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
+from mortgage_sim.Scenario import Scenario
+from mortgage_sim.Wallet import Wallet
+from mortgage_sim.types import Percentage
+
+
+# Number of finance positions, number of mortgages and horizon in years
+SCALES: ty.Dict[str, ty.Tuple[int, int, int]] = {
+    'small': (10, 1, 30),
+    'medium': (100, 5, 40),
+    'large': (1_000, 20, 50),
+}
+
+
+def generate_scenario(seed: int, positions: int, mortgages: int, years: int) -> Scenario:
+    # Household with a salary, recurring and one-off positions and rented out properties financed by mortgages which are refinanced by
+    # follow-ups. The rents cover the mortgage payments and the salary covers the expenses with a small margin, so the scenario never
+    # overextends and the surplus is too small to pay the mortgages off long before the horizon.
+    rng = random.Random(seed)
+    start_date = FinancialDate(year=2024, month=1)
+    months = years * 12
+    amount = lambda low, high: Decimal(rng.randint(low * 100, high * 100)).scaleb(-2)
+
+    finances = Finances(0)
+    mortgage_list = list()
+    for index in range(mortgages):
+        initial_amount = amount(20_000, 400_000 // mortgages + 20_000)
+        valid_from = start_date + FinancialDelta(months=rng.randint(0, min(months // 4, 60)))
+        years_valid = rng.randint(5, 15)
+        valid_until = valid_from + FinancialDelta(months=12 * years_valid)
+        repayment_parameter_set = RepaymentParameterSet(rng.choice([500, 1_000, 2_000]), Percentage(rng.choice([5, 10])), rng.choice([1, 2, 4, 12]))
+        interest_rate, payback_rate = amount(2, 5), amount(1, 2)
+        mortgage = Mortgage(f'Mortgage {index}', initial_amount, Percentage(interest_rate), Percentage(payback_rate), valid_from, valid_until,
+                            repayment_parameter_set)
+        rents = [(valid_from, initial_amount * (interest_rate + payback_rate))]
+        if rng.random() < 0.3:
+            altered_when = valid_from + FinancialDelta(months=12 * rng.randint(1, 4))
+            altered_payback_rate = amount(1, 2)
+            mortgage.alter_payback_rate(altered_when, Percentage(altered_payback_rate))
+            rents.append((altered_when, initial_amount * (interest_rate + altered_payback_rate)))
+            payback_rate = min(payback_rate, altered_payback_rate)
+        mortgage_list.append(mortgage)
+        # The rent follows the annuity and covers the follow-up, which keeps the payment and pays at least 1 % of at most the rest amount
+        # left by the lowest payback rate
+        rents.append((valid_until, max(rents[-1][1], initial_amount * (1 - payback_rate * years_valid / 100) * (Decimal('4.5') + 1))))
+        for position, (when, rent) in enumerate(rents):
+            finances.add_income(f'Rent {index}.{position}', when, round(rent / 1_200, 2), FinancialDelta(months=1))
+            if position + 1 < len(rents):
+                finances.remove_income(f'Rent {index}.{position}', rents[position + 1][0])
+
+    # Recurring expenses which are due from the first period on and of which a fifth is replaced later, and some one-off expenses
+    expenses = Decimal(0)
+    one_off_expenses = Decimal(0)
+    for index in range(max(positions - 2, 1)):
+        if rng.random() < 0.2:
+            when = start_date + FinancialDelta(months=rng.randint(0, months - 1))
+            value = amount(100, 2_000)
+            finances.add_expense(f'One-off {index}', when, value)
+            one_off_expenses += value
+            continue
+        period = rng.choice([1, 1, 3, 12])
+        when = start_date + FinancialDelta(months=rng.randint(0, period - 1))
+        value = amount(5, max(50, 6_000 // positions))
+        finances.add_expense(f'Expense {index}', when, value, FinancialDelta(months=period))
+        if rng.random() < 0.2:
+            ended = when + FinancialDelta(months=rng.randint(1, months))
+            finances.remove_expense(f'Expense {index}', ended)
+            finances.add_expense(f'Replacement {index}', ended, value, FinancialDelta(months=period))
+        expenses += value / period
+
+    salary = round((expenses + one_off_expenses / months) * Decimal('1.01') + 50, 2)
+    finances.add_income('Salary', start_date, salary, FinancialDelta(months=1))
+    finances.add_income('Bonus', start_date + FinancialDelta(months=rng.randint(0, 11)), round(salary / 20, 2), FinancialDelta(months=12))
+
+    # The reserve covers the one-off expenses, however early they are due
+    reserve = round(salary * 2 + one_off_expenses, 2)
+    wallet = Wallet(reserve).add_saving_policy('Reserve', start_date, reserve)
+    wallet.add_saving_policy('Growing Reserve', start_date + FinancialDelta(years=1), 100, FinancialDelta(years=1))
+    return Scenario(start_date, finances, wallet, mortgage_list, AnnuityFollowUpCreator(Percentage(Decimal('4.5')), Percentage(1)), horizon=months)
+
+
+def measure(function: ty.Callable[[], ty.Any], repeat: int) -> ty.Dict[str, float]:
+    timings = list()
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - begin)
+    return {'min': min(timings), 'median': statistics.median(timings), 'repeat': repeat}
+
+
+def run_benchmarks(scales: ty.Iterable[str], repeat: int, seed: int = 0) -> ty.Dict[str, ty.Dict[str, float]]:
+    results = dict()
+    for scale in scales:
+        positions, mortgages, years = SCALES[scale]
+        scenario = generate_scenario(seed, positions, mortgages, years)
+        months = years * 12
+
+        def payment_plan():
+            instance = scenario.instantiate()
+            strategy = instance.create_strategy()
+            strategy.calculate_payment_plan(instance.start, instance.finances, instance.wallet)
+            return strategy
+
+        def cents_payment_plan(numeric):
+            instance = scenario.instantiate()
+            instance.create_strategy().calculate_payment_plan(instance.start, instance.finances, instance.wallet, CentsMoney(), numeric=numeric)
+
+        def finances_lookup():
+            for month in range(months):
+                scenario.finances.snapshot(scenario.start + FinancialDelta(months=month))
+
+        def summary():
+            scenario.summarize()
+
+        def aggregates():
+            scenario.aggregate()
+
+        def stream():
+            for _ in scenario.stream():
+                pass
+
+        strategy = payment_plan()
+        frame = strategy.payment_plan.result
+
+        results[f'calculate_payment_plan[{scale}]'] = measure(payment_plan, repeat)
+        results[f'calculate_payment_plan_cents[{scale}]'] = measure(lambda: cents_payment_plan(False), repeat)
+        results[f'calculate_payment_plan_cents_numeric[{scale}]'] = measure(lambda: cents_payment_plan(True), repeat)
+        results[f'calculate_summary[{scale}]'] = measure(summary, repeat)
+        results[f'calculate_aggregates[{scale}]'] = measure(aggregates, repeat)
+        results[f'stream_payment_plan[{scale}]'] = measure(stream, repeat)
+        results[f'finances_lookup[{scale}]'] = measure(finances_lookup, repeat)
+        results[f'payment_plan_result[{scale}]'] = measure(lambda: strategy.payment_plan.result, repeat)
+
+        # The display helpers need IPython and babel, which are optional outside of notebooks
+        try:
+            from mortgage_sim import display_payment_plan
+        except ImportError:
+            continue
+
+        def display():
+            with contextlib.redirect_stdout(io.StringIO()):
+                display_payment_plan(frame, years_per_page=5)
+
+        results[f'display_payment_plan[{scale}]'] = measure(display, repeat)
+    return results
+
+
+def regressions(results: ty.Dict[str, ty.Dict[str, float]], baseline: ty.Dict[str, ty.Dict[str, float]], threshold: float) -> ty.List[str]:
+    # Benchmarks whose median exceeds the baseline median by more than the threshold, unknown benchmarks are skipped
+    messages = list()
+    for name, result in results.items():
+        reference = baseline.get(name, None)
+        if reference is None:
+            continue
+        ratio = result['median'] / reference['median']
+        if 1 + threshold < ratio:
+            messages.append(f'{name}: {result["median"]:.4f}s is {ratio:.2f}x the baseline {reference["median"]:.4f}s')
+    return messages
+
+
+def slower_summaries(results: ty.Dict[str, ty.Dict[str, float]]) -> ty.List[str]:
+    # Scales at which the summary, which keeps no monthly rows and fast-forwards, takes longer than the full payment plan
+    messages = list()
+    for name, result in results.items():
+        if not name.startswith('calculate_summary['):
+            continue
+        reference = results.get(name.replace('calculate_summary', 'calculate_payment_plan', 1), None)
+        if reference is not None and reference['median'] < result['median']:
+            messages.append(f'{name}: {result["median"]:.4f}s is slower than the payment plan {reference["median"]:.4f}s')
+    return messages
+
+
+def main(arguments: ty.Optional[ty.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Times the simulation on synthetic scenarios and compares the timings to a baseline.')
+    parser.add_argument('--scales', default=','.join(SCALES), help=f'comma separated scales out of {list(SCALES)}')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per benchmark, the median is compared')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the scenario generator')
+    parser.add_argument('--output', help='JSON file the results are written to')
+    parser.add_argument('--baseline', help='JSON file of earlier results to compare to')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed relative slowdown against the baseline')
+    options = parser.parse_args(arguments)
+
+    scales = [scale for scale in options.scales.split(',') if scale]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f'unknown scales {unknown}')
+
+    results = run_benchmarks(scales, options.repeat, options.seed)
+    report = {'version': __version__, 'python': platform.python_version(), 'machine': platform.machine(), 'seed': options.seed, 'results': results}
+    for name, result in results.items():
+        print(f'{name:45} {result["median"]:10.4f}s')
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as stream:
+            json.dump(report, stream, indent=2)
+
+    messages = slower_summaries(results)
+    if options.baseline:
+        with open(options.baseline, encoding='utf-8') as stream:
+            baseline = json.load(stream)['results']
+        messages += regressions(results, baseline, options.threshold)
+    for message in messages:
+        print(f'Regression {message}', file=sys.stderr)
+    return 1 if messages else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,45 @@
 import unittest as ut
 
+from _benchmarks import SCALES, generate_scenario, slower_summaries
+from babel.numbers import format_currency
+from mortgage_sim import render_payment_plan
+from mortgage_sim.AnnuityFollowUpCreator import AnnuityFollowUpCreator
+from mortgage_sim.BatchAmortization import BatchAmortization
+from mortgage_sim.BatchRunner import BatchRunner
+from mortgage_sim.CalendarEvent import EventKind
+from mortgage_sim.CentsMoney import CentsMoney
+from mortgage_sim.EventCalendar import EventCalendar, MORTGAGE_EVENTS
 from mortgage_sim.FinancialDate import FinancialDate
 from mortgage_sim.FinancialDelta import FinancialDelta
+from mortgage_sim.FinancialPosition import FinancialPosition
+from mortgage_sim.IncrementalSimulation import IncrementalSimulation
+from mortgage_sim.Instrumentation import Instrumentation
 from mortgage_sim.TemporalValue import TemporalValue
 from mortgage_sim.Finances import Finances
+from mortgage_sim.MinInterestRatePaybackStrategy import MinInterestRatePaybackStrategy
+from mortgage_sim.MinRestDurationPaybackStrategy import MinRestDurationPaybackStrategy
+from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.MonteCarloSimulation import MonteCarloSimulation
+from mortgage_sim.MonthlyPayment import MonthlyPayment
+from mortgage_sim.Overextension import Overextension
+from mortgage_sim.ParameterSweep import ParameterSweep
+from mortgage_sim.PaybackStrategy import PaybackStrategy
+from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.RandomPaybackStrategy import RandomPaybackStrategy
+from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
+from mortgage_sim.ResultCache import ResultCache
+from mortgage_sim.Scenario import Scenario
+from mortgage_sim.ScenarioLoader import ScenarioLoader
+from mortgage_sim.Wallet import Wallet
+from mortgage_sim.types import Percentage
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+import json
+import numpy as np
+import pathlib
+import pickle
+import tempfile
 
 
 class FinancialDateTest(ut.TestCase):
@@ -44,6 +80,29 @@ class FinancialDateTest(ut.TestCase):
             self.assertEqual(new_date.year, expected_year)
             self.assertEqual(new_date.month, expected_month)
 
+    def test_value_semantics(self):
+        # Arrange
+        date = FinancialDate(year=2024, month=12)
+        position = FinancialPosition('Rent', date, 900, FinancialDelta(months=1))
+        
+        # Act
+        keys = {date: 'date', FinancialDelta(years=1): 'delta', Percentage(5): 'percentage', position: 'position'}
+        
+        # Assert
+        self.assertIs(FinancialDate(year=2024, month=12), date)
+        self.assertIs(FinancialDate.from_ordinal(date.ordinal + 1), date + FinancialDelta(months=1))
+        self.assertIs(pickle.loads(pickle.dumps(date)), date)
+        self.assertEqual(keys[FinancialDate.from_ordinal(date.ordinal)], 'date')
+        self.assertEqual(keys[12], 'delta')
+        self.assertEqual(keys[Percentage(Decimal('5.0'))], 'percentage')
+        self.assertEqual(keys[FinancialPosition('Rent', date, Decimal(900), FinancialDelta(months=1))], 'position')
+        self.assertEqual(FinancialDelta(months=1, years=1).months, 13)
+        self.assertNotEqual(date, None)
+        with self.assertRaises(AttributeError):
+            position.amount = 0
+        with self.assertRaises(ValueError):
+            FinancialDate(year=2024, month=13)
+
 class TemporalValueTest(ut.TestCase):
     def test_temporal_value(self):
         # Arrange
@@ -63,6 +122,23 @@ class TemporalValueTest(ut.TestCase):
         self.assertEqual(tv.get_value(date), expected_value)
         self.assertEqual(tv.get_value(after_date), expected_value)
         
+    def test_get_values(self):
+        # Arrange
+        tv = TemporalValue[int](-1)
+        start_date = FinancialDate(year=2023, month=11)
+        
+        # Act
+        tv.set_value(FinancialDate(year=2024, month=2), 2)
+        tv.set_value(FinancialDate(year=2024, month=1), 1)
+        tv.set_value(FinancialDate(year=2024, month=2), 3)
+        values = tv.get_values(start_date, 6)
+        
+        # Assert
+        self.assertEqual(values, [-1, -1, 1, 3, 3, 3])
+        self.assertEqual(values, [tv.get_value(start_date + FinancialDelta(months=m)) for m in range(6)])
+        self.assertEqual(tv.get_values(FinancialDate(year=2024, month=3), 2), [3, 3])
+        self.assertEqual([when for when, _ in tv.items()], [FinancialDate(year=2024, month=1), FinancialDate(year=2024, month=2)])
+        
         
 class FinancesTest(ut.TestCase):
     def test_check_finances(self):
@@ -135,7 +211,905 @@ class FinancesTest(ut.TestCase):
             actual_balance = balances[i]
             expected_balance = expected_balances[i]
             self.assertEqual(actual_balance, expected_balance, f'Error at index {i}')
+            
+    def test_timeline(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=1)
+        finances = Finances(0) \
+            .add_income('Salary', start_date, 3_000, FinancialDelta(months=1)) \
+            .add_income('Salary', FinancialDate(year=2024, month=7), 3_200.50, FinancialDelta(months=1)) \
+            .add_income('Bonus', FinancialDate(year=2023, month=11), 1_000, FinancialDelta(months=12)) \
+            .add_income('Refund', FinancialDate(year=2024, month=3), 125) \
+            .add_expense('Rent', start_date, 1_200, FinancialDelta(months=1)) \
+            .add_expense('Insurance', FinancialDate(year=2024, month=2), 300, FinancialDelta(months=3)) \
+            .remove_expense('Insurance', FinancialDate(year=2025, month=2)) \
+            .add_expense('Never', start_date, 50, FinancialDelta(months=0))
+        months = 30
+        
+        # Act
+        timeline = finances.timeline(start_date, months)
+        
+        # Assert
+        for m in range(months):
+            when = start_date + FinancialDelta(months=m)
+            self.assertEqual(timeline.income[m], finances.get_effective_income_value(when), f'Error at index {m}')
+            self.assertEqual(timeline.expense[m], finances.get_effective_expense_value(when), f'Error at index {m}')
+            self.assertEqual(timeline.balance[m], finances.get_effective_balance(when), f'Error at index {m}')
+        self.assertEqual(timeline.incomes['Bonus'][10], 1_000)
+        self.assertEqual(timeline.incomes['Refund'][2], 125)
+        self.assertEqual(timeline.expenses['Insurance'][13], 0)
+        self.assertEqual(timeline.index(FinancialDate(year=2025, month=3)), 14)
+        
+    def test_snapshot(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=1)
+        finances = Finances(0) \
+            .add_income('Salary', start_date, 3_000, FinancialDelta(months=1)) \
+            .add_income('Bonus', start_date + FinancialDelta(months=2), 1_000, FinancialDelta(months=12)) \
+            .add_expense('Rent', start_date, 1_200, FinancialDelta(months=1))
+        when = start_date + FinancialDelta(months=2)
+        
+        # Act
+        snapshot = finances.snapshot(when)
+        timeline_snapshot = finances.timeline(start_date, 12).snapshot(2)
+        
+        # Assert
+        self.assertEqual(snapshot.income, 4_000)
+        self.assertEqual(snapshot.expense, 1_200)
+        self.assertEqual(snapshot.balance, finances.get_effective_balance(when))
+        self.assertEqual([position.name for position in snapshot.incomes], ['Salary', 'Bonus'])
+        self.assertEqual([position.name for position in timeline_snapshot.incomes], ['Salary', 'Bonus'])
+        self.assertEqual(timeline_snapshot.when, when)
+        self.assertEqual(timeline_snapshot.balance, snapshot.balance)
+        
+    def test_effective_positions(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=1)
+        finances = Finances(0) \
+            .add_income('Salary', start_date, 3_000, FinancialDelta(months=1)) \
+            .add_income('Dividend', start_date + FinancialDelta(months=1), 200, FinancialDelta(months=3)) \
+            .add_income('Bonus', start_date + FinancialDelta(months=11), 1_000, FinancialDelta(months=12)) \
+            .add_income('Gift', start_date + FinancialDelta(months=4), 500) \
+            .remove_income('Dividend', start_date + FinancialDelta(months=7)) \
+            .add_income('Salary', start_date + FinancialDelta(months=6), 3_200, FinancialDelta(months=1))
+        
+        # Act
+        incomes = [[position.name for position in finances.get_effective_incomes(start_date + FinancialDelta(months=month))] for month in range(24)]
+        finances.add_income('Dividend', start_date + FinancialDelta(months=13), 250, FinancialDelta(months=3))
+        
+        # Assert
+        self.assertEqual(incomes[1], ['Salary', 'Dividend'])
+        self.assertEqual(incomes[4], ['Salary', 'Dividend', 'Gift'])
+        self.assertEqual(incomes[10], ['Salary'])
+        self.assertEqual(incomes[11], ['Salary', 'Bonus'])
+        self.assertEqual(incomes[23], ['Salary', 'Bonus'])
+        self.assertEqual(finances.get_effective_income_value(start_date + FinancialDelta(months=4)), 3_700)
+        self.assertEqual(finances.get_effective_income_value(start_date + FinancialDelta(months=7)), 3_200)
+        self.assertEqual(finances.get_effective_income_value(start_date + FinancialDelta(months=16)), 3_450)
+        
+
+class WalletTest(ut.TestCase):
+    def test_saving_policy_value(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=1)
+        wallet = Wallet(5_000) \
+            .add_saving_policy('Reserve', start_date, 1_000) \
+            .add_saving_policy('Growing', start_date + FinancialDelta(months=2), 100, FinancialDelta(months=3))
+        
+        # Act
+        values = [wallet.get_effective_saving_policy_value(start_date + FinancialDelta(months=month)) for month in range(9)]
+        wallet.remove_saving_policy('Reserve', start_date + FinancialDelta(months=6))
+        
+        # Assert
+        self.assertEqual(values, [1_000, 1_000, 1_000, 1_000, 1_000, 1_100, 1_100, 1_100, 1_200])
+        self.assertEqual(wallet.get_surplus(start_date + FinancialDelta(months=8)), 4_800)
+        self.assertEqual(wallet.get_surplus(start_date + FinancialDelta(months=5)), 3_900)
+        self.assertEqual(wallet.get_surplus(FinancialDate(year=2023, month=1)), 5_000)
+        self.assertEqual(wallet.get_effective_saving_policy_value(start_date + FinancialDelta(years=50)), 19_900)
+
+    def test_saving_targets_of_horizon(self):
+        # Arrange
+        scenario = create_fast_forward_scenario(50 * 12)
+        instance = scenario.instantiate()
+        
+        # Act
+        instance.create_strategy().calculate_summary(instance.start, instance.finances, instance.wallet)
+        
+        # Assert
+        self.assertEqual(instance.wallet._saving_targets_first, scenario.start.ordinal)
+        self.assertEqual(len(instance.wallet._saving_targets), 50 * 12)
+
+
+class MortgageTest(ut.TestCase):
+    def test_payment_state(self):
+        # Arrange
+        start = FinancialDate(year=2024, month=1)
+        mortgage = Mortgage('Mortgage', 120_000, Percentage(3), Percentage(2), start)
+        mortgage.update_current_date(start)
+        payment_plan = PaymentPlan()
+        payment_plan.start_of_row()
+        
+        # Act
+        monthly_payment = mortgage._monthly_payment()
+        same_payment = mortgage._monthly_payment()
+        mortgage.alter_interest_rate(start, Percentage(6))
+        altered_payment = mortgage._monthly_payment()
+        mortgage.execute_payback(payment_plan, Wallet(10_000))
+        
+        # Assert
+        self.assertIs(same_payment, monthly_payment)
+        self.assertEqual(monthly_payment, MonthlyPayment(Decimal(500), Decimal(300), Decimal(500)))
+        self.assertEqual(altered_payment, MonthlyPayment(Decimal(800), Decimal(600), Decimal(800)))
+        self.assertEqual(mortgage.current_amount, Decimal(119_800))
+        self.assertEqual(mortgage.interest_value, Decimal('599.00'))
+        mortgage.update_current_date(start + FinancialDelta(months=1))
+        self.assertEqual(mortgage.monthly_payment, MonthlyPayment(Decimal(800), Decimal('599.00'), Decimal(800)))
+
+
+class BatchAmortizationTest(ut.TestCase):
+    def test_matches_payback_strategy(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=3)
+        months = 30 * 12
+        finances = Finances(0) \
+            .add_income('Salary', start_date, 5_000, FinancialDelta(months=1)) \
+            .add_income('Bonus', start_date + FinancialDelta(months=9), 3_000, FinancialDelta(months=12)) \
+            .add_expense('Living', start_date, 1_800, FinancialDelta(months=1))
+        create_wallet = lambda: Wallet(4_000).add_saving_policy('Reserve', start_date, 8_000)
+        parameters = [
+            (150_000, Decimal('3.73'), Decimal('2'), None, None),
+            (300_000, Decimal('4.17'), Decimal('1.5'), RepaymentParameterSet(1_000, Percentage(5), 12), None),
+            (Decimal('99999.99'), Decimal('2.11'), Decimal('3.33'), RepaymentParameterSet(500, 20_000, 2), None),
+            (150_000, Decimal('3.73'), Decimal('2'), RepaymentParameterSet(0, 0, 0), RepaymentParameterSet(1_000, Percentage(5), 12)),
+        ]
+        
+        def create_mortgage(amount, interest_rate, payback_rate, parameter_set, later_parameter_set):
+            mortgage = Mortgage('M', amount, Percentage(interest_rate), Percentage(payback_rate), start_date, None, parameter_set) \
+                .alter_interest_rate(start_date + FinancialDelta(months=40), Percentage(interest_rate + 1))
+            if later_parameter_set is not None:
+                mortgage.alter_repayment_parameter_set(start_date + FinancialDelta(months=24), later_parameter_set)
+            return mortgage
+        
+        saving_targets = [create_wallet().get_effective_saving_policy_value(start_date + FinancialDelta(months=m)) for m in range(months)]
+        
+        # Act
+        batch = BatchAmortization.from_mortgages(start_date, months, [create_mortgage(*p) for p in parameters], [4_000] * len(parameters),
+                                                 finances.timeline(start_date, months).balance, saving_targets).run()
+        
+        # Assert
+        for index, p in enumerate(parameters):
+            expected = MinInterestRatePaybackStrategy([create_mortgage(*p)]).calculate_payment_plan(start_date, finances, create_wallet())
+            actual = batch.payment_plan(index, 'M')
+            self.assertEqual(len(actual), len(expected))
+            if p[4] is not None:
+                self.assertEqual(sum(actual['M Unscheduled'][:24]), 0)
+                self.assertGreater(sum(actual['M Unscheduled'][24:]), 0)
+            for column in actual.columns:
+                self.assertEqual(list(actual[column]), list(expected[column]), f'Error in {column} of scenario {index}')
+        self.assertTrue((batch.overextension_month == -1).all())
+
+
+class MoneyTest(ut.TestCase):
+    def test_cents_rounding(self):
+        # Arrange
+        money = CentsMoney()
+        rate = money.rate(Percentage(Decimal('6')))
+        
+        # Act
+        values = [money.scale(amount, rate, 12) for amount in (25, 75, 125, 124)]
+        
+        # Assert
+        self.assertEqual(values, [0, 0, 1, 1])
+        self.assertEqual(money.coerce(Decimal('10.005')), 1000)
+        self.assertEqual(money.coerce(Decimal('10.015')), 1002)
+        self.assertEqual(money.to_decimal(123456), Decimal('1234.56'))
+        
+    def test_cents_reproduce_payment_plan(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=1)
+        finances = Finances(0) \
+            .add_income('Salary', start_date, 6_000, FinancialDelta(months=1)) \
+            .add_income('Bonus', start_date + FinancialDelta(months=10), 2_500, FinancialDelta(months=12)) \
+            .add_expense('Living', start_date, 2_100, FinancialDelta(months=1))
+        create_wallet = lambda: Wallet(5_000).add_saving_policy('Reserve', start_date, 10_000).add_saving_policy('Reserve+', start_date, 1_000, FinancialDelta(years=1))
+        create_mortgages = lambda: [
+            Mortgage('Short', 200_000, Percentage(3.73), Percentage(2), start_date, None, RepaymentParameterSet(1_000, Percentage(5), 12)),
+            Mortgage('Long', 100_000, Percentage(4.17), Percentage(1), start_date, None, RepaymentParameterSet(500, Percentage(5), 4)) \
+                .alter_interest_rate(FinancialDate(year=2029, month=1), Percentage(5.5)),
+        ]
+        
+        # Act
+        expected = MinInterestRatePaybackStrategy(create_mortgages()).calculate_payment_plan(start_date, finances, create_wallet())
+        actual = MinInterestRatePaybackStrategy(create_mortgages()).calculate_payment_plan(start_date, finances, create_wallet(), CentsMoney())
+        
+        # Assert
+        self.assertEqual(list(actual.columns), list(expected.columns))
+        self.assertEqual(len(actual), len(expected))
+        for column in expected.columns:
+            self.assertEqual(list(actual[column]), list(expected[column]), f'Error in {column}')
+
+
+class PaymentPlanTest(ut.TestCase):
+    def test_columns(self):
+        # Arrange
+        payment_plan = PaymentPlan(CentsMoney(), 1)
+        interest = payment_plan.amount_column('Interest')
+        
+        # Act
+        for month in range(3):
+            payment_plan.start_of_row()
+            interest.record(month * 100)
+            if month == 1:
+                payment_plan.record('Unscheduled', Decimal('12.34'), Decimal(0))
+        payment_plan.record_amount('Unscheduled', 5)
+        numeric = payment_plan.to_frame(numeric=True)
+        result = payment_plan.result
+        
+        # Assert
+        self.assertEqual(payment_plan.capacity, 4)
+        self.assertEqual(numeric['Interest'].dtype, np.int64)
+        self.assertEqual(list(numeric['Unscheduled']), [0, 1234, 5])
+        self.assertTrue(np.shares_memory(numeric['Interest'].to_numpy(), interest.values))
+        self.assertEqual(list(result['Interest']), [Decimal(0), Decimal(1), Decimal(2)])
+        self.assertEqual(payment_plan.column_names, ['Interest', 'Unscheduled'])
+        self.assertTrue(payment_plan.is_amount('Unscheduled'))
+        self.assertFalse(payment_plan.is_amount('Date'))
+        
+    def test_from_columns(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=1)
+        columns = {'Date': [start_date, start_date + FinancialDelta(months=1)], 'Month': np.array([0, 1]), 'Interest': np.array([150, 75])}
+        
+        # Act
+        payment_plan = PaymentPlan.from_columns(CentsMoney(), columns, ['Interest'])
+        payment_plan.start_of_row()
+        payment_plan.record_amount('Interest', 5)
+        
+        # Assert
+        self.assertEqual(payment_plan.rows, 3)
+        self.assertEqual(list(payment_plan.result['Interest']), [Decimal('1.50'), Decimal('0.75'), Decimal('0.05')])
+        self.assertEqual(payment_plan.column('Month').values.dtype, np.int64)
+        self.assertEqual(payment_plan.column('Date').values[1], start_date + FinancialDelta(months=1))
+        with self.assertRaises(ValueError):
+            PaymentPlan.from_columns(CentsMoney(), {'Month': np.array([0]), 'Interest': np.array([1, 2])})
+        
+    def test_numeric_payment_plan(self):
+        # Arrange
+        scenario = create_scenario()
+        
+        # Act
+        expected = scenario.simulate()
+        instance = scenario.instantiate()
+        actual = instance.create_strategy().calculate_payment_plan(instance.start, instance.finances, instance.wallet, CentsMoney(), numeric=True)
+        
+        # Assert
+        self.assertEqual(list(actual.columns), list(expected.columns))
+        self.assertEqual(actual['Wallet'].dtype, np.int64)
+        self.assertEqual(actual['Month'].dtype, np.int64)
+        self.assertEqual(list(actual['Interest Sum']), [int(value * 100) for value in expected['Interest Sum']])
+
+
+class DisplayTest(ut.TestCase):
+    def test_render_payment_plan(self):
+        # Arrange
+        payment_plan = create_scenario().simulate()
+        years = len({date.year for date in payment_plan['Date']})
+        
+        # Act
+        chunks = list(render_payment_plan(payment_plan, payment_plan))
+        
+        # Assert
+        self.assertEqual(len(chunks), years + 1)
+        self.assertEqual(sum(chunk.count('<th>Annual Summary</th>') for chunk in chunks), years)
+        self.assertIn(f'<th style="font-weight: 600">{format_currency(sum(payment_plan["Interest Sum"]), "EUR", locale="de_DE")}</th>', chunks[-1])
+        self.assertEqual(chunks[-1].count('<th>Δ Grand Summary</th>'), 1)
+
+
+class EventCalendarTest(ut.TestCase):
+    def test_events(self):
+        # Arrange
+        scenario = create_scenario()
+        start_date = scenario.start
+        calendar = EventCalendar(start_date, 36, scenario.mortgages)
+        
+        # Act
+        stable_months = calendar.stable_months(0, MORTGAGE_EVENTS)
+        scenario.mortgages[1].alter_interest_rate(start_date + FinancialDelta(months=20), Percentage(3))
+        
+        # Assert
+        self.assertEqual(stable_months, 36)
+        self.assertEqual(calendar.next_change(0, MORTGAGE_EVENTS), 20)
+        self.assertEqual(calendar.next_change(0, [EventKind.PAYBACK_RATE]), 36)
+        self.assertTrue(calendar.changes_at(20, [EventKind.INTEREST_RATE]))
+        self.assertFalse(calendar.changes_at(21))
+        self.assertEqual({event.name for event in calendar.events_at(0)}, {'Short', 'Long'})
+        self.assertEqual([event.name for event in calendar.events_at(20)], ['Long'])
+
+
+def create_scenario() -> Scenario:
+    start_date = FinancialDate(year=2024, month=1)
+    finances = Finances(0) \
+        .add_income('Salary', start_date, 6_000, FinancialDelta(months=1)) \
+        .add_income('Bonus', start_date + FinancialDelta(months=10), 2_500, FinancialDelta(months=12)) \
+        .add_expense('Living', start_date, 2_100, FinancialDelta(months=1))
+    wallet = Wallet(5_000).add_saving_policy('Reserve', start_date, 10_000)
+    mortgages = [
+        Mortgage('Short', 200_000, Percentage(3.73), Percentage(2), start_date, start_date + FinancialDelta(years=10), RepaymentParameterSet(1_000, Percentage(5), 12)),
+        Mortgage('Long', 100_000, Percentage(4.17), Percentage(1), start_date, start_date + FinancialDelta(years=15), RepaymentParameterSet(500, Percentage(5), 4)),
+    ]
+    return Scenario(start_date, finances, wallet, mortgages, AnnuityFollowUpCreator(Percentage(5), Percentage(1)))
+
+
+def create_fast_forward_scenario(horizon: int = 30 * 12) -> Scenario:
+    # Long stretches of plain annuities which the summary skips, starting in March so they span the turns of the years
+    start_date = FinancialDate(year=2024, month=3)
+    finances = Finances(0) \
+        .add_income('Salary', start_date, 3_500, FinancialDelta(months=1)) \
+        .add_expense('Living', start_date, 2_100, FinancialDelta(months=1))
+    wallet = Wallet(3_000).add_saving_policy('Reserve', start_date, 10_000)
+    mortgages = [
+        Mortgage('Bank', 150_000, Percentage(3.73), Percentage(2), start_date, start_date + FinancialDelta(years=8), RepaymentParameterSet(2_000, Percentage(5), 2)),
+        Mortgage('Family', 40_000, Percentage(0), Percentage(3), start_date + FinancialDelta(months=14)) \
+            .alter_interest_rate(start_date + FinancialDelta(years=5), Percentage(1)),
+    ]
+    return Scenario(start_date, finances, wallet, mortgages, AnnuityFollowUpCreator(Percentage(4.5), Percentage(1)), horizon=horizon)
+
+
+class SimulationSummaryTest(ut.TestCase):
+    def test_summary_matches_payment_plan(self):
+        # Arrange
+        scenario = create_scenario()
+        payment_plan = scenario.simulate()
+        
+        for money in (None, CentsMoney()):
+            # Act
+            summary = scenario.summarize(money=money)
+            
+            # Assert
+            self.assertEqual(summary.total_interest, sum(payment_plan['Interest Sum']))
+            self.assertEqual(summary.total_unscheduled, sum(payment_plan[[column for column in payment_plan.columns if column.endswith(' Unscheduled')]].sum()))
+            self.assertEqual(summary.min_wallet, min(payment_plan['Wallet']))
+            self.assertEqual(summary.payoff_month, len(payment_plan))
+            self.assertEqual(summary.payoff_date, payment_plan['Date'].iloc[-1])
+            self.assertFalse(summary.overextension)
+            
+    def test_summary_fast_forward(self):
+        # Arrange
+        scenario = create_fast_forward_scenario()
+        
+        for money in (None, CentsMoney()):
+            # Act
+            payment_plan = scenario.simulate(money=money)
+            with Instrumentation() as instrumentation:
+                summary = scenario.summarize(money=money)
+            calls = instrumentation.report()['calls']
+            
+            # Assert
+            self.assertEqual(summary.total_interest, sum(payment_plan['Interest Sum']))
+            self.assertEqual(summary.total_unscheduled, sum(payment_plan[[column for column in payment_plan.columns if column.endswith(' Unscheduled')]].sum()))
+            self.assertEqual(summary.min_wallet, min(payment_plan['Wallet']))
+            self.assertEqual(summary.months, len(payment_plan))
+            # Most months are skipped, only a few are simulated one by one
+            self.assertLess(calls['PaybackStrategy._payback'], summary.months // 4)
+            
+    def test_aggregates(self):
+        # Arrange
+        scenario = create_fast_forward_scenario()
+        payment_plan = scenario.simulate()
+        columns = [column for column in payment_plan.columns if column not in ('Date', 'Month', 'Delta')]
+        annual = payment_plan[columns].groupby([date.year for date in payment_plan['Date']]).sum()
+        
+        for money in (None, CentsMoney()):
+            # Act
+            aggregates = scenario.aggregate(money=money)
+            
+            # Assert
+            self.assertEqual(aggregates.years, list(annual.index))
+            self.assertNotIn('Wallet', aggregates.columns)
+            self.assertIn('Family Unscheduled', aggregates.columns)
+            for column in aggregates.columns:
+                self.assertEqual(aggregates.totals[column], sum(payment_plan[column]))
+                self.assertEqual([aggregates.year(year)[column] for year in aggregates.years], list(annual[column]))
+            self.assertEqual(aggregates.summary.total_interest, aggregates.totals['Interest Sum'])
+    
+    def test_horizon(self):
+        # Arrange
+        scenario = create_fast_forward_scenario(horizon=30)
+        document = {'start': '2024-01', 'horizon': 2, 'finances': {'incomes': [{'name': 'Salary', 'when': '2024-01', 'amount': 1_000, 'recurrence': 1}]},
+                    'mortgages': [{'name': 'Bank', 'amount': 100_000, 'interest_rate': 3, 'payback_rate': 2}]}
+        
+        # Act
+        payment_plan = scenario.simulate()
+        summary = scenario.summarize()
+        aggregates = scenario.aggregate()
+        
+        # Assert
+        self.assertEqual(len(payment_plan), 30)
+        self.assertEqual(summary.months, 30)
+        self.assertFalse(summary.paid_off)
+        self.assertEqual(aggregates.years, [2024, 2025, 2026])
+        self.assertEqual(len(ScenarioLoader.build(document).simulate()), 24)
+        with self.assertRaises(ValueError):
+            ScenarioLoader.normalize(dict(document, horizon=0))
+    
+    def test_summary_overextension(self):
+        # Arrange
+        scenario = create_scenario()
+        ParameterSweep.apply(scenario, (Percentage(25), None, None, None))
         
+        # Act
+        summary = scenario.summarize()
+        
+        # Assert
+        self.assertTrue(summary.overextension)
+        self.assertIsNone(summary.payoff_date)
+        self.assertLess(summary.min_wallet, 0)
+
+
+class ScenarioTest(ut.TestCase):
+    def test_shared_definitions(self):
+        # Arrange
+        scenario = create_fast_forward_scenario()
+        expected = scenario.simulate()
+        instance = scenario.instantiate()
+        
+        # Act
+        instance.mortgages[0].alter_interest_rate(scenario.start, Percentage(5))
+        instance.wallet.add_saving_policy('Reserve', scenario.start, 20_000)
+        strategy = instance.create_strategy()
+        altered = strategy.calculate_payment_plan(instance.start, instance.finances, instance.wallet)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            payment_plans = list(executor.map(lambda _: scenario.simulate(), range(4)))
+        
+        # Assert
+        self.assertEqual(scenario.mortgages[0].interest_rates(scenario.start, 1), [Percentage(3.73)])
+        self.assertEqual(scenario.wallet.get_effective_saving_policy_value(scenario.start), 10_000)
+        self.assertEqual(instance.wallet.get_effective_saving_policy_value(scenario.start), 20_000)
+        self.assertEqual(instance.mortgages[0].current_amount, 150_000)
+        self.assertLess(strategy.mortgages[0].current_amount, 150_000)
+        self.assertFalse(altered.equals(expected))
+        for payment_plan in payment_plans:
+            self.assertTrue(payment_plan.equals(expected))
+
+
+class IncrementalSimulationTest(ut.TestCase):
+    def test_resume_from_checkpoint(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=3)
+        for money in (None, CentsMoney()):
+            finances = Finances(0) \
+                .add_income('Salary', start_date, 3_500, FinancialDelta(months=1)) \
+                .add_expense('Living', start_date, 2_100, FinancialDelta(months=1))
+            wallet = Wallet(3_000).add_saving_policy('Reserve', start_date, 10_000)
+            mortgages = [
+                Mortgage('Bank', 150_000, Percentage(3.73), Percentage(2), start_date, start_date + FinancialDelta(years=8), RepaymentParameterSet(2_000, Percentage(5), 2)),
+                Mortgage('Family', 40_000, Percentage(0), Percentage(3), start_date + FinancialDelta(months=14)),
+            ]
+            scenario = Scenario(start_date, finances, wallet, mortgages, AnnuityFollowUpCreator(Percentage(4.5), Percentage(1)))
+            simulation = IncrementalSimulation(scenario, money=money, checkpoint_interval=12)
+            simulation.run()
+            changed_from = start_date + FinancialDelta(months=125)
+            
+            # Act
+            finances.add_expense('Car', changed_from, 1_500)
+            payment_plan = simulation.run(changed_from)
+            
+            # Assert
+            self.assertEqual(simulation.resumed_month, 120)
+            self.assertTrue(payment_plan.equals(scenario.simulate(money=money)))
+            self.assertEqual([checkpoint.month for checkpoint in simulation.checkpoints], list(range(12, len(payment_plan), 12)))
+            self.assertTrue(simulation.run(start_date + FinancialDelta(months=3)).equals(payment_plan))
+            self.assertIsNone(simulation.resumed_month)
+
+
+SCENARIO_TOML = """
+start = "2024-01"
+[finances]
+incomes = [
+    { name = "Salary", when = "2024-01", amount = 6000, recurrence = 1 },
+    { name = "Bonus", when = "2024-11", amount = 2500, recurrence = 12 },
+]
+expenses = [{ name = "Living", when = "2024-01", amount = 2100, recurrence = 1 }]
+[wallet]
+amount = 5000
+saving_policies = [{ name = "Reserve", when = "2024-01", amount = 10000 }]
+[[mortgages]]
+name = "Short"
+amount = 200000
+interest_rate = 3.73
+payback_rate = 2
+valid_from = "2024-01"
+valid_until = "2034-01"
+repayment = { min = 1000, max = "5%", payments_per_year = 12 }
+[[mortgages]]
+name = "Long"
+amount = 100000
+interest_rate = 4.17
+payback_rate = 1
+valid_from = "2024-01"
+valid_until = "2039-01"
+repayment = { min = 500, max = "5%", payments_per_year = 4 }
+interest_rate_changes = [{ when = "2030-01", value = 3.9 }]
+[follow_up]
+policy = "annuity"
+interest_rate = 5
+min_payback_rate = 1
+"""
+
+
+class ScenarioLoaderTest(ut.TestCase):
+    def test_load_matches_python_scenario(self):
+        # Arrange
+        start_date = FinancialDate(year=2024, month=1)
+        finances = Finances(0) \
+            .add_income('Salary', start_date, 6_000, FinancialDelta(months=1)) \
+            .add_income('Bonus', start_date + FinancialDelta(months=10), 2_500, FinancialDelta(months=12)) \
+            .add_expense('Living', start_date, 2_100, FinancialDelta(months=1))
+        wallet = Wallet(5_000).add_saving_policy('Reserve', start_date, 10_000)
+        mortgages = [
+            Mortgage('Short', 200_000, Percentage(Decimal('3.73')), Percentage(2), start_date, start_date + FinancialDelta(years=10), RepaymentParameterSet(1_000, Percentage(5), 12)),
+            Mortgage('Long', 100_000, Percentage(Decimal('4.17')), Percentage(1), start_date, start_date + FinancialDelta(years=15), RepaymentParameterSet(500, Percentage(5), 4)) \
+                .alter_interest_rate(start_date + FinancialDelta(years=6), Percentage(Decimal('3.9'))),
+        ]
+        expected = Scenario(start_date, finances, wallet, mortgages, AnnuityFollowUpCreator(Percentage(5), Percentage(1))).simulate()
+        
+        # Act
+        documents = ScenarioLoader.parse(SCENARIO_TOML, 'toml')
+        scenario = ScenarioLoader.build(documents[0])
+        
+        # Assert
+        self.assertTrue(scenario.simulate().equals(expected))
+        self.assertEqual(scenario.strategy, MinRestDurationPaybackStrategy)
+    
+    def test_canonical_hash(self):
+        # Arrange
+        document = ScenarioLoader.parse(SCENARIO_TOML, 'toml')[0]
+        reordered = ScenarioLoader.parse(ScenarioLoader.canonical(ScenarioLoader.normalize(document)), 'json')[0]
+        reordered['finances']['incomes'].reverse()
+        reordered['mortgages'][0]['amount'] = '200000.00'
+        changed = ScenarioLoader.parse(SCENARIO_TOML.replace('amount = 2100', 'amount = 2200'), 'toml')[0]
+        
+        # Act
+        digest = ScenarioLoader.canonical_hash(document)
+        
+        # Assert
+        self.assertEqual(len(digest), 64)
+        self.assertEqual(ScenarioLoader.canonical_hash(reordered), digest)
+        self.assertNotEqual(ScenarioLoader.canonical_hash(changed), digest)
+    
+    def test_validation(self):
+        # Arrange
+        document = ScenarioLoader.parse(SCENARIO_TOML, 'toml')[0]
+        document['mortgages'][1]['repayment']['payments_per_year'] = -1
+        
+        # Act / Assert
+        with self.assertRaisesRegex(ValueError, r'scenario\.mortgages\[1\]\.repayment\.payments_per_year'):
+            ScenarioLoader.normalize(document)
+        with self.assertRaisesRegex(ValueError, r'scenario\.start'):
+            ScenarioLoader.normalize({'start': '2024-13', 'mortgages': []})
+        with self.assertRaisesRegex(ValueError, r'unknown keys \[\'strategie\'\]'):
+            ScenarioLoader.normalize({'start': '2024-01', 'mortgages': [], 'strategie': 'random'})
+
+
+class BatchRunnerTest(ut.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = pathlib.Path(self._directory.name)
+        (self._path / 'scenarios').mkdir()
+        for index, expense in enumerate((2100, 2400, 2700)):
+            (self._path / 'scenarios' / f'{index}.toml').write_text(SCENARIO_TOML.replace('amount = 2100', f'amount = {expense}'), encoding='utf-8')
+        (self._path / 'scenarios' / 'invalid.json').write_text('{"start": "2024-13", "mortgages": []}', encoding='utf-8')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_run(self):
+        # Arrange
+        output = self._path / 'summary.jsonl'
+        runner = BatchRunner([str(self._path / 'scenarios')], str(output), workers=2)
+        
+        # Act
+        count = runner.run()
+        
+        # Assert
+        rows = {row['Scenario']: row for row in map(json.loads, output.read_text(encoding='utf-8').splitlines())}
+        self.assertEqual(count, 4)
+        self.assertIn('invalid.json[0].start', rows[str(self._path / 'scenarios' / 'invalid.json[0]')]['Error'])
+        summary = ScenarioLoader.load(self._path / 'scenarios' / '0.toml')[0].summarize()
+        row = rows[str(self._path / 'scenarios' / '0.toml[0]')]
+        self.assertEqual(Decimal(row['Total Interest']), summary.total_interest)
+        self.assertEqual(row['Payoff Month'], summary.payoff_month)
+        self.assertIsNone(row['Error'])
+    
+    def test_resume(self):
+        # Arrange
+        output = self._path / 'plan.csv'
+        BatchRunner([str(self._path / 'scenarios')], str(output), workers=1, plan=True).run()
+        expected = output.read_text(encoding='utf-8')
+        lines = expected.splitlines(keepends=True)
+        summaries = [index for index, line in enumerate(lines) if ',summary,' in line]
+        output.write_text(''.join(lines[:summaries[1] + 5]) + lines[summaries[1] + 5][:10], encoding='utf-8')
+        
+        # Act
+        count = BatchRunner([str(self._path / 'scenarios')], str(output), workers=1, plan=True, resume=True).run()
+        
+        # Assert
+        self.assertEqual(count, 2)
+        self.assertEqual(output.read_text(encoding='utf-8'), expected)
+    
+    def test_errors(self):
+        # Arrange
+        (self._path / 'scenarios' / 'binary.json').write_bytes(b'\xff\xfe{}')
+        output = self._path / 'summary.jsonl'
+        
+        # Act
+        count = BatchRunner([str(self._path / 'scenarios')], str(output), workers=1).run()
+        rows = BatchRunner.run_task(('broken', 'hash', {}, None))
+        
+        # Assert
+        errors = {row['Scenario']: row['Error'] for row in map(json.loads, output.read_text(encoding='utf-8').splitlines())}
+        self.assertEqual(count, 5)
+        self.assertTrue(errors[str(self._path / 'scenarios' / 'binary.json')].startswith('UnicodeDecodeError'))
+        self.assertEqual(len(rows), 1)
+        self.assertIsNotNone(rows[0]['Error'])
+
+
+class ResultCacheTest(ut.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._cache = ResultCache(self._directory.name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_payment_plan(self):
+        # Arrange
+        scenario = create_scenario()
+        
+        for money in (None, CentsMoney()):
+            expected = scenario.simulate(money=money)
+            scenario.simulate(money=money, cache=self._cache)
+            instance = scenario.instantiate()
+            
+            # Act
+            payment_plan = instance.create_strategy().calculate_payment_plan(instance.start, instance.finances, instance.wallet, money, cache=self._cache)
+            
+            # Assert
+            self.assertTrue(payment_plan.equals(expected))
+            self.assertEqual(instance.wallet.current_amount, scenario.wallet.current_amount)
+        self.assertEqual(len(list(pathlib.Path(self._directory.name).glob('*.npz'))), 2)
+        
+    def test_key(self):
+        # Arrange
+        scenario = create_scenario()
+        instance = scenario.instantiate()
+        key = lambda instance, strategy=MinRestDurationPaybackStrategy: ResultCache.key('summary', instance.start, instance.finances, instance.wallet,
+                                                                                       instance.mortgages, strategy, CentsMoney(), 360)
+        
+        class UnmarkedPaybackStrategy(PaybackStrategy):
+            def _unscheduled_payments_order(self, mortgages):
+                return mortgages
+        
+        class NextResultCache(ResultCache):
+            version = ResultCache.version + 1
+        
+        # Act
+        digest = key(instance)
+        
+        # Assert
+        self.assertEqual(key(scenario.instantiate()), digest)
+        self.assertNotEqual(key(instance, MinInterestRatePaybackStrategy), digest)
+        self.assertIsNone(key(instance, RandomPaybackStrategy))
+        self.assertIsNone(key(instance, UnmarkedPaybackStrategy))
+        self.assertNotEqual(NextResultCache.key('summary', instance.start, instance.finances, instance.wallet, instance.mortgages,
+                                                MinRestDurationPaybackStrategy, CentsMoney(), 360), digest)
+        scenario.finances.add_expense('Car', scenario.start + FinancialDelta(months=30), 5_000)
+        self.assertNotEqual(key(scenario.instantiate()), digest)
+    
+    def test_sweep_and_eviction(self):
+        # Arrange
+        scenario = create_scenario()
+        sweep = ParameterSweep(scenario, interest_rates=[Percentage(2), Percentage(3), Percentage(4)])
+        expected = sweep.run(processes=1)
+        
+        # Act
+        sweep.run(processes=2, cache=self._cache)
+        result = sweep.run(processes=1, cache=self._cache)
+        
+        # Assert
+        self.assertTrue(result.equals(expected))
+        paths = sorted(pathlib.Path(self._directory.name).glob('*.json'), key=lambda path: path.stat().st_mtime_ns)
+        self.assertEqual(len(paths), 3)
+        ResultCache(self._directory.name, max_bytes=sum(path.stat().st_size for path in paths[1:])).evict()
+        self.assertEqual(sorted(pathlib.Path(self._directory.name).glob('*.json')), sorted(paths[1:]))
+
+
+class BenchmarkTest(ut.TestCase):
+    def test_generate_scenario(self):
+        # Arrange
+        positions, mortgages, years = SCALES['medium']
+        
+        # Act
+        summary = generate_scenario(3, positions, mortgages, years).summarize()
+        
+        # Assert
+        self.assertFalse(summary.overextension)
+        self.assertEqual(generate_scenario(3, positions, mortgages, years).summarize().total_interest, summary.total_interest)
+        self.assertNotEqual(generate_scenario(4, positions, mortgages, years).summarize().total_interest, summary.total_interest)
+
+    def test_generate_scenario_spans_horizon(self):
+        # Arrange
+        scales = [SCALES['small'], SCALES['medium']]
+        
+        # Act
+        summaries = [(years, generate_scenario(3, positions, mortgages, years).summarize()) for positions, mortgages, years in scales]
+        
+        # Assert
+        for years, summary in summaries:
+            self.assertFalse(summary.overextension)
+            self.assertGreater(summary.months, years * 12 * 3 // 4)
+
+    def test_slower_summaries(self):
+        # Arrange
+        timing = lambda median: {'min': median, 'median': median, 'repeat': 1}
+        results = {'calculate_payment_plan[small]': timing(0.2), 'calculate_summary[small]': timing(0.1),
+                   'calculate_payment_plan[large]': timing(1.0), 'calculate_summary[large]': timing(1.5)}
+        
+        # Act
+        messages = slower_summaries(results)
+        
+        # Assert
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(messages[0].startswith('calculate_summary[large]'))
+
+
+class ParameterSweepTest(ut.TestCase):
+    def test_sweep(self):
+        # Arrange
+        scenario = create_scenario()
+        sweep = ParameterSweep(scenario, interest_rates=[Percentage(2), Percentage(25)], payback_rates=[Percentage(2), Percentage(3)],
+                               strategies=[MinRestDurationPaybackStrategy, MinInterestRatePaybackStrategy])
+        
+        # Act
+        result = sweep.run(processes=1)
+        parallel_result = sweep.run(processes=2)
+        
+        # Assert
+        self.assertEqual(len(result), 8)
+        self.assertTrue(result.equals(parallel_result))
+        self.assertEqual(list(result['Overextension']), [False] * 4 + [True] * 4)
+        self.assertTrue(all(0 < month for month in result['Payoff Month'][:4]))
+        instance = ParameterSweep.apply(scenario.instantiate(), (Percentage(2), Percentage(2), None, None))
+        payment_plan = instance.create_strategy(MinRestDurationPaybackStrategy).calculate_payment_plan(instance.start, instance.finances, instance.wallet)
+        self.assertEqual(result['Total Interest'][0], sum(payment_plan['Interest Sum']))
+        self.assertEqual(scenario.mortgages[0].current_amount, 200_000)
+
+
+class PaymentStreamTest(ut.TestCase):
+    def test_stream_matches_payment_plan(self):
+        # Arrange
+        scenario = create_scenario()
+        payment_plan = scenario.simulate()
+        
+        for money in (None, CentsMoney()):
+            # Act
+            records = list(scenario.stream(money=money))
+            
+            # Assert
+            self.assertEqual(len(records), len(payment_plan))
+            self.assertEqual(records[-1].columns, list(payment_plan.columns))
+            for record, (_, row) in zip(records, payment_plan.iterrows()):
+                self.assertEqual({column: row[column] for column in record.columns}, record.as_dict())
+    
+    def test_stop_early(self):
+        # Arrange
+        scenario = create_scenario()
+        scenario.finances.add_expense('Car', scenario.start + FinancialDelta(months=14), 30_000)
+        
+        # Act
+        months = list()
+        with self.assertRaises(Overextension):
+            for record in scenario.stream():
+                months.append(record.month)
+        first_paid = next(record for record in scenario.stream() if record['Short Unscheduled'] != 0)
+        
+        # Assert
+        self.assertEqual(months, list(range(15)))
+        self.assertEqual(first_paid.month, 2)
+        self.assertEqual(first_paid['Short Unscheduled'], Decimal('2542.51'))
+        self.assertEqual(first_paid.date, FinancialDate(year=2024, month=3))
+
+
+class InstrumentationTest(ut.TestCase):
+    def test_report(self):
+        # Arrange
+        scenario = create_scenario()
+        expected = scenario.summarize()
+        original = TemporalValue.get_value
+        
+        # Act
+        with Instrumentation() as instrumentation:
+            summary = scenario.summarize()
+        report = json.loads(instrumentation.to_json())
+        
+        # Assert
+        self.assertIs(TemporalValue.get_value, original)
+        self.assertIsNone(Instrumentation.current())
+        self.assertEqual(summary.total_interest, expected.total_interest)
+        self.assertEqual(report['calls']['PaybackStrategy._simulate'], 1)
+        self.assertEqual(report['calls']['PaybackStrategy._payback'], report['calls']['PaybackStrategy._record_sums'])
+        self.assertEqual(report['calls']['PaybackStrategy._payback'], report['calls']['MinRestDurationPaybackStrategy._unscheduled_payments_order'])
+        self.assertLessEqual(report['seconds']['PaybackStrategy._payback'], report['seconds']['PaybackStrategy._simulate'])
+        with self.assertRaises(ValueError):
+            with Instrumentation():
+                Instrumentation().enable()
+    
+    def test_other_threads(self):
+        # Arrange
+        scenario = create_scenario()
+        
+        # Act
+        with Instrumentation() as instrumentation:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(lambda _: scenario.summarize(), range(2)))
+            scenario.summarize()
+        
+        # Assert
+        self.assertEqual(instrumentation.report()['calls']['PaybackStrategy._simulate'], 1)
+    
+    def test_sweep(self):
+        # Arrange
+        sweep = ParameterSweep(create_scenario(), interest_rates=[Percentage(2), Percentage(3)])
+        instrumentation = Instrumentation()
+        
+        # Act
+        sweep.run(processes=2, instrumentation=instrumentation)
+        report = instrumentation.report()
+        
+        # Assert
+        self.assertEqual(report['calls']['ParameterSweep.run_point'], 2)
+        self.assertEqual(report['calls']['PaybackStrategy._simulate'], 2)
+        self.assertEqual(Instrumentation.aggregate([report, report])['calls']['PaybackStrategy._simulate'], 4)
+        self.assertFalse(instrumentation.enabled)
+
+
+class MonteCarloSimulationTest(ut.TestCase):
+    def test_reproducible_paths(self):
+        # Arrange
+        base = create_scenario()
+        finances = Finances(0) \
+            .add_income('Salary', base.start, 3_600, FinancialDelta(months=1)) \
+            .add_expense('Living', base.start, 2_100, FinancialDelta(months=1))
+        scenario = Scenario(base.start, finances, base.wallet, base.mortgages, base.follow_up_creator)
+        simulation = MonteCarloSimulation(scenario, paths=6, seed=42, volatility=Percentage(1), mean_reversion=Decimal('0.1'))
+        
+        # Act
+        result = simulation.run(processes=1)
+        parallel_result = simulation.run(processes=2, chunksize=2)
+        
+        # Assert
+        self.assertTrue(result.paths.equals(parallel_result.paths))
+        self.assertEqual(list(result.paths['Path']), list(range(6)))
+        self.assertLess(1, len(set(result.paths['Rate 2034-01'])))
+        self.assertLess(1, len(set(result.paths['Total Interest'])))
+        statistics = result.statistics(q=(5, 50, 95))
+        self.assertEqual(list(statistics['Percentile']), [5, 50, 95])
+        self.assertTrue(statistics['Total Interest'].is_monotonic_increasing)
+        self.assertTrue(0 <= result.overextension_probability <= 1)
+        self.assertEqual(scenario.mortgages[0].current_amount, 200_000)
+
+    def test_seeded_random_strategy(self):
+        # Arrange
+        scenario = create_scenario()
+        scenario = Scenario(scenario.start, scenario.finances, scenario.wallet, scenario.mortgages, scenario.follow_up_creator, RandomPaybackStrategy)
+        
+        # Act
+        first = MonteCarloSimulation(scenario, paths=3, seed=7).run(processes=1)
+        second = MonteCarloSimulation(scenario, paths=3, seed=7).run(processes=1)
+        
+        # Assert
+        self.assertTrue(first.paths.equals(second.paths))
+
 
 if __name__ == '__main__':
     ut.main()
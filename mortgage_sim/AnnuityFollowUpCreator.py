@@ -0,0 +1,61 @@
+from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
+from mortgage_sim.TemporalValue import TemporalValue
+from mortgage_sim.Wallet import Wallet
+from mortgage_sim.types import Percentage
+
+
+import typing as ty
+from decimal import Decimal
+
+
+class AnnuityFollowUpCreator(object):
+    def __init__(self, interest_rate: ty.Union[Percentage, TemporalValue[Percentage]], min_payback_rate: Percentage, suffix: str = ' Follow') -> None:
+        self._interest_rate: ty.Union[Percentage, TemporalValue[Percentage]] = interest_rate
+        self._min_payback_rate: Percentage = min_payback_rate
+        self._suffix: str = suffix
+
+    @property
+    def interest_rate(self) -> ty.Union[Percentage, TemporalValue[Percentage]]:
+        return self._interest_rate
+
+    @property
+    def min_payback_rate(self) -> Percentage:
+        return self._min_payback_rate
+    
+    def with_interest_rate(self, interest_rate: ty.Union[Percentage, TemporalValue[Percentage]]) -> 'AnnuityFollowUpCreator':
+        return AnnuityFollowUpCreator(interest_rate, self._min_payback_rate, self._suffix)
+
+    def __call__(self, mortgage: Mortgage, payment_plan: PaymentPlan, wallet: Wallet) -> ty.Optional[Mortgage]:
+        name = f'{mortgage.name}{self._suffix}'
+        
+        # Pay off as much as possible with the current surplus
+        param_set = mortgage.repayment_parameter_set
+        new_start_date = mortgage.valid_until
+        surplus = min(wallet.get_surplus(new_start_date), mortgage.current_amount)
+        
+        payment_plan.record(f'{mortgage.name} Unscheduled', surplus, Decimal(0))
+        current_amount = mortgage.current_amount - surplus
+        wallet -= surplus
+        
+        if current_amount <= Decimal(0):
+            return None
+        
+        # Keep the monthly payment at least as high as before
+        interest_rate = self._interest_rate
+        if isinstance(interest_rate, TemporalValue):
+            interest_rate = interest_rate.get_value(new_start_date)
+        current_monthly_payment = mortgage.monthly_payment_amount
+        new_monthly_interest_value = round(interest_rate.decimal_fraction * current_amount / Decimal(12), 2)
+        new_payback_value = max(0, current_monthly_payment - new_monthly_interest_value) * Decimal(12)
+        new_payback_rate = max(self._min_payback_rate, Percentage(new_payback_value / current_amount * 100))
+        
+        new_param_set = None
+        if param_set is not None:
+            new_param_set = RepaymentParameterSet(param_set.min_value(mortgage.initial_amount), param_set.max_value(mortgage.initial_amount), param_set.payments_per_year)
+        
+        return Mortgage(name, current_amount, interest_rate, new_payback_rate, new_start_date, None, new_param_set)
+
+    def __repr__(self) -> str:
+        return f'<{__name__} interest_rate={self._interest_rate} min_payback_rate={self._min_payback_rate}>'
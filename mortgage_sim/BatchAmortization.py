@@ -0,0 +1,189 @@
+from mortgage_sim.BatchAmortizationResult import BatchAmortizationResult
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
+from mortgage_sim.types import Number, Percentage, as_decimal
+
+
+import numpy as np
+import typing as ty
+from decimal import Decimal, ROUND_HALF_EVEN
+
+
+# Rates are held as integer multiples of 1e-8 so every rounding step can be done in exact int64 arithmetic
+RATE_SCALE = 10 ** 8
+
+RateInput = ty.Union[Percentage, Number]
+ParameterSetInput = ty.Optional[RepaymentParameterSet]
+AmountInput = ty.Union[ty.Sequence[Number], ty.Sequence[ty.Sequence[Number]], np.ndarray]
+
+
+class BatchAmortization(object):
+    def __init__(self, start: FinancialDate, months: int, initial_amounts: ty.Sequence[Number],
+                 interest_rates: ty.Sequence[ty.Union[RateInput, ty.Sequence[RateInput]]],
+                 payback_rates: ty.Sequence[ty.Union[RateInput, ty.Sequence[RateInput]]],
+                 repayment_parameter_sets: ty.Optional[ty.Sequence[ty.Union[ParameterSetInput, ty.Sequence[ParameterSetInput]]]] = None,
+                 wallet_amounts: ty.Optional[ty.Sequence[Number]] = None, balances: ty.Optional[AmountInput] = None,
+                 saving_targets: ty.Optional[AmountInput] = None) -> None:
+        self._start: FinancialDate = start
+        self._months: int = months
+        self._initial_amounts: ty.List[Decimal] = [as_decimal(amount) for amount in initial_amounts]
+        count = len(self._initial_amounts)
+
+        self._initial: np.ndarray = np.array([self._to_cents(amount) for amount in self._initial_amounts], dtype=np.int64)
+        self._interest_rates: np.ndarray = self._to_rate_matrix(interest_rates, count, months)
+        self._payback_rates: np.ndarray = self._to_rate_matrix(payback_rates, count, months)
+
+        parameter_sets = repayment_parameter_sets if repayment_parameter_sets is not None else [None] * count
+        self._has_parameter_set, self._min_values, self._max_values, self._payments_per_year = \
+            self._to_parameter_matrices(parameter_sets, self._initial_amounts, months)
+
+        self._wallet_amounts: np.ndarray = np.array([self._to_cents(amount) for amount in wallet_amounts], dtype=np.int64) \
+            if wallet_amounts is not None else np.zeros(count, dtype=np.int64)
+        self._balances: np.ndarray = self._to_amount_matrix(balances, count, months)
+        self._saving_targets: np.ndarray = self._to_amount_matrix(saving_targets, count, months)
+
+    @classmethod
+    def from_mortgages(cls, start: FinancialDate, months: int, mortgages: ty.Sequence[Mortgage], wallet_amounts: ty.Optional[ty.Sequence[Number]] = None,
+                       balances: ty.Optional[AmountInput] = None, saving_targets: ty.Optional[AmountInput] = None) -> 'BatchAmortization':
+        return cls(start, months, [mortgage.initial_amount for mortgage in mortgages],
+                   [mortgage.interest_rates(start, months) for mortgage in mortgages],
+                   [mortgage.payback_rates(start, months) for mortgage in mortgages],
+                   [mortgage.repayment_parameter_sets(start, months) for mortgage in mortgages],
+                   wallet_amounts, balances, saving_targets)
+
+    @staticmethod
+    def _to_cents(value: Number) -> int:
+        return int((Decimal(value) * 100).to_integral_value(ROUND_HALF_EVEN))
+
+    @staticmethod
+    def _to_rate(value: ty.Optional[RateInput]) -> int:
+        if value is None:
+            return 0
+        return int((as_decimal(value) * RATE_SCALE).to_integral_value(ROUND_HALF_EVEN))
+
+    @classmethod
+    def _to_rate_matrix(cls, rates: ty.Sequence[ty.Union[RateInput, ty.Sequence[RateInput]]], count: int, months: int) -> np.ndarray:
+        if len(rates) != count:
+            raise ValueError(f'Expected {count} rates but got {len(rates)}')
+        matrix = np.empty((count, months), dtype=np.int64)
+        for index, rate in enumerate(rates):
+            if isinstance(rate, (Percentage, Decimal, float, int)):
+                matrix[index, :] = cls._to_rate(rate)
+                continue
+            if len(rate) != months:
+                raise ValueError(f'Expected {months} monthly rates but got {len(rate)}')
+            matrix[index, :] = [cls._to_rate(value) for value in rate]
+        return matrix
+
+    @classmethod
+    def _to_parameter_matrices(cls, parameter_sets: ty.Sequence[ty.Union[ParameterSetInput, ty.Sequence[ParameterSetInput]]], initial_amounts: ty.List[Decimal],
+                               months: int) -> ty.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # Whether there is a parameter set, the min and max value in cents and the payments per year of every mortgage and month
+        count = len(initial_amounts)
+        if len(parameter_sets) != count:
+            raise ValueError(f'Expected {count} repayment parameter sets but got {len(parameter_sets)}')
+        has_parameter_set = np.zeros((count, months), dtype=bool)
+        min_values = np.zeros((count, months), dtype=np.int64)
+        max_values = np.zeros((count, months), dtype=np.int64)
+        payments_per_year = np.zeros((count, months), dtype=np.int64)
+        for index, (parameter_set, amount) in enumerate(zip(parameter_sets, initial_amounts)):
+            monthly_sets = [parameter_set] * months if parameter_set is None or isinstance(parameter_set, RepaymentParameterSet) else parameter_set
+            if len(monthly_sets) != months:
+                raise ValueError(f'Expected {months} monthly repayment parameter sets but got {len(monthly_sets)}')
+            values = dict()
+            for month, monthly_set in enumerate(monthly_sets):
+                if monthly_set is None:
+                    continue
+                value = values.get(id(monthly_set), None)
+                if value is None:
+                    values[id(monthly_set)] = value = (cls._to_cents(monthly_set.min_value(amount)), cls._to_cents(monthly_set.max_value(amount)),
+                                                       monthly_set.payments_per_year)
+                has_parameter_set[index, month] = True
+                min_values[index, month], max_values[index, month], payments_per_year[index, month] = value
+        return has_parameter_set, min_values, max_values, payments_per_year
+
+    @classmethod
+    def _to_amount_matrix(cls, amounts: ty.Optional[AmountInput], count: int, months: int) -> np.ndarray:
+        if amounts is None:
+            return np.zeros((count, months), dtype=np.int64)
+        if isinstance(amounts, np.ndarray) and amounts.dtype == np.int64:
+            return np.broadcast_to(amounts, (count, months))
+        cents = np.array([cls._to_cents(value) for value in np.ravel(np.asarray(amounts, dtype=object))], dtype=np.int64)
+        return np.broadcast_to(cents.reshape(np.shape(amounts)), (count, months))
+
+    @staticmethod
+    def _round_half_even(numerator: np.ndarray, denominator: int) -> np.ndarray:
+        quotient, remainder = np.divmod(numerator, denominator)
+        twice_remainder = 2 * remainder
+        return quotient + ((twice_remainder > denominator) | ((twice_remainder == denominator) & (quotient % 2 == 1)))
+
+    def run(self) -> BatchAmortizationResult:
+        count, months = self._interest_rates.shape
+        divisor = 12 * RATE_SCALE
+
+        interest = np.zeros((count, months), dtype=np.int64)
+        payback = np.zeros((count, months), dtype=np.int64)
+        amount = np.zeros((count, months), dtype=np.int64)
+        unscheduled = np.zeros((count, months), dtype=np.int64)
+        wallet_history = np.zeros((count, months), dtype=np.int64)
+        rows = np.full(count, months, dtype=np.int64)
+        overextension_month = np.full(count, -1, dtype=np.int64)
+
+        current_amount = self._initial.copy()
+        wallet = self._wallet_amounts.copy()
+        unscheduled_sum = np.zeros(count, dtype=np.int64)
+        unscheduled_count = np.zeros(count, dtype=np.int64)
+
+        for month in range(months):
+            calendar_month = (self._start.month - 1 + month) % 12 + 1
+            if calendar_month == 1 and month != 0:
+                unscheduled_sum[:] = 0
+                unscheduled_count[:] = 0
+
+            active = current_amount > 0
+            rows[~active & (rows == months)] = month
+            if not active.any():
+                break
+
+            wallet_history[active, month] = wallet[active]
+            wallet = np.where(active, wallet + self._balances[:, month], wallet)
+
+            # Scheduled payback
+            interest_rate = self._interest_rates[:, month]
+            monthly_amount = self._round_half_even((interest_rate + self._payback_rates[:, month]) * self._initial, divisor)
+            interest_value = self._round_half_even(current_amount * interest_rate, divisor)
+            payback_value = np.minimum(monthly_amount, current_amount + interest_value)
+            next_amount = current_amount + interest_value - payback_value
+            next_amount[next_amount <= 1] = 0
+
+            # The wallet is charged with the payment re-evaluated on the reduced amount
+            charged = np.minimum(monthly_amount, next_amount + self._round_half_even(next_amount * interest_rate, divisor))
+            wallet = np.where(active, wallet - charged, wallet)
+            current_amount = np.where(active, next_amount, current_amount)
+            amount[active, month] = current_amount[active]
+
+            # Unscheduled payments with the parameter sets of the month
+            min_values, max_values = self._min_values[:, month], self._max_values[:, month]
+            surplus = np.maximum(wallet - self._saving_targets[:, month], 0)
+            payments_left = np.maximum(self._payments_per_year[:, month] - unscheduled_count, 0)
+            eligible = active & self._has_parameter_set[:, month] & (min_values <= surplus) & (unscheduled_sum < max_values) & (0 < payments_left)
+            amount_left = np.minimum(max_values - unscheduled_sum, current_amount)
+            possible_amount = np.minimum(surplus, amount_left)
+            possible_rest = amount_left - possible_amount
+            pay_all = (min_values <= possible_rest) | (possible_rest == 0) | (calendar_month == 12) | (payments_left == 1)
+            reduced_amount = possible_amount - min_values
+            execute = eligible & (pay_all | (min_values <= reduced_amount))
+            unscheduled_value = np.where(execute, np.where(pay_all, possible_amount, reduced_amount), 0)
+
+            current_amount -= unscheduled_value
+            unscheduled_sum += unscheduled_value
+            unscheduled_count += execute
+            wallet -= unscheduled_value
+
+            interest[active, month] = interest_value[active]
+            payback[active, month] = payback_value[active]
+            unscheduled[active, month] = unscheduled_value[active]
+            overextension_month[active & (wallet < 0) & (overextension_month < 0)] = month
+
+        return BatchAmortizationResult(self._start, interest, payback, amount, unscheduled, wallet_history, rows, overextension_month)
@@ -0,0 +1,73 @@
+from mortgage_sim.FinancialDate import FinancialDate
+
+
+import numpy as np
+import pandas as pd
+import typing as ty
+from decimal import Decimal
+
+
+class BatchAmortizationResult(object):
+    def __init__(self, start: FinancialDate, interest: np.ndarray, payback: np.ndarray, amount: np.ndarray, unscheduled: np.ndarray,
+                 wallet: np.ndarray, rows: np.ndarray, overextension_month: np.ndarray) -> None:
+        self._start: FinancialDate = start
+        self._interest: np.ndarray = interest
+        self._payback: np.ndarray = payback
+        self._amount: np.ndarray = amount
+        self._unscheduled: np.ndarray = unscheduled
+        self._wallet: np.ndarray = wallet
+        self._rows: np.ndarray = rows
+        self._overextension_month: np.ndarray = overextension_month
+
+    @property
+    def start(self) -> FinancialDate:
+        return self._start
+
+    @property
+    def interest(self) -> np.ndarray:
+        return self._interest
+
+    @property
+    def payback(self) -> np.ndarray:
+        return self._payback
+
+    @property
+    def amount(self) -> np.ndarray:
+        return self._amount
+
+    @property
+    def unscheduled(self) -> np.ndarray:
+        return self._unscheduled
+
+    @property
+    def wallet(self) -> np.ndarray:
+        return self._wallet
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows
+
+    @property
+    def overextension_month(self) -> np.ndarray:
+        return self._overextension_month
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        return self._interest.sum(axis=1)
+
+    @staticmethod
+    def _to_decimals(cents: np.ndarray) -> ty.List[Decimal]:
+        return [Decimal(int(value)).scaleb(-2) for value in cents]
+
+    def payment_plan(self, index: int, name: str) -> pd.DataFrame:
+        rows = int(self._rows[index])
+        return pd.DataFrame({
+            'Wallet': self._to_decimals(self._wallet[index, :rows]),
+            f'{name} Interest': self._to_decimals(self._interest[index, :rows]),
+            f'{name} Payback': self._to_decimals(self._payback[index, :rows]),
+            f'{name} Amount': self._to_decimals(self._amount[index, :rows]),
+            f'{name} Unscheduled': self._to_decimals(self._unscheduled[index, :rows]),
+        })
+
+    def __repr__(self) -> str:
+        return f'<{__name__} start={self._start} scenarios={self._interest.shape[0]} months={self._interest.shape[1]}>'
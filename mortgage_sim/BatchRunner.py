@@ -0,0 +1,264 @@
+from mortgage_sim.CentsMoney import CentsMoney
+from mortgage_sim.DecimalMoney import DecimalMoney
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Money import Money
+from mortgage_sim.Overextension import Overextension
+from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.ScenarioLoader import Document, ScenarioLoader
+
+
+import collections
+import csv
+import json
+import os
+import pathlib
+import sys
+import typing as ty
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from decimal import Decimal
+
+
+Row = ty.Dict[str, ty.Any]
+Task = ty.Tuple[str, ty.Optional[str], ty.Optional[Document], ty.Optional[str]]
+
+
+SUMMARY_FIELDS = ['Scenario', 'Hash', 'Record', 'Months', 'Total Interest', 'Total Unscheduled', 'Min Wallet', 'Payoff Month', 'Payoff Date',
+                  'Overextension', 'Error']
+PLAN_FIELDS = ['Date', 'Month', 'Wallet', 'Income', 'Expense', 'Balance', 'Interest Sum', 'Mortgage Sum', 'Payment Sum']
+SCENARIO_SUFFIXES = ('.json', '.jsonl', '.toml')
+
+
+_worker_money: ty.Optional[Money] = None
+_worker_plan: bool = False
+
+
+def _initialize_worker(cents: bool, plan: bool) -> None:
+    global _worker_money, _worker_plan
+    _worker_money = CentsMoney() if cents else DecimalMoney()
+    _worker_plan = plan
+
+
+def _run_worker(task: Task) -> ty.List[Row]:
+    return BatchRunner.run_task(task, _worker_money, _worker_plan)
+
+
+class BatchRunner(object):
+    # Runs scenario files on worker processes and streams one summary row per scenario to JSON Lines or CSV.
+    # In plan mode the monthly rows of a scenario precede its summary row. A scenario counts as done once its
+    # summary row has been written, so an interrupted output can be resumed.
+    def __init__(self, sources: ty.Sequence[str], output: str = '-', format: ty.Optional[str] = None, workers: ty.Optional[int] = None,
+                 plan: bool = False, cents: bool = False, resume: bool = False) -> None:
+        self._sources: ty.Sequence[str] = sources
+        self._output: str = output
+        self._format: str = format or ('csv' if output.endswith('.csv') else 'jsonl')
+        if self._format not in ('jsonl', 'csv'):
+            raise ValueError(f'Unknown output format \'{self._format}\', expected one of [\'jsonl\', \'csv\']')
+        if resume and output == '-':
+            raise ValueError('Cannot resume an output written to stdout')
+        self._workers: int = workers or os.cpu_count() or 1
+        self._plan: bool = plan
+        self._cents: bool = cents
+        self._resume: bool = resume
+
+    @property
+    def fields(self) -> ty.List[str]:
+        return SUMMARY_FIELDS + PLAN_FIELDS if self._plan else SUMMARY_FIELDS
+
+    @staticmethod
+    def _scenario_files(source: str) -> ty.List[pathlib.Path]:
+        path = pathlib.Path(source)
+        if path.is_dir():
+            return sorted(child for child in path.rglob('*') if child.suffix.lower() in SCENARIO_SUFFIXES)
+        return [path]
+
+    @staticmethod
+    def _tasks_of(label: str, text: str, format: str) -> ty.Iterator[Task]:
+        try:
+            documents = ScenarioLoader.parse(text, format)
+        except ValueError as exception:
+            yield label, None, None, str(exception)
+            return
+        for index, document in enumerate(documents):
+            scenario = f'{label}[{index}]'
+            try:
+                document = ScenarioLoader.normalize(document, scenario)
+            except ValueError as exception:
+                yield scenario, None, None, str(exception)
+                continue
+            yield scenario, ScenarioLoader.canonical_hash(document, normalized=True), document, None
+
+    def tasks(self, stdin: ty.Optional[ty.TextIO] = None) -> ty.Iterator[Task]:
+        # Scenarios are read lazily, '-' reads JSON Lines from stdin one scenario at a time
+        for source in self._sources:
+            if source == '-':
+                for number, line in enumerate(stdin or sys.stdin):
+                    if line.strip():
+                        yield from self._tasks_of(f'stdin:{number + 1}', line, 'jsonl')
+                continue
+            for path in self._scenario_files(source):
+                try:
+                    text = path.read_text(encoding='utf-8')
+                except (OSError, UnicodeDecodeError) as exception:
+                    yield str(path), None, None, f'{type(exception).__name__}: {exception}'
+                    continue
+                yield from self._tasks_of(str(path), text, path.suffix.lstrip('.').lower())
+
+    @staticmethod
+    def _value(value: ty.Any) -> ty.Any:
+        if isinstance(value, FinancialDate):
+            return f'{value.year:04d}-{value.month:02d}'
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    @classmethod
+    def _plan_rows(cls, scenario: str, digest: str, payment_plan: PaymentPlan) -> ty.List[Row]:
+        money = payment_plan.money
+        columns = list()
+        for name in PLAN_FIELDS:
+            values = payment_plan.column(name).values.tolist()
+            columns.append(money.to_decimals(values) if payment_plan.is_amount(name) else values)
+        rows = list()
+        for values in zip(*columns):
+            row = {'Scenario': scenario, 'Hash': digest, 'Record': 'month'}
+            row.update((name, cls._value(value)) for name, value in zip(PLAN_FIELDS, values))
+            rows.append(row)
+        return rows
+
+    @classmethod
+    def run_task(cls, task: Task, money: ty.Optional[Money] = None, plan: bool = False) -> ty.List[Row]:
+        scenario, digest, document, error = task
+        row = {'Scenario': scenario, 'Hash': digest, 'Record': 'summary'}
+        if error is not None:
+            return [dict(row, Error=error)]
+
+        money = money or DecimalMoney()
+        rows = list()
+        try:
+            instance = ScenarioLoader.build(document, normalized=True).instantiate()
+            strategy = instance.create_strategy()
+            if not plan:
+                summary = strategy.calculate_summary(instance.start, instance.finances, instance.wallet, money)
+            else:
+                overextension = False
+                try:
+                    payment_plan = strategy.record_payment_plan(instance.start, instance.finances, instance.wallet, money)
+                except Overextension:
+                    payment_plan, overextension = strategy.payment_plan, True
+                summary = strategy.summarize_payment_plan(instance.start, payment_plan, instance.wallet, overextension)
+                rows = cls._plan_rows(scenario, digest, payment_plan)
+        except Exception as exception:
+            return [dict(row, Error=f'{type(exception).__name__}: {exception}')]
+        row.update({
+            'Months': summary.months,
+            'Total Interest': cls._value(summary.total_interest),
+            'Total Unscheduled': cls._value(summary.total_unscheduled),
+            'Min Wallet': cls._value(summary.min_wallet),
+            'Payoff Month': summary.payoff_month,
+            'Payoff Date': cls._value(summary.payoff_date),
+            'Overextension': summary.overextension,
+            'Error': None,
+        })
+        rows.append(row)
+        return rows
+
+    @staticmethod
+    def _done_key(row: ty.Mapping[str, ty.Any]) -> str:
+        return row.get('Hash', None) or row.get('Scenario', '')
+
+    def _recover(self, path: pathlib.Path) -> ty.Set[str]:
+        # Collects the finished scenarios and cuts off everything after the last summary row,
+        # i.e. a partially written line or the monthly rows of an unfinished scenario
+        done = set()
+        end = 0
+        header = None
+        with path.open('rb') as stream:
+            offset = 0
+            for line in stream:
+                offset += len(line)
+                if not line.endswith(b'\n'):
+                    break
+                text = line.decode('utf-8')
+                if self._format == 'csv':
+                    if header is None:
+                        header = next(csv.reader([text]))
+                        end = offset
+                        continue
+                    row = dict(zip(header, next(csv.reader([text]))))
+                else:
+                    row = json.loads(text)
+                if row.get('Record', None) == 'summary':
+                    done.add(self._done_key(row))
+                    end = offset
+        if self._format == 'csv' and header is not None and header != self.fields:
+            raise ValueError(f'Cannot resume {path}, its columns {header} differ from {self.fields}')
+        with path.open('r+b') as stream:
+            stream.truncate(end)
+        return done
+
+    def _writer(self, stream: ty.TextIO, write_header: bool) -> ty.Callable[[ty.List[Row]], None]:
+        if self._format == 'csv':
+            writer = csv.DictWriter(stream, self.fields, extrasaction='ignore', lineterminator='\n')
+            if write_header:
+                writer.writeheader()
+
+            def write_csv(rows: ty.List[Row]) -> None:
+                writer.writerows(rows)
+                stream.flush()
+            return write_csv
+
+        def write_jsonl(rows: ty.List[Row]) -> None:
+            stream.write(''.join(json.dumps(row, default=str) + '\n' for row in rows))
+            stream.flush()
+        return write_jsonl
+
+    def _results(self, tasks: ty.Iterable[Task]) -> ty.Iterator[ty.List[Row]]:
+        # Yields results as they finish, at most two tasks per worker are pending to bound the memory
+        if self._workers == 1:
+            _initialize_worker(self._cents, self._plan)
+            for task in tasks:
+                yield _run_worker(task)
+            return
+
+        tasks = iter(tasks)
+        with ProcessPoolExecutor(max_workers=self._workers, initializer=_initialize_worker, initargs=(self._cents, self._plan)) as executor:
+            pending: ty.Set[Future] = set()
+            queued = collections.deque()
+            while True:
+                while len(pending) < 2 * self._workers:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    if task[2] is None:
+                        # Invalid scenarios do not need a worker
+                        queued.append(BatchRunner.run_task(task))
+                        continue
+                    pending.add(executor.submit(_run_worker, task))
+                while queued:
+                    yield queued.popleft()
+                if not pending:
+                    return
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+
+    def run(self, stdin: ty.Optional[ty.TextIO] = None, stdout: ty.Optional[ty.TextIO] = None) -> int:
+        # Returns the number of scenarios written
+        done: ty.Set[str] = set()
+        path = pathlib.Path(self._output) if self._output != '-' else None
+        resumed = self._resume and path is not None and path.exists()
+        if resumed:
+            done = self._recover(path)
+        tasks = (task for task in self.tasks(stdin) if self._done_key({'Hash': task[1], 'Scenario': task[0]}) not in done)
+
+        stream = (stdout or sys.stdout) if path is None else path.open('a' if resumed else 'w', encoding='utf-8', newline='')
+        try:
+            write = self._writer(stream, not resumed or stream.tell() == 0)
+            count = 0
+            for rows in self._results(tasks):
+                write(rows)
+                count += 1
+            return count
+        finally:
+            if path is not None:
+                stream.close()
@@ -0,0 +1,34 @@
+from mortgage_sim.FinancialDate import FinancialDate
+
+
+from enum import Enum
+
+
+class EventKind(Enum):
+    INTEREST_RATE = 'Interest Rate'
+    PAYBACK_RATE = 'Payback Rate'
+    REPAYMENT_PARAMETER_SET = 'Repayment Parameter Set'
+    VALID_FROM = 'Valid From'
+    VALID_UNTIL = 'Valid Until'
+
+
+class CalendarEvent(object):
+    def __init__(self, kind: EventKind, name: str, when: FinancialDate) -> None:
+        self._kind: EventKind = kind
+        self._name: str = name
+        self._when: FinancialDate = when
+
+    @property
+    def kind(self) -> EventKind:
+        return self._kind
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def when(self) -> FinancialDate:
+        return self._when
+
+    def __repr__(self) -> str:
+        return f'<{__name__} kind={self._kind.value} name={self._name} when={self._when}>'
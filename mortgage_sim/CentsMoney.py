@@ -0,0 +1,79 @@
+from mortgage_sim.Money import Money
+from mortgage_sim.types import Number, Percentage, as_decimal
+
+
+import numpy as np
+import typing as ty
+from decimal import Decimal, ROUND_HALF_EVEN
+
+
+# A rate is kept as an exact integer ratio (numerator, denominator)
+Rate = ty.Tuple[int, int]
+
+
+class CentsMoney(Money[int]):
+    def __init__(self) -> None:
+        self._rates: ty.Dict[ty.Union[Percentage, Number], Rate] = dict()
+        self._rate_sums: ty.Dict[ty.Tuple[Rate, Rate], Rate] = dict()
+
+    @property
+    def zero(self) -> int:
+        return 0
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.int64)
+
+    def is_negligible(self, amount: int) -> bool:
+        # Mirrors the Decimal check against the float 0.01, which also treats a single cent as negligible
+        return amount <= 1
+
+    def coerce(self, value: Number) -> int:
+        if isinstance(value, int):
+            return value * 100
+        return int((Decimal(value) * 100).to_integral_value(ROUND_HALF_EVEN))
+
+    def to_decimal(self, amount: int) -> Decimal:
+        return Decimal(amount).scaleb(-2)
+
+    def to_decimals(self, amounts: ty.List[int]) -> ty.List[Decimal]:
+        return [Decimal(amount).scaleb(-2) for amount in amounts]
+
+    def to_decimal_array(self, amounts: np.ndarray) -> np.ndarray:
+        # Converted column-wise, every distinct amount once, as columns mostly repeat a few amounts like zero or the salary
+        distinct, positions = np.unique(amounts, return_inverse=True)
+        decimals = np.empty(len(distinct), dtype=object)
+        decimals[:] = self.to_decimals(distinct.tolist())
+        return decimals[positions]
+
+    def to_cents_array(self, amounts: np.ndarray) -> np.ndarray:
+        return amounts
+
+    def round(self, amount: int) -> int:
+        return amount
+
+    def rate(self, value: ty.Union[Percentage, Number]) -> Rate:
+        # Percentages and numbers are hashable values, equal rates share one entry
+        rate = self._rates.get(value, None)
+        if rate is None:
+            rate = as_decimal(value).as_integer_ratio()
+            self._rates[value] = rate
+        return rate
+
+    def add_rates(self, fst: Rate, snd: Rate) -> Rate:
+        key = (fst, snd)
+        rate = self._rate_sums.get(key, None)
+        if rate is None:
+            self._rate_sums[key] = rate = (fst[0] * snd[1] + snd[0] * fst[1], fst[1] * snd[1])
+        return rate
+
+    def scale(self, amount: int, rate: Rate, divisor: int = 1) -> int:
+        denominator = rate[1] * divisor
+        quotient, remainder = divmod(amount * rate[0], denominator)
+        remainder *= 2
+        if remainder > denominator or (remainder == denominator and quotient & 1):
+            return quotient + 1
+        return quotient
+
+    def __repr__(self) -> str:
+        return f'<{__name__}>'
@@ -0,0 +1,52 @@
+from mortgage_sim.Money import Money
+from mortgage_sim.types import Number, Percentage, as_decimal
+
+
+import numpy as np
+import typing as ty
+from decimal import Decimal, ROUND_HALF_EVEN
+
+
+class DecimalMoney(Money[Decimal]):
+    @property
+    def zero(self) -> Decimal:
+        return Decimal(0)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(object)
+
+    def is_negligible(self, amount: Decimal) -> bool:
+        return amount < 0.01
+
+    def coerce(self, value: Number) -> Decimal:
+        return value if isinstance(value, Decimal) else Decimal(value)
+
+    def to_decimal(self, amount: Decimal) -> Decimal:
+        return amount
+
+    def to_decimals(self, amounts: ty.List[Decimal]) -> ty.List[Decimal]:
+        return amounts
+
+    def to_decimal_array(self, amounts: np.ndarray) -> np.ndarray:
+        return amounts
+
+    def to_cents_array(self, amounts: np.ndarray) -> np.ndarray:
+        return np.array([int((Decimal(amount) * 100).to_integral_value(ROUND_HALF_EVEN)) for amount in amounts], dtype=np.int64)
+
+    def round(self, amount: ty.Union[Decimal, int]) -> Decimal:
+        return round(amount, 2)
+
+    def rate(self, value: ty.Union[Percentage, Number]) -> Decimal:
+        return as_decimal(value)
+
+    def add_rates(self, fst: Decimal, snd: Decimal) -> Decimal:
+        return fst + snd
+
+    def scale(self, amount: Decimal, rate: Decimal, divisor: int = 1) -> Decimal:
+        if divisor == 1:
+            return round(amount * rate, 2)
+        return round(amount * rate / Decimal(divisor), 2)
+
+    def __repr__(self) -> str:
+        return f'<{__name__}>'
@@ -0,0 +1,119 @@
+from mortgage_sim.CalendarEvent import CalendarEvent, EventKind
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Mortgage import Mortgage
+
+
+import typing as ty
+
+
+MORTGAGE_EVENTS = frozenset({EventKind.INTEREST_RATE, EventKind.PAYBACK_RATE, EventKind.REPAYMENT_PARAMETER_SET, EventKind.VALID_FROM, EventKind.VALID_UNTIL})
+
+
+class EventCalendar(object):
+    # Merges the change points of the mortgages into one index over the horizon, which the summary fast-forward uses to find
+    # the stretches without rate changes, follow-ups or new mortgages. The finances and the wallet are not part of it, their
+    # monthly values are precomputed by the timeline and the saving targets. The mortgages are referenced, the index is
+    # rebuilt as soon as one of them has been altered or the list has changed.
+    def __init__(self, start: FinancialDate, months: int, mortgages: ty.Optional[ty.List[Mortgage]] = None) -> None:
+        self._start: FinancialDate = start
+        self._months: int = months
+        self._mortgages: ty.List[Mortgage] = mortgages if mortgages is not None else list()
+        self._signature: ty.Optional[ty.Tuple[int, ...]] = None
+        self._events: ty.Optional[ty.List[ty.List[CalendarEvent]]] = None
+        self._next_changes: ty.Dict[ty.Optional[ty.FrozenSet[EventKind]], ty.List[int]] = dict()
+        # Per mortgage the mortgage itself, its revision, its events and the months of its events per kind
+        self._source_events: ty.Dict[int, ty.Tuple[ty.Any, int, ty.List[ty.Tuple[int, CalendarEvent]], ty.Dict[EventKind, ty.List[int]]]] = dict()
+
+    @property
+    def start(self) -> FinancialDate:
+        return self._start
+
+    @property
+    def months(self) -> int:
+        return self._months
+
+    def _current_signature(self) -> ty.Tuple[int, ...]:
+        signature = list()
+        for mortgage in self._mortgages:
+            signature += [id(mortgage), mortgage.revision]
+        return tuple(signature)
+
+    def _refresh(self) -> None:
+        signature = self._current_signature()
+        if signature == self._signature:
+            return
+
+        first = self._start.ordinal
+        last = first + self._months
+        source_events = dict()
+        for source in self._mortgages:
+            # Mortgages which have not been altered keep their events, e.g. the others when a follow-up is added
+            cached = self._source_events.get(id(source), None)
+            if cached is None or cached[0] is not source or cached[1] != source.revision:
+                events = list(source.events(first, last))
+                months_by_kind = dict()
+                for ordinal, event in events:
+                    months_by_kind.setdefault(event.kind, list()).append(ordinal - first)
+                cached = (source, source.revision, events, months_by_kind)
+            source_events[id(source)] = cached
+        self._source_events = source_events
+
+        # The merged events are only built when they are asked for, the next changes only need the months per kind
+        self._events = None
+        self._next_changes = dict()
+        self._signature = signature
+
+    def _merged_events(self) -> ty.List[ty.List[CalendarEvent]]:
+        if self._events is None:
+            first = self._start.ordinal
+            events = [list() for _ in range(self._months)]
+            for _, _, source_events, _ in self._source_events.values():
+                for ordinal, event in source_events:
+                    events[ordinal - first].append(event)
+            self._events = events
+        return self._events
+
+    def _next_change_list(self, kinds: ty.Optional[ty.FrozenSet[EventKind]]) -> ty.List[int]:
+        next_changes = self._next_changes.get(kinds, None)
+        if next_changes is None:
+            has_change = [False] * self._months
+            for _, _, _, months_by_kind in self._source_events.values():
+                for kind, months in months_by_kind.items():
+                    if kinds is None or kind in kinds:
+                        for month in months:
+                            has_change[month] = True
+            # next_changes[month] is the first month after month with an event of one of the kinds
+            next_changes = [self._months] * (self._months + 1)
+            for month in range(self._months - 1, 0, -1):
+                next_changes[month - 1] = month if has_change[month] else next_changes[month]
+            self._next_changes[kinds] = next_changes
+        return next_changes
+
+    def events_at(self, month: int) -> ty.List[CalendarEvent]:
+        self._refresh()
+        return self._merged_events()[month]
+
+    def changes_at(self, month: int, kinds: ty.Optional[ty.Iterable[EventKind]] = None) -> bool:
+        kinds = frozenset(kinds) if kinds is not None else None
+        return any(kinds is None or event.kind in kinds for event in self.events_at(month))
+
+    def next_change(self, month: int, kinds: ty.Optional[ty.Iterable[EventKind]] = None) -> int:
+        self._refresh()
+        return self._next_change_list(frozenset(kinds) if kinds is not None else None)[month]
+
+    def stable_months(self, month: int, kinds: ty.Optional[ty.Iterable[EventKind]] = None) -> int:
+        return self.next_change(month, kinds) - month
+
+    def index(self, when: FinancialDate) -> int:
+        month = when.ordinal - self._start.ordinal
+        if month < 0 or self._months <= month:
+            raise ValueError(f'{when} is outside of the calendar starting at {self._start} spanning {self._months} months')
+        return month
+
+    def __iter__(self) -> ty.Iterator[CalendarEvent]:
+        self._refresh()
+        for events in self._merged_events():
+            yield from events
+
+    def __repr__(self) -> str:
+        return f'<{__name__} start={self._start} months={self._months}>'
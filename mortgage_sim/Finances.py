@@ -2,10 +2,15 @@ from decimal import Decimal
 import typing as ty
 from mortgage_sim.FinancialDate import FinancialDate
 from mortgage_sim.FinancialDelta import FinancialDelta
+from mortgage_sim.DecimalMoney import DecimalMoney
+from mortgage_sim.Money import Money
+from mortgage_sim.FinancesSnapshot import FinancesSnapshot
+from mortgage_sim.FinancesTimeline import FinancesTimeline, PositionTimeline
 
 from mortgage_sim.TemporalCollection import TemporalCollection
 from mortgage_sim.types import Number
 from mortgage_sim.FinancialPosition import FinancialPosition
+from mortgage_sim.PositionIndex import PositionIndex
 
 
 class Finances(object):
@@ -13,12 +18,18 @@ class Finances(object):
         self.current_wallet: Decimal = Decimal(current_wallet)
         self._incomes: TemporalCollection[FinancialPosition] = TemporalCollection[FinancialPosition]()
         self._expenses: TemporalCollection[FinancialPosition] = TemporalCollection[FinancialPosition]()
+        self._income_index: PositionIndex = PositionIndex(self._incomes)
+        self._expense_index: PositionIndex = PositionIndex(self._expenses)
     
     def add_income(self, name: str, when: FinancialDate, amount: Number, recurrence: ty.Optional[FinancialDelta] = None) -> 'Finances':
         position = FinancialPosition(name, when, amount, recurrence)
         self._incomes.set_value(name, when, position)
         return self
     
+    def add_incomes(self, positions: ty.Iterable[FinancialPosition], removals: ty.Optional[ty.Iterable[ty.Tuple[str, FinancialDate]]] = None) -> 'Finances':
+        self._add_positions(self._incomes, positions, removals)
+        return self
+    
     def remove_income(self, name: str, when: FinancialDate) -> 'Finances':
         self._incomes.set_value(name, when, None)
         return self
@@ -28,32 +39,29 @@ class Finances(object):
         self._expenses.set_value(name, when, position)
         return self
     
+    def add_expenses(self, positions: ty.Iterable[FinancialPosition], removals: ty.Optional[ty.Iterable[ty.Tuple[str, FinancialDate]]] = None) -> 'Finances':
+        self._add_positions(self._expenses, positions, removals)
+        return self
+    
     def remove_expense(self, name: str, when: FinancialDate) -> 'Finances':
         self._expenses.set_value(name, when, None)
         return self
     
     @staticmethod
-    def _is_last_month_entry(entry: FinancialPosition, when: FinancialDate):
-        return entry.when <= when < entry.when + FinancialDelta(months=1)
+    def _add_positions(collection: TemporalCollection[FinancialPosition], positions: ty.Iterable[FinancialPosition],
+                       removals: ty.Optional[ty.Iterable[ty.Tuple[str, FinancialDate]]] = None) -> None:
+        items = [(position.name, position.when, position) for position in positions]
+        items += [(name, when, None) for name, when in removals or ()]
+        collection.set_values(items)
     
-    @staticmethod
-    def _is_current_entry(entry: FinancialPosition, when: FinancialDate):
-        delta = entry.when - when
-        if entry.recurrence.months == 0:
-            return False
-        return entry.when <= when and delta.months % entry.recurrence.months == 0
-        
-    @classmethod
-    def _is_valid_entry(cls, entry: FinancialPosition, when: FinancialDate):
-        if entry.recurrence is None:
-            return cls._is_last_month_entry(entry, when)
-        return cls._is_current_entry(entry, when)
-        
-    def get_effective_incomes(self, when: FinancialDate) -> ty.Dict[str, Decimal]:
-        return [entry for _, entry in self._incomes.values(when) if entry is not None and self._is_valid_entry(entry, when)]
+    def get_effective_incomes(self, when: FinancialDate) -> ty.List[FinancialPosition]:
+        return self._income_index.positions_at(when.ordinal)
     
-    def get_effective_expenses(self, when: FinancialDate) -> ty.Dict[str, Decimal]:
-        return [entry for _, entry in self._expenses.values(when) if self._is_valid_entry(entry, when)]
+    def get_effective_expenses(self, when: FinancialDate) -> ty.List[FinancialPosition]:
+        return self._expense_index.positions_at(when.ordinal)
+    
+    def snapshot(self, when: FinancialDate) -> FinancesSnapshot:
+        return FinancesSnapshot(when, self.get_effective_incomes(when), self.get_effective_expenses(when))
     
     def get_effective_income_value(self, when: FinancialDate) -> Decimal:
         return round(sum(income.amount for income in self.get_effective_incomes(when)), 2)
@@ -62,7 +70,42 @@ class Finances(object):
         return round(sum(expense.amount for expense in self.get_effective_expenses(when)), 2)
     
     def get_effective_balance(self, when: FinancialDate) -> Decimal:
-        total_income = self.get_effective_income_value(when)
-        total_expense = self.get_effective_expense_value(when)
-        return round(total_income - total_expense, 2)
+        return self.snapshot(when).balance
+
+    @staticmethod
+    def _active_months(position: FinancialPosition, first: int, last: int, offset: int) -> range:
+        if position.recurrence is None:
+            return range(offset, offset + 1) if first <= offset < last else range(0)
+        period = abs(position.recurrence.months)
+        if period == 0:
+            return range(0)
+        begin = max(first, offset)
+        begin += (offset - begin) % period
+        return range(begin, last, period)
 
+    @classmethod
+    def _timeline_of(cls, collection: TemporalCollection[FinancialPosition], start: FinancialDate, months: int, money: Money) -> ty.Tuple[PositionTimeline, ty.List[ty.Any]]:
+        positions = dict()
+        origin = start.ordinal
+        # Summed up in insertion order while the months are filled in, to match the per month evaluation
+        totals = [0] * months
+        for temporal_value in collection.temporal_values():
+            values = [None] * months
+            changes = list(temporal_value.ordinal_items())
+            for index, (key, position) in enumerate(changes):
+                if position is None:
+                    continue
+                first = max(key - origin, 0)
+                last = min(changes[index + 1][0] - origin, months) if index + 1 < len(changes) else months
+                amount = money.coerce(position.amount)
+                for month in cls._active_months(position, first, last, position.when.ordinal - origin):
+                    values[month] = position
+                    totals[month] += amount
+            positions[temporal_value.name] = values
+        return positions, [money.round(total) for total in totals]
+    
+    def timeline(self, start: FinancialDate, months: int, money: ty.Optional[Money] = None) -> FinancesTimeline:
+        money = money or DecimalMoney()
+        incomes, income = self._timeline_of(self._incomes, start, months, money)
+        expenses, expense = self._timeline_of(self._expenses, start, months, money)
+        return FinancesTimeline(start, months, incomes, expenses, income, expense, money)
@@ -0,0 +1,44 @@
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.FinancialPosition import FinancialPosition
+
+
+import typing as ty
+from decimal import Decimal
+
+
+class FinancesSnapshot(object):
+    def __init__(self, when: FinancialDate, incomes: ty.List[FinancialPosition], expenses: ty.List[FinancialPosition],
+                 income: ty.Optional[Decimal] = None, expense: ty.Optional[Decimal] = None) -> None:
+        self._when: FinancialDate = when
+        self._incomes: ty.List[FinancialPosition] = incomes
+        self._expenses: ty.List[FinancialPosition] = expenses
+        self._income: Decimal = income if income is not None else round(sum(income.amount for income in incomes), 2)
+        self._expense: Decimal = expense if expense is not None else round(sum(expense.amount for expense in expenses), 2)
+        self._balance: Decimal = round(self._income - self._expense, 2)
+
+    @property
+    def when(self) -> FinancialDate:
+        return self._when
+
+    @property
+    def incomes(self) -> ty.List[FinancialPosition]:
+        return self._incomes
+
+    @property
+    def expenses(self) -> ty.List[FinancialPosition]:
+        return self._expenses
+
+    @property
+    def income(self) -> Decimal:
+        return self._income
+
+    @property
+    def expense(self) -> Decimal:
+        return self._expense
+
+    @property
+    def balance(self) -> Decimal:
+        return self._balance
+
+    def __repr__(self) -> str:
+        return f'<{__name__} when={self._when} income={self._income} expense={self._expense} balance={self._balance}>'
@@ -0,0 +1,84 @@
+from mortgage_sim.FinancesSnapshot import FinancesSnapshot
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.FinancialDelta import FinancialDelta
+from mortgage_sim.FinancialPosition import FinancialPosition
+from mortgage_sim.Money import Money
+
+
+import typing as ty
+
+
+PositionTimeline = ty.Dict[str, ty.List[ty.Optional[FinancialPosition]]]
+
+
+class FinancesTimeline(object):
+    def __init__(self, start: FinancialDate, months: int, incomes: PositionTimeline, expenses: PositionTimeline,
+                 income: ty.List[ty.Any], expense: ty.List[ty.Any], money: Money) -> None:
+        self._start: FinancialDate = start
+        self._months: int = months
+        self._income_positions: PositionTimeline = incomes
+        self._expense_positions: PositionTimeline = expenses
+        self._income: ty.List[ty.Any] = income
+        self._expense: ty.List[ty.Any] = expense
+        self._balance: ty.List[ty.Any] = [money.round(income[month] - expense[month]) for month in range(months)]
+        self._money: Money = money
+
+    def _amounts(self, positions: PositionTimeline) -> ty.Dict[str, ty.List[ty.Any]]:
+        zero = self._money.zero
+        amounts = dict()
+        for name, values in positions.items():
+            amount = {id(position): self._money.coerce(position.amount) for position in values if position is not None}
+            amounts[name] = [amount[id(position)] if position is not None else zero for position in values]
+        return amounts
+
+    @staticmethod
+    def _active(positions: PositionTimeline, month: int) -> ty.List[FinancialPosition]:
+        return [values[month] for values in positions.values() if values[month] is not None]
+
+    @property
+    def money(self) -> Money:
+        return self._money
+
+    @property
+    def start(self) -> FinancialDate:
+        return self._start
+
+    @property
+    def months(self) -> int:
+        return self._months
+
+    @property
+    def incomes(self) -> ty.Dict[str, ty.List[ty.Any]]:
+        return self._amounts(self._income_positions)
+
+    @property
+    def expenses(self) -> ty.Dict[str, ty.List[ty.Any]]:
+        return self._amounts(self._expense_positions)
+
+    @property
+    def income(self) -> ty.List[ty.Any]:
+        return self._income
+
+    @property
+    def expense(self) -> ty.List[ty.Any]:
+        return self._expense
+
+    @property
+    def balance(self) -> ty.List[ty.Any]:
+        return self._balance
+
+    def index(self, when: FinancialDate) -> int:
+        month = (when - self._start).months
+        if month < 0 or self._months <= month:
+            raise ValueError(f'{when} is outside of the timeline starting at {self._start} spanning {self._months} months')
+        return month
+
+    def date(self, month: int) -> FinancialDate:
+        return self._start + FinancialDelta(months=month)
+
+    def snapshot(self, month: int) -> FinancesSnapshot:
+        return FinancesSnapshot(self.date(month), self._active(self._income_positions, month), self._active(self._expense_positions, month),
+                                self._income[month], self._expense[month])
+
+    def __repr__(self) -> str:
+        return f'<{__name__} start={self._start} months={self._months}>'
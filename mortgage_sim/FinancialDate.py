@@ -4,9 +4,35 @@ import typing as ty
 
 
 class FinancialDate(object):
-    def __init__(self, year: int, month: int) -> None:
-        self._year: int = year
-        self._month: int = month
+    # Immutable and interned by month ordinal, equal dates are the same object and can serve as dict keys
+    __slots__ = ('_year', '_month', '_ordinal')
+
+    _interned: ty.Dict[int, 'FinancialDate'] = dict()
+
+    def __new__(cls, year: int, month: int) -> 'FinancialDate':
+        if not 1 <= month <= 12:
+            raise ValueError(f'Month {month} is not within 1 to 12')
+        ordinal = year * 12 + month - 1
+        date = cls._interned.get(ordinal, None)
+        if date is None:
+            date = cls._create(year, month, ordinal)
+        return date
+
+    @classmethod
+    def _create(cls, year: int, month: int, ordinal: int) -> 'FinancialDate':
+        date = object.__new__(cls)
+        object.__setattr__(date, '_year', year)
+        object.__setattr__(date, '_month', month)
+        object.__setattr__(date, '_ordinal', ordinal)
+        return cls._interned.setdefault(ordinal, date)
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> 'FinancialDate':
+        date = cls._interned.get(ordinal, None)
+        if date is None:
+            year, month = divmod(ordinal, 12)
+            date = cls._create(year, month + 1, ordinal)
+        return date
         
     @property
     def year(self) -> int:
@@ -16,51 +42,60 @@ class FinancialDate(object):
     def month(self) -> int:
         return self._month
         
+    @property
+    def ordinal(self) -> int:
+        return self._ordinal
+
+    def __setattr__(self, name: str, value: ty.Any) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __reduce__(self) -> ty.Tuple[ty.Any, ...]:
+        # Unpickled dates are interned again
+        return FinancialDate.from_ordinal, (self._ordinal,)
+
+    def __copy__(self) -> 'FinancialDate':
+        return self
+
+    def __deepcopy__(self, memo: ty.Dict[int, ty.Any]) -> 'FinancialDate':
+        return self
+
+    @staticmethod
+    def _ordinal_of(other: 'FinancialDate', action: str) -> int:
+        if not isinstance(other, FinancialDate):
+            raise ValueError(f'Cannot {action} {other.__class__.__name__} to {__class__.__name__}')
+        return other._ordinal
+        
     def __add__(self, other: FinancialDelta) -> 'FinancialDate':
         if not isinstance(other, FinancialDelta):
             raise ValueError(f'Cannot add {other.__class__.__name__} to {__class__.__name__}')
-        extra_years, month = divmod(self._month + other.months - 1, 12)
-        return FinancialDate(year=self._year + extra_years, month=month +1)
+        return FinancialDate.from_ordinal(self._ordinal + other.months)
 
     def __sub__(self, other: 'FinancialDate') -> FinancialDelta:
-        if not isinstance(other, FinancialDate):
-            raise ValueError(f'Cannot subtract {other.__class__.__name__} to {__class__.__name__}')
-        months = self._month - other._month
-        months += (self._year - other._year) * 12
-        return FinancialDelta(months=months)
+        return FinancialDelta(months=self._ordinal - self._ordinal_of(other, 'subtract'))
     
     def __lt__(self, other: 'FinancialDate') -> bool:
-        if not isinstance(other, FinancialDate):
-            raise ValueError(f'Cannot compare {other.__class__.__name__} to {__class__.__name__}')
-        if self._year == other._year:
-            return self._month < other._month
-        return self._year < other._year
+        return self._ordinal < self._ordinal_of(other, 'compare')
 
     def __le__(self, other: 'FinancialDate') -> bool:
-        if not isinstance(other, FinancialDate):
-            raise ValueError(f'Cannot compare {other.__class__.__name__} to {__class__.__name__}')
-        if self._year == other._year:
-            return self._month <= other._month
-        return self._year <= other._year
+        return self._ordinal <= self._ordinal_of(other, 'compare')
 
     def __gt__(self, other: 'FinancialDate') -> bool:
-        if not isinstance(other, FinancialDate):
-            raise ValueError(f'Cannot compare {other.__class__.__name__} to {__class__.__name__}')
-        if self._year == other._year:
-            return other._month < self._month
-        return other._year < self._year
+        return self._ordinal > self._ordinal_of(other, 'compare')
 
     def __ge__(self, other: 'FinancialDate') -> bool:
-        if not isinstance(other, FinancialDate):
-            raise ValueError(f'Cannot compare {other.__class__.__name__} to {__class__.__name__}')
-        if self._year == other._year:
-            return other._month <= self._month
-        return other._year <= self._year
+        return self._ordinal >= self._ordinal_of(other, 'compare')
 
-    def __eq__(self, other: 'FinancialDate') -> bool:
+    def __eq__(self, other: ty.Any) -> bool:
+        # Unlike the ordering, equality with other types is False, so dates can be mixed with other dict keys
         if not isinstance(other, FinancialDate):
-            raise ValueError(f'Cannot compare {other.__class__.__name__} to {__class__.__name__}')
-        return self._year == other._year and self._month == other._month
+            return NotImplemented
+        return self._ordinal == other._ordinal
+
+    def __hash__(self) -> int:
+        return hash(self._ordinal)
     
     def __repr__(self) -> str:
-        return f'{self.year:02d}\'{self.month:02d}\'\''
\ No newline at end of file
+        return f'{self.year:02d}\'{self.month:02d}\'\''
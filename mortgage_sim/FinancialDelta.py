@@ -2,13 +2,39 @@ import typing as ty
 
 
 class FinancialDelta(object):
-    def __init__(self, months: ty.Optional[int] = None, years: ty.Optional[int] = None) -> None:
-        self._months: ty.Optional[int] = months if months else 0 + (years * 12 if years else 0)
+    # Immutable and interned by months, a delta equals and hashes like its number of months
+    __slots__ = ('_months',)
+
+    _interned: ty.Dict[int, 'FinancialDelta'] = dict()
+
+    def __new__(cls, months: ty.Optional[int] = None, years: ty.Optional[int] = None) -> 'FinancialDelta':
+        months = (months or 0) + (years * 12 if years else 0)
+        delta = cls._interned.get(months, None)
+        if delta is None:
+            delta = object.__new__(cls)
+            object.__setattr__(delta, '_months', months)
+            delta = cls._interned.setdefault(months, delta)
+        return delta
 
     @property
     def months(self):
         return self._months
 
+    def __setattr__(self, name: str, value: ty.Any) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __reduce__(self) -> ty.Tuple[ty.Any, ...]:
+        return FinancialDelta, (self._months,)
+
+    def __copy__(self) -> 'FinancialDelta':
+        return self
+
+    def __deepcopy__(self, memo: ty.Dict[int, ty.Any]) -> 'FinancialDelta':
+        return self
+
     @staticmethod
     def _get_months(other: ty.Union['FinancialDelta', int]) -> int:
         if isinstance(other, int):
@@ -30,9 +56,13 @@ class FinancialDelta(object):
     def __ge__(self, other: ty.Union['FinancialDelta', int]) -> bool:
         return self._get_months(other) <= self._months
 
-    def __eq__(self, other: ty.Union['FinancialDelta', int]) -> bool:
+    def __eq__(self, other: ty.Any) -> bool:
+        if not isinstance(other, (FinancialDelta, int)):
+            return NotImplemented
         return self._months == self._get_months(other)
+
+    def __hash__(self) -> int:
+        return hash(self._months)
     
     def __repr__(self) -> str:
         return f'{self.months}\'\''
-
@@ -8,11 +8,53 @@ from decimal import Decimal
 
 
 class FinancialPosition(object):
+    # Immutable value, positions with the same name, date, amount and recurrence are equal
+    __slots__ = ('_name', '_when', '_amount', '_recurrence')
+
     def __init__(self, name: str, when: FinancialDate, amount: ty.Optional[Number] = None, recurrence: ty.Optional[FinancialDelta] = None) -> None:
-        self.name: str = name
-        self.when: FinancialDate = when
-        self.amount: Decimal = Decimal(amount) if amount else Decimal(0)
-        self.recurrence: ty.Optional[FinancialDelta] = recurrence
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_when', when)
+        object.__setattr__(self, '_amount', Decimal(amount) if amount else Decimal(0))
+        object.__setattr__(self, '_recurrence', recurrence)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def when(self) -> FinancialDate:
+        return self._when
+
+    @property
+    def amount(self) -> Decimal:
+        return self._amount
+
+    @property
+    def recurrence(self) -> ty.Optional[FinancialDelta]:
+        return self._recurrence
+
+    def __setattr__(self, name: str, value: ty.Any) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __reduce__(self) -> ty.Tuple[ty.Any, ...]:
+        return FinancialPosition, (self._name, self._when, self._amount, self._recurrence)
+
+    def __copy__(self) -> 'FinancialPosition':
+        return self
+
+    def __deepcopy__(self, memo: ty.Dict[int, ty.Any]) -> 'FinancialPosition':
+        return self
+
+    def __eq__(self, other: ty.Any) -> bool:
+        if not isinstance(other, FinancialPosition):
+            return NotImplemented
+        return (self._name, self._when, self._amount, self._recurrence) == (other._name, other._when, other._amount, other._recurrence)
+
+    def __hash__(self) -> int:
+        return hash((self._name, self._when, self._amount, self._recurrence))
         
     def __repr__(self) -> str:
         return f'<{__name__} name={self.name} when={self.when} amount={self.amount} recurrence={self.recurrence}>'
@@ -0,0 +1,81 @@
+from mortgage_sim.DecimalMoney import DecimalMoney
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Money import Money
+from mortgage_sim.PaybackStrategy import PaybackStrategy
+from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.Scenario import Scenario
+from mortgage_sim.SimulationCheckpoint import SimulationCheckpoint
+
+
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    import pandas as pd
+
+
+class IncrementalSimulation(object):
+    # Simulates a scenario repeatedly. After the scenario has been altered from a date onwards, the simulation resumes
+    # from the latest checkpoint before that date and reuses the payment plan up to it.
+    def __init__(self, scenario: Scenario, strategy: ty.Optional[ty.Type[PaybackStrategy]] = None, money: ty.Optional[Money] = None,
+                 checkpoint_interval: int = 12) -> None:
+        if checkpoint_interval < 1:
+            raise ValueError(f'checkpoint_interval must be positive but is {checkpoint_interval}')
+        self._scenario: Scenario = scenario
+        self._strategy: ty.Optional[ty.Type[PaybackStrategy]] = strategy
+        self._money: Money = money or DecimalMoney()
+        self._checkpoint_interval: int = checkpoint_interval
+        self._payment_plan: ty.Optional[PaymentPlan] = None
+        self._checkpoints: ty.List[SimulationCheckpoint] = list()
+        self._resumed_month: ty.Optional[int] = None
+
+    @property
+    def scenario(self) -> Scenario:
+        return self._scenario
+
+    @property
+    def checkpoints(self) -> ty.List[SimulationCheckpoint]:
+        return self._checkpoints
+
+    @property
+    def resumed_month(self) -> ty.Optional[int]:
+        # Month the last run resumed from, None if it has been simulated from the start
+        return self._resumed_month
+
+    def latest_checkpoint(self, changed_from: FinancialDate) -> ty.Optional[SimulationCheckpoint]:
+        # A checkpoint is valid if it has been taken before the change could take effect
+        valid_checkpoints = [checkpoint for checkpoint in self._checkpoints if checkpoint.when <= changed_from]
+        return valid_checkpoints[-1] if valid_checkpoints else None
+
+    def run(self, changed_from: ty.Optional[FinancialDate] = None) -> 'pd.DataFrame':
+        # changed_from is the earliest date affected by the alterations of the scenario since the last run
+        instance = self._scenario.instantiate()
+        strategy = instance.create_strategy(self._strategy)
+        checkpoint = self.latest_checkpoint(changed_from) if changed_from is not None and self._payment_plan is not None else None
+        if checkpoint is None:
+            self._resumed_month = None
+            result = strategy.calculate_payment_plan(instance.start, instance.finances, instance.wallet, self._money,
+                                                     checkpoint_interval=self._checkpoint_interval)
+            self._checkpoints = list(strategy.checkpoints)
+        else:
+            self._resumed_month = checkpoint.month
+            strategy.restore(checkpoint, instance.wallet)
+            self._register_follow_up_creator(instance, strategy)
+            result = strategy.resume_payment_plan(checkpoint, self._payment_plan, instance.start, instance.finances, instance.wallet,
+                                                  checkpoint_interval=self._checkpoint_interval)
+            self._checkpoints = [previous for previous in self._checkpoints if previous.month < checkpoint.month] + strategy.checkpoints
+        self._payment_plan = strategy.payment_plan
+        return result
+
+    @staticmethod
+    def _register_follow_up_creator(instance: Scenario, strategy: PaybackStrategy) -> None:
+        # Follow-ups taken over from the checkpoint still refer to the wallet of the run they have been created in
+        follow_up_creator = instance.follow_up_creator
+        if follow_up_creator is None:
+            return
+        names = {mortgage.name for mortgage in instance.mortgages}
+        for mortgage in strategy.mortgages:
+            if mortgage.name not in names:
+                mortgage.register_follow_up_creator(Scenario.BoundFollowUpCreator(follow_up_creator, instance.wallet))
+
+    def __repr__(self) -> str:
+        return f'<{__name__} scenario={self._scenario} checkpoints={len(self._checkpoints)}>'
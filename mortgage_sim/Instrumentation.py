@@ -0,0 +1,165 @@
+from mortgage_sim.Finances import Finances
+from mortgage_sim.PaybackStrategy import PaybackStrategy
+from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.TemporalValue import TemporalValue
+from mortgage_sim.Wallet import Wallet
+
+
+import collections
+import contextlib
+import functools
+import json
+import threading
+import time
+import typing as ty
+
+
+Report = ty.Dict[str, ty.Dict[str, ty.Any]]
+
+
+# Methods which are counted and timed, overrides in subclasses are instrumented as well
+PROBES: ty.List[ty.Tuple[type, str]] = [
+    (PaybackStrategy, '_simulate'),
+    (PaybackStrategy, '_fast_forward'),
+    (PaybackStrategy, '_payback'),
+    (PaybackStrategy, '_replace_expired_mortgages'),
+    (PaybackStrategy, '_record_sums'),
+    (PaybackStrategy, '_execute_paybacks'),
+    (PaybackStrategy, '_execute_unscheduled_payments'),
+    (PaybackStrategy, '_unscheduled_payments_order'),
+    (Finances, 'get_effective_incomes'),
+    (Finances, 'get_effective_expenses'),
+    (Finances, 'snapshot'),
+    (Finances, 'timeline'),
+    (Wallet, 'get_surplus'),
+    (Wallet, '_surplus'),
+    (TemporalValue, 'get_value'),
+    (TemporalValue, 'get_value_at'),
+    (PaymentPlan, 'record'),
+    (PaymentPlan, 'record_amount'),
+    (PaymentPlan.Column, 'record'),
+]
+
+
+class Instrumentation(object):
+    # Counts the calls of the probed methods and sums their inclusive wall time. While disabled nothing is
+    # patched, so the simulation runs the plain methods. Only one instrumentation can be enabled at a time.
+    # The methods are patched process-wide, but only the calls of the thread which enabled it are collected,
+    # so concurrent runs in other threads are neither counted nor timed.
+    _enabled: ty.Optional['Instrumentation'] = None
+
+    def __init__(self, probes: ty.Optional[ty.Sequence[ty.Tuple[type, str]]] = None) -> None:
+        self._probes: ty.Sequence[ty.Tuple[type, str]] = probes if probes is not None else PROBES
+        self._calls: ty.DefaultDict[str, int] = collections.defaultdict(int)
+        self._seconds: ty.DefaultDict[str, float] = collections.defaultdict(float)
+        self._originals: ty.List[ty.Tuple[type, str, ty.Callable]] = list()
+        self._thread: ty.Optional[int] = None
+
+    @classmethod
+    def current(cls) -> ty.Optional['Instrumentation']:
+        return cls._enabled
+
+    @property
+    def enabled(self) -> bool:
+        return Instrumentation._enabled is self
+
+    @staticmethod
+    def _owners(owner: type, name: str) -> ty.Iterator[type]:
+        # The owner and every subclass which defines the method itself
+        pending = [owner]
+        seen = set()
+        while pending:
+            cls = pending.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            if name in cls.__dict__:
+                yield cls
+            pending.extend(cls.__subclasses__())
+
+    def _wrap(self, function: ty.Callable, label: str) -> ty.Callable:
+        calls = self._calls
+        seconds = self._seconds
+        clock = time.perf_counter
+        thread = self._thread
+        get_ident = threading.get_ident
+
+        @functools.wraps(function)
+        def probe(*args: ty.Any, **kwargs: ty.Any) -> ty.Any:
+            if get_ident() != thread:
+                return function(*args, **kwargs)
+            begin = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                calls[label] += 1
+                seconds[label] += clock() - begin
+        return probe
+
+    def enable(self) -> 'Instrumentation':
+        if Instrumentation._enabled is not None:
+            raise ValueError('Another instrumentation is already enabled')
+        self._thread = threading.get_ident()
+        for owner, name in self._probes:
+            for cls in self._owners(owner, name):
+                function = cls.__dict__[name]
+                self._originals.append((cls, name, function))
+                setattr(cls, name, self._wrap(function, f'{cls.__qualname__}.{name}'))
+        Instrumentation._enabled = self
+        return self
+
+    def disable(self) -> None:
+        if Instrumentation._enabled is not self:
+            return
+        for cls, name, function in reversed(self._originals):
+            setattr(cls, name, function)
+        self._originals = list()
+        self._thread = None
+        Instrumentation._enabled = None
+
+    def __enter__(self) -> 'Instrumentation':
+        return self.enable()
+
+    def __exit__(self, *_: ty.Any) -> None:
+        self.disable()
+
+    def count(self, label: str, calls: int = 1) -> None:
+        self._calls[label] += calls
+
+    @contextlib.contextmanager
+    def timer(self, label: str) -> ty.Iterator[None]:
+        # Times a block which is not a probed method, e.g. a whole run
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._calls[label] += 1
+            self._seconds[label] += time.perf_counter() - begin
+
+    def reset(self) -> None:
+        self._calls.clear()
+        self._seconds.clear()
+
+    def report(self) -> Report:
+        return {'calls': dict(sorted(self._calls.items())), 'seconds': dict(sorted(self._seconds.items()))}
+
+    def to_json(self) -> str:
+        return json.dumps(self.report(), indent=2)
+
+    def merge(self, report: Report) -> 'Instrumentation':
+        for label, calls in report.get('calls', {}).items():
+            self._calls[label] += calls
+        for label, seconds in report.get('seconds', {}).items():
+            self._seconds[label] += seconds
+        return self
+
+    @classmethod
+    def aggregate(cls, reports: ty.Iterable[Report]) -> Report:
+        # Sums the reports of several runs, e.g. of the points of a parameter sweep
+        instrumentation = cls(probes=[])
+        for report in reports:
+            instrumentation.merge(report)
+        return instrumentation.report()
+
+    def __repr__(self) -> str:
+        return f'<{__name__} enabled={self.enabled} probes={len(self._probes)}>'
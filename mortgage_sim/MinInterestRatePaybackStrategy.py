@@ -6,5 +6,7 @@ from typing import List
 
 
 class MinInterestRatePaybackStrategy(PaybackStrategy):
+    deterministic: bool = True
+    
     def _unscheduled_payments_order(self, mortgages: List[Mortgage]) -> List[Mortgage]:
-        return sorted(mortgages, key=lambda m: m.interest_value, reverse=True)
+        return sorted(mortgages, key=lambda m: m._interest_value(), reverse=True)
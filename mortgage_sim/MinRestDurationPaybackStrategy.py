@@ -7,7 +7,9 @@ import typing as ty
 
 
 class MinRestDurationPaybackStrategy(PaybackStrategy):
+    deterministic: bool = True
+    
     def _unscheduled_payments_order(self, mortgages: ty.List[Mortgage]) -> ty.List[Mortgage]:
-        return sorted(mortgages, key=lambda m: (m.valid_until or FinancialDate(year=9999, month=12), m.interest_value))
+        return sorted(mortgages, key=lambda m: (m.valid_until or FinancialDate(year=9999, month=12), m._interest_value()))
 
 
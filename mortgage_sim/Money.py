@@ -0,0 +1,61 @@
+import abc
+import numpy as np
+import typing as ty
+from decimal import Decimal
+
+from mortgage_sim.types import Number, Percentage
+
+
+TAmount = ty.TypeVar('TAmount')
+
+
+class Money(abc.ABC, ty.Generic[TAmount]):
+    @property
+    @abc.abstractmethod
+    def zero(self) -> TAmount:
+        return None
+
+    @property
+    @abc.abstractmethod
+    def dtype(self) -> np.dtype:
+        return None
+
+    @abc.abstractmethod
+    def is_negligible(self, amount: TAmount) -> bool:
+        return None
+
+    @abc.abstractmethod
+    def coerce(self, value: Number) -> TAmount:
+        return None
+
+    @abc.abstractmethod
+    def to_decimal(self, amount: TAmount) -> Decimal:
+        return None
+
+    @abc.abstractmethod
+    def to_decimals(self, amounts: ty.List[TAmount]) -> ty.List[Decimal]:
+        return None
+
+    @abc.abstractmethod
+    def to_decimal_array(self, amounts: np.ndarray) -> np.ndarray:
+        return None
+
+    @abc.abstractmethod
+    def to_cents_array(self, amounts: np.ndarray) -> np.ndarray:
+        return None
+
+    @abc.abstractmethod
+    def round(self, amount: ty.Union[TAmount, int]) -> TAmount:
+        return None
+
+    @abc.abstractmethod
+    def rate(self, value: ty.Union[Percentage, Number]) -> ty.Any:
+        return None
+
+    @abc.abstractmethod
+    def add_rates(self, fst: ty.Any, snd: ty.Any) -> ty.Any:
+        return None
+
+    @abc.abstractmethod
+    def scale(self, amount: TAmount, rate: ty.Any, divisor: int = 1) -> TAmount:
+        return None
@@ -0,0 +1,47 @@
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.FinancialDelta import FinancialDelta
+
+
+import numpy as np
+import pandas as pd
+import typing as ty
+
+
+class MonteCarloResult(object):
+    def __init__(self, start: FinancialDate, paths: pd.DataFrame) -> None:
+        self._start: FinancialDate = start
+        self._paths: pd.DataFrame = paths
+
+    @property
+    def start(self) -> FinancialDate:
+        return self._start
+
+    @property
+    def paths(self) -> pd.DataFrame:
+        return self._paths
+
+    @property
+    def overextension_probability(self) -> float:
+        if len(self._paths) == 0:
+            return 0.0
+        return float(np.mean(self._paths['Overextension'].astype(bool)))
+
+    def percentiles(self, column: str, q: ty.Sequence[float] = (5, 25, 50, 75, 95)) -> ty.List[ty.Optional[float]]:
+        # Overextended or not paid off paths have no value and are left out
+        values = np.array([float(value) for value in self._paths[column] if value is not None and not pd.isna(value)], dtype=float)
+        if len(values) == 0:
+            return [None] * len(q)
+        return [float(value) for value in np.percentile(values, q)]
+
+    def statistics(self, q: ty.Sequence[float] = (5, 25, 50, 75, 95)) -> pd.DataFrame:
+        payoff_months = self.percentiles('Payoff Month', q)
+        return pd.DataFrame({
+            'Percentile': list(q),
+            'Total Interest': self.percentiles('Total Interest', q),
+            'Payoff Month': payoff_months,
+            'Payoff Date': [self._start + FinancialDelta(months=int(round(month)) - 1) if month is not None else None for month in payoff_months],
+            'Overextension Probability': self.overextension_probability,
+        })
+
+    def __repr__(self) -> str:
+        return f'<{__name__} paths={len(self._paths)} overextension_probability={self.overextension_probability}>'
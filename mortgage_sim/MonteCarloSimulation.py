@@ -0,0 +1,132 @@
+from mortgage_sim.AnnuityFollowUpCreator import AnnuityFollowUpCreator
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Money import Money
+from mortgage_sim.MonteCarloResult import MonteCarloResult
+from mortgage_sim.ParameterSweep import ParameterSweep
+from mortgage_sim.RandomPaybackStrategy import RandomPaybackStrategy
+from mortgage_sim.Scenario import Scenario
+from mortgage_sim.TemporalValue import TemporalValue
+from mortgage_sim.types import Number, Percentage
+
+
+import math
+import numpy as np
+import pandas as pd
+import random
+import typing as ty
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+
+_worker_simulation: ty.Optional['MonteCarloSimulation'] = None
+_worker_money: ty.Optional[Money] = None
+
+
+def _initialize_worker(simulation: 'MonteCarloSimulation', money: ty.Optional[Money]) -> None:
+    global _worker_simulation, _worker_money
+    _worker_simulation = simulation
+    _worker_money = money
+
+
+def _run_worker(task: ty.Tuple[int, np.random.SeedSequence]) -> ty.Dict[str, ty.Any]:
+    return _worker_simulation.run_path(task[0], task[1], _worker_money)
+
+
+# Follow-up interest rates are sampled at the refinancing dates from a mean-reverting (Ornstein-Uhlenbeck) model.
+# Every path draws from its own seed sequence spawned from the simulation seed, so results neither depend on the
+# number of processes nor on how the paths are scheduled.
+class MonteCarloSimulation(object):
+    def __init__(self, scenario: Scenario, paths: int = 1_000, seed: int = 0, initial_rate: ty.Optional[Percentage] = None,
+                 volatility: Percentage = Percentage(1), mean_reversion: Number = 0, long_term_rate: ty.Optional[Percentage] = None,
+                 min_rate: Percentage = Percentage(0)) -> None:
+        if not isinstance(scenario.follow_up_creator, AnnuityFollowUpCreator):
+            raise ValueError('Monte Carlo simulations require a scenario with an AnnuityFollowUpCreator')
+
+        self._scenario: Scenario = scenario
+        self._paths: int = paths
+        self._seed: int = seed
+        self._initial_rate: Percentage = initial_rate or self._base_rate(scenario)
+        self._volatility: Percentage = volatility
+        self._mean_reversion: float = float(mean_reversion)
+        self._long_term_rate: Percentage = long_term_rate or self._initial_rate
+        self._min_rate: Percentage = min_rate
+        self._refinancing_dates: ty.List[FinancialDate] = sorted({mortgage.valid_until.ordinal: mortgage.valid_until
+                                                                  for mortgage in scenario.mortgages if mortgage.valid_until is not None}.values(),
+                                                                 key=lambda date: date.ordinal)
+
+    @staticmethod
+    def _base_rate(scenario: Scenario) -> Percentage:
+        interest_rate = scenario.follow_up_creator.interest_rate
+        if isinstance(interest_rate, TemporalValue):
+            return interest_rate.get_value(scenario.start)
+        return interest_rate
+
+    @property
+    def scenario(self) -> Scenario:
+        return self._scenario
+
+    @property
+    def paths(self) -> int:
+        return self._paths
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def refinancing_dates(self) -> ty.List[FinancialDate]:
+        return self._refinancing_dates
+
+    def rate_path(self, generator: np.random.Generator) -> ty.List[Percentage]:
+        rates = list()
+        rate = float(self._initial_rate.percentage)
+        long_term_rate = float(self._long_term_rate.percentage)
+        volatility = float(self._volatility.percentage)
+        min_rate = float(self._min_rate.percentage)
+
+        previous = self._scenario.start.ordinal
+        for date in self._refinancing_dates:
+            # Exact transition of the process over the gap since the previous date
+            years = (date.ordinal - previous) / 12
+            if self._mean_reversion == 0:
+                mean, deviation = rate, volatility * math.sqrt(years)
+            else:
+                decay = math.exp(-self._mean_reversion * years)
+                mean = long_term_rate + (rate - long_term_rate) * decay
+                deviation = volatility * math.sqrt((1 - decay ** 2) / (2 * self._mean_reversion))
+            rate = mean + deviation * generator.standard_normal()
+            previous = date.ordinal
+            # Rates are rounded to basis points, as they would be quoted
+            rates.append(Percentage(Decimal(repr(round(max(rate, min_rate), 2)))))
+        return rates
+
+    def run_path(self, index: int, seed_sequence: np.random.SeedSequence, money: ty.Optional[Money] = None) -> ty.Dict[str, ty.Any]:
+        rate_sequence, strategy_sequence = seed_sequence.spawn(2)
+        rates = self.rate_path(np.random.default_rng(rate_sequence))
+
+        interest_rate = TemporalValue[Percentage](self._initial_rate)
+        for date, rate in zip(self._refinancing_dates, rates):
+            interest_rate.set_value(date, rate)
+
+        instance = self._scenario.instantiate(self._scenario.follow_up_creator.with_interest_rate(interest_rate))
+        strategy_arguments = dict()
+        if issubclass(instance.strategy, RandomPaybackStrategy):
+            strategy_arguments['rng'] = random.Random(int(strategy_sequence.generate_state(1)[0]))
+        strategy = instance.create_strategy(**strategy_arguments)
+
+        row = {'Path': index}
+        row.update({f'Rate {date.year:04d}-{date.month:02d}': rate.percentage for date, rate in zip(self._refinancing_dates, rates)})
+        row.update(ParameterSweep.summarize(instance, strategy, money))
+        return row
+
+    def run(self, processes: ty.Optional[int] = None, money: ty.Optional[Money] = None, chunksize: int = 16) -> MonteCarloResult:
+        tasks = list(enumerate(np.random.SeedSequence(self._seed).spawn(self._paths)))
+        if processes == 1:
+            rows = [self.run_path(index, seed_sequence, money) for index, seed_sequence in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=processes, initializer=_initialize_worker, initargs=(self, money)) as executor:
+                rows = list(executor.map(_run_worker, tasks, chunksize=chunksize))
+        return MonteCarloResult(self._scenario.start, pd.DataFrame(rows))
+
+    def __repr__(self) -> str:
+        return f'<{__name__} paths={self._paths} seed={self._seed} initial_rate={self._initial_rate} volatility={self._volatility}>'
@@ -1,11 +1,15 @@
+import typing as ty
 from decimal import Decimal
 
 
 class MonthlyPayment(object):
+    # Immutable value, created for every mortgage and month, so it has no instance dict
+    __slots__ = ('_amount', '_interest_value', '_payback_value')
+
     def __init__(self, amount: Decimal, interest_value: Decimal, payback_value: Decimal) -> None:
-        self._amount: Decimal = amount
-        self._interest_value: Decimal = interest_value
-        self._payback_value: Decimal = payback_value
+        object.__setattr__(self, '_amount', amount)
+        object.__setattr__(self, '_interest_value', interest_value)
+        object.__setattr__(self, '_payback_value', payback_value)
         
     @property
     def amount(self) -> Decimal:
@@ -18,4 +22,20 @@ class MonthlyPayment(object):
     @property
     def payback_value(self) -> Decimal:
         return self._payback_value
-    
\ No newline at end of file
+
+    def __setattr__(self, name: str, value: ty.Any) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{__class__.__name__} is immutable')
+
+    def __reduce__(self) -> ty.Tuple[ty.Any, ...]:
+        return MonthlyPayment, (self._amount, self._interest_value, self._payback_value)
+
+    def __eq__(self, other: ty.Any) -> bool:
+        if not isinstance(other, MonthlyPayment):
+            return NotImplemented
+        return (self._amount, self._interest_value, self._payback_value) == (other._amount, other._interest_value, other._payback_value)
+
+    def __hash__(self) -> int:
+        return hash((self._amount, self._interest_value, self._payback_value))
@@ -1,5 +1,8 @@
+from mortgage_sim.CalendarEvent import CalendarEvent, EventKind
+from mortgage_sim.DecimalMoney import DecimalMoney
 from mortgage_sim.MonthlyPayment import MonthlyPayment
 from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Money import Money
 from mortgage_sim.PaymentPlan import PaymentPlan
 from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
 from mortgage_sim.TemporalValue import TemporalValue
@@ -7,6 +10,7 @@ from mortgage_sim.Wallet import Wallet
 from mortgage_sim.types import Number, Percentage, as_decimal
 
 
+import copy
 import typing as ty
 from decimal import Decimal
 
@@ -16,35 +20,89 @@ class Mortgage(object):
                  valid_from: ty.Optional[FinancialDate] = None, valid_until: ty.Optional[FinancialDate] = None,
                  repayment_parameter_set: ty.Optional[RepaymentParameterSet] = None) -> None:
         self.name: str = name
-        self._initial_amount: Decimal = as_decimal(initial_amount)
-        self._current_amount: Decimal = self._initial_amount
+        self._money: Money = DecimalMoney()
+        self._initial_amount: ty.Any = as_decimal(initial_amount)
+        self._current_amount: ty.Any = self._initial_amount
         self._interest_rate: TemporalValue[Percentage] = TemporalValue[Percentage](interest_rate)
         self._payback_rate: TemporalValue[ Percentage] = TemporalValue[Percentage](payback_rate)
         self._valid_from: ty.Optional[FinancialDate] = valid_from
         self._valid_until: ty.Optional[FinancialDate] = valid_until
         self._repayment_parameter_set: TemporalValue[RepaymentParameterSet] = TemporalValue[RepaymentParameterSet](repayment_parameter_set)
         self._current_unscheduled_payments_count: int = 0
-        self._current_unscheduled_payments_sum: Decimal = Decimal(0)
+        self._current_unscheduled_payments_sum: ty.Any = Decimal(0)
         self._current_date: ty.Optional[FinancialDate] = None
         self._follow_up_creator: ty.Optional[ty.Callable[['Mortgage', PaymentPlan], 'Mortgage']] = None
+        self._payment_plan_columns: ty.Optional[ty.Tuple[PaymentPlan, ty.List[PaymentPlan.Column]]] = None
+        # Payment state of the current month: the interest percentage, the interest rate and the monthly amount, which only
+        # change with the date, the rates or the money, and the payment of the current amount, which is keyed by its identity
+        self._month_state: ty.Optional[ty.Tuple[Decimal, ty.Any, ty.Any]] = None
+        self._payment_state: ty.Optional[ty.Tuple[ty.Any, MonthlyPayment]] = None
+        # Set once state copies share the rates and parameter sets, the first alteration then copies them
+        self._shared_definition: bool = False
 
     def alter_interest_rate(self, when: FinancialDate, interest_rate: Percentage) -> ty.Self:
+        self._own_definition()
         self._interest_rate.set_value(when, interest_rate)
+        self._invalidate_payment_state()
         return self
 
     def alter_payback_rate(self, when: FinancialDate, payback_rate: Percentage) -> ty.Self:
+        self._own_definition()
         self._payback_rate.set_value(when, payback_rate)
+        self._invalidate_payment_state()
         return self
     
     def alter_repayment_parameter_set(self, when: FinancialDate, parameter_set: RepaymentParameterSet) -> ty.Self:
+        self._own_definition()
         self._repayment_parameter_set.set_value(when, parameter_set)
         return self
     
+    def alter_interest_rates(self, changes: ty.Iterable[ty.Tuple[FinancialDate, Percentage]]) -> ty.Self:
+        self._own_definition()
+        self._interest_rate.set_values(changes)
+        self._invalidate_payment_state()
+        return self
+
+    def alter_payback_rates(self, changes: ty.Iterable[ty.Tuple[FinancialDate, Percentage]]) -> ty.Self:
+        self._own_definition()
+        self._payback_rate.set_values(changes)
+        self._invalidate_payment_state()
+        return self
+    
+    def alter_repayment_parameter_sets(self, changes: ty.Iterable[ty.Tuple[FinancialDate, ty.Optional[RepaymentParameterSet]]]) -> ty.Self:
+        self._own_definition()
+        self._repayment_parameter_set.set_values(changes)
+        return self
+    
+    def interest_rates(self, start: FinancialDate, n_months: int) -> ty.List[Percentage]:
+        return self._interest_rate.get_values(start, n_months)
+    
+    def payback_rates(self, start: FinancialDate, n_months: int) -> ty.List[Percentage]:
+        return self._payback_rate.get_values(start, n_months)
+    
+    def repayment_parameter_sets(self, start: FinancialDate, n_months: int) -> ty.List[ty.Optional[RepaymentParameterSet]]:
+        return self._repayment_parameter_set.get_values(start, n_months)
+    
+    def bind_money(self, money: Money) -> ty.Self:
+        if money is self._money:
+            return self
+        self._initial_amount = money.coerce(self._money.to_decimal(self._initial_amount))
+        self._current_amount = money.coerce(self._money.to_decimal(self._current_amount))
+        self._current_unscheduled_payments_sum = money.coerce(self._money.to_decimal(self._current_unscheduled_payments_sum))
+        self._money = money
+        self._invalidate_payment_state()
+        return self
+
+    def _invalidate_payment_state(self) -> None:
+        self._month_state = None
+        self._payment_state = None
+    
     def update_current_date(self, next_date: FinancialDate) -> None:
         if self._current_date is None:
             self._current_date = next_date
             self._current_unscheduled_payments_count = 0
-            self._current_unscheduled_payments_sum = Decimal(0)
+            self._current_unscheduled_payments_sum = self._money.zero
+            self._invalidate_payment_state()
             return
         
         delta = next_date - self._current_date
@@ -53,41 +111,50 @@ class Mortgage(object):
         
         if next_date.month == 1:
             self._current_unscheduled_payments_count = 0
-            self._current_unscheduled_payments_sum = Decimal(0)
+            self._current_unscheduled_payments_sum = self._money.zero
         self._current_date = next_date
+        self._invalidate_payment_state()
         
     def columns(self) -> ty.List[str]:
         return [f'{self.name} Interest', f'{self.name} Payback', f'{self.name} Amount', f'{self.name} Unscheduled']
+    
+    def _columns_of(self, payment_plan: PaymentPlan) -> ty.List[PaymentPlan.Column]:
+        # Column handles are resolved once per payment plan instead of once per value
+        payment_plan_columns = self._payment_plan_columns
+        if payment_plan_columns is None or payment_plan_columns[0] is not payment_plan:
+            self._payment_plan_columns = payment_plan_columns = (payment_plan, [payment_plan.amount_column(column) for column in self.columns()])
+        return payment_plan_columns[1]
         
     def execute_payback(self, payment_plan: PaymentPlan, wallet: Wallet) -> None:
-        monthly_payment = self.monthly_payment
+        monthly_payment = self._monthly_payment()
         self._current_amount += monthly_payment.interest_value
         self._current_amount -= monthly_payment.payback_value
-        if self._current_amount < 0.01:
-            self._current_amount = Decimal(0)
+        if self._money.is_negligible(self._current_amount):
+            self._current_amount = self._money.zero
         
-        wallet -= self.monthly_payment.payback_value
-        payment_plan.record(f'{self.name} Interest', monthly_payment.interest_value, Decimal(0))
-        payment_plan.record(f'{self.name} Payback', monthly_payment.payback_value, Decimal(0))
-        payment_plan.record(f'{self.name} Amount', self._current_amount, Decimal(0))
+        wallet._withdraw(self._monthly_payment().payback_value)
+        interest_column, payback_column, amount_column, _ = self._columns_of(payment_plan)
+        interest_column.record(monthly_payment.interest_value)
+        payback_column.record(monthly_payment.payback_value)
+        amount_column.record(self._current_amount)
         
-    def _execute_unscheduled_payment(self, payment_plan: PaymentPlan, wallet: Wallet, amount: Decimal):
+    def _execute_unscheduled_payment(self, payment_plan: PaymentPlan, wallet: Wallet, amount: ty.Any):
         self._current_amount -= amount
         self._current_unscheduled_payments_sum += amount
         self._current_unscheduled_payments_count += 1
-        wallet -= amount
-        payment_plan.record(f'{self.name} Unscheduled', amount, Decimal(0))
+        wallet._withdraw(amount)
+        self._columns_of(payment_plan)[3].record(amount)
         
     def execute_unscheduled_payment(self, payment_plan: PaymentPlan, wallet: Wallet) -> None:        
-        surplus = wallet.get_surplus(self._current_date)
-        payment_plan.record(f'{self.name} Unscheduled', Decimal(0), Decimal(0))
+        surplus = wallet._surplus(self._current_date)
+        self._columns_of(payment_plan)[3].record(self._money.zero)
         
         param_set = self.repayment_parameter_set
         if param_set is None:
             return
         
-        min_value = param_set.min_value(self.initial_amount)
-        max_value = param_set.max_value(self.initial_amount)
+        min_value = param_set.min_value(self._initial_amount, self._money)
+        max_value = param_set.max_value(self._initial_amount, self._money)
         payments_left = max(param_set.payments_per_year - self._current_unscheduled_payments_count, 0)
         if surplus < min_value or max_value <= self._current_unscheduled_payments_sum or payments_left <= 0:
             return
@@ -97,7 +164,7 @@ class Mortgage(object):
         possible_rest = amount_left - possible_amount
         
         months_left = (FinancialDate(year=self._current_date.year + 1, month=1) - self._current_date).months
-        if min_value <= possible_rest or possible_rest == Decimal(0) or months_left == 1 or payments_left == 1:
+        if min_value <= possible_rest or possible_rest == 0 or months_left == 1 or payments_left == 1:
             self._execute_unscheduled_payment(payment_plan, wallet, possible_amount)
             return
         
@@ -106,6 +173,89 @@ class Mortgage(object):
             self._execute_unscheduled_payment(payment_plan, wallet, possible_amount)
             return      
         
+    def _unscheduled_payments_exhausted(self) -> bool:
+        # No unscheduled payment is possible before the counters are reset in January
+        param_set = self.repayment_parameter_set
+        return param_set is None or param_set.payments_per_year <= self._current_unscheduled_payments_count \
+            or param_set.max_value(self._initial_amount, self._money) <= self._current_unscheduled_payments_sum
+    
+    @property
+    def revision(self) -> int:
+        return self._interest_rate.revision + self._payback_rate.revision + self._repayment_parameter_set.revision
+    
+    def events(self, first: int, last: int) -> ty.Iterator[ty.Tuple[int, CalendarEvent]]:
+        for kind, temporal_value in ((EventKind.INTEREST_RATE, self._interest_rate), (EventKind.PAYBACK_RATE, self._payback_rate),
+                                     (EventKind.REPAYMENT_PARAMETER_SET, self._repayment_parameter_set)):
+            for key, _ in temporal_value.ordinal_items():
+                if first <= key < last:
+                    yield key, CalendarEvent(kind, self.name, FinancialDate.from_ordinal(key))
+        for kind, when in ((EventKind.VALID_FROM, self._valid_from), (EventKind.VALID_UNTIL, self._valid_until)):
+            if when is not None and first <= when.ordinal < last:
+                yield when.ordinal, CalendarEvent(kind, self.name, when)
+    
+    def _annuity_stretch(self, months: int) -> ty.Tuple[ty.List[ty.Any], ty.List[ty.Any], ty.List[ty.Any], ty.List[ty.Any]]:
+        # Interest, payback, charged payment and remaining amount of the next months without unscheduled payments,
+        # exactly as execute_payback would produce them. The rates must be stable over these months.
+        money = self._money
+        percentage, rate, monthly_amount = self._current_month_state()
+        amount = self._current_amount
+        zero = money.zero
+        
+        if percentage == 0:
+            # Without interest the amount decreases linearly and is known in closed form
+            amounts = [max(amount - (month + 1) * monthly_amount, zero) for month in range(months)]
+            amounts = [zero if money.is_negligible(value) else value for value in amounts]
+            paybacks = [min(monthly_amount, previous) for previous in [amount] + amounts[:-1]]
+            return [zero] * months, paybacks, [min(monthly_amount, value) for value in amounts], amounts
+        
+        scale = money.scale
+        is_negligible = money.is_negligible
+        interests, paybacks, charges, amounts = list(), list(), list(), list()
+        for _ in range(months):
+            interest = scale(amount, rate, 12)
+            payback = min(monthly_amount, amount + interest)
+            amount = amount + interest - payback
+            if is_negligible(amount):
+                amount = zero
+            interests.append(interest)
+            paybacks.append(payback)
+            charges.append(min(monthly_amount, amount + scale(amount, rate, 12)))
+            amounts.append(amount)
+        return interests, paybacks, charges, amounts
+    
+    def _skip_months(self, months: int, current_amount: ty.Any) -> None:
+        next_date = FinancialDate.from_ordinal(self.current_date.ordinal + months)
+        if next_date.ordinal // 12 != self._current_date.ordinal // 12:
+            self._current_unscheduled_payments_count = 0
+            self._current_unscheduled_payments_sum = self._money.zero
+        self._current_amount = current_amount
+        self._current_date = next_date
+        self._invalidate_payment_state()
+        
+    def _own_definition(self) -> None:
+        if self._shared_definition:
+            self._interest_rate = self._interest_rate.copy()
+            self._payback_rate = self._payback_rate.copy()
+            self._repayment_parameter_set = self._repayment_parameter_set.copy()
+            self._shared_definition = False
+    
+    def _state_copy(self) -> 'Mortgage':
+        # Shares the definition, i.e. the rates and parameter sets, and copies the simulation state. The definition
+        # is copied on write, so either mortgage can be altered without affecting the other.
+        self._shared_definition = True
+        state = copy.copy(self)
+        state._payment_plan_columns = None
+        return state
+    
+    def _load_state(self, state: 'Mortgage') -> None:
+        self._money = state._money
+        self._initial_amount = state._initial_amount
+        self._current_amount = state._current_amount
+        self._current_unscheduled_payments_count = state._current_unscheduled_payments_count
+        self._current_unscheduled_payments_sum = state._current_unscheduled_payments_sum
+        self._current_date = state._current_date
+        self._invalidate_payment_state()
+        
     def register_follow_up_creator(self, follow_up_creator: ty.Callable[['Mortgage'], 'Mortgage']) -> ty.Self:
         self._follow_up_creator = follow_up_creator
         return self
@@ -116,13 +266,17 @@ class Mortgage(object):
             raise ValueError('current_date must be set')
         return self._current_date
         
+    @property
+    def money(self) -> Money:
+        return self._money
+        
     @property
     def initial_amount(self) -> Decimal:
-        return self._initial_amount
+        return self._money.to_decimal(self._initial_amount)
     
     @property
     def current_amount(self) -> Decimal:
-        return self._current_amount
+        return self._money.to_decimal(self._current_amount)
         
     @property
     def valid_from(self) -> ty.Optional[FinancialDate]:
@@ -132,27 +286,52 @@ class Mortgage(object):
     def valid_until(self) -> ty.Optional[FinancialDate]:
         return self._valid_until
     
+    def _current_month_state(self) -> ty.Tuple[Decimal, ty.Any, ty.Any]:
+        month_state = self._month_state
+        if month_state is None:
+            money = self._money
+            interest_rate = self._interest_rate.get_value(self.current_date)
+            rate = money.rate(interest_rate)
+            payback_rate = money.rate(self._payback_rate.get_value(self.current_date))
+            monthly_amount = money.scale(self._initial_amount, money.add_rates(rate, payback_rate), 12)
+            self._month_state = month_state = (interest_rate.percentage, rate, monthly_amount)
+        return month_state
+    
+    def _monthly_payment_amount(self) -> ty.Any:
+        return self._current_month_state()[2]
+    
+    def _interest_value(self) -> ty.Any:
+        return self._monthly_payment().interest_value
+    
+    def _monthly_payment(self) -> MonthlyPayment:
+        # Computed once per month and amount, the sums, the payback and the sort keys of the strategies share it
+        payment_state = self._payment_state
+        if payment_state is not None and payment_state[0] is self._current_amount:
+            return payment_state[1]
+        _, rate, amount = self._current_month_state()
+        interest_value = self._money.scale(self._current_amount, rate, 12)
+        payback_value = min(amount, self._current_amount + interest_value)
+        monthly_payment = MonthlyPayment(amount, interest_value, payback_value)
+        self._payment_state = (self._current_amount, monthly_payment)
+        return monthly_payment
+    
     @property
     def monthly_payment_amount(self) -> Decimal:
-        interest_rate = as_decimal(self._interest_rate.get_value(self.current_date))
-        payback_rate = as_decimal(self._payback_rate.get_value(self.current_date))
-        return round((interest_rate + payback_rate) * self.initial_amount / Decimal(12), 2)
+        return self._money.to_decimal(self._monthly_payment_amount())
     
     @property
     def interest_value(self) -> Decimal:
-        interest_rate = as_decimal(self._interest_rate.get_value(self.current_date))
-        return round(self._current_amount * interest_rate / Decimal(12), 2)
+        return self._money.to_decimal(self._interest_value())
     
     @property
     def payback_value(self) -> Decimal:
-        return self.monthly_payment_amount - self.interest_value
+        return self._money.to_decimal(self._monthly_payment_amount() - self._interest_value())
     
     @property
-    def monthly_payment(self) -> MonthlyPayment:        
-        amount = self.monthly_payment_amount
-        interest_value = self.interest_value
-        payback_value = min(amount, self.current_amount + interest_value)
-        return MonthlyPayment(amount, interest_value, payback_value)
+    def monthly_payment(self) -> MonthlyPayment:
+        monthly_payment = self._monthly_payment()
+        to_decimal = self._money.to_decimal
+        return MonthlyPayment(to_decimal(monthly_payment.amount), to_decimal(monthly_payment.interest_value), to_decimal(monthly_payment.payback_value))
 
     @property
     def repayment_parameter_set(self) -> ty.Optional[RepaymentParameterSet]:
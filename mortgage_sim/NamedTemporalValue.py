@@ -17,4 +17,4 @@ class NamedTemporalValue(TemporalValue[TValue]):
         return self._name
     
     def __repr__(self) -> str:
-        return f'<{__name__} name={self.name} default_value={self._default_value} collection={self._collection}>'
\ No newline at end of file
+        return f'<{__name__} name={self.name} default_value={self._default_value} collection={list(self.items())}>'
\ No newline at end of file
@@ -0,0 +1,11 @@
+from decimal import Decimal
+
+
+class Overextension(Exception):
+    def __init__(self, amount: Decimal) -> None:
+        super().__init__(f'Overextension: {amount}')
+        self._amount: Decimal = amount
+
+    @property
+    def amount(self) -> Decimal:
+        return self._amount
@@ -0,0 +1,132 @@
+from mortgage_sim.Instrumentation import Instrumentation
+from mortgage_sim.Money import Money
+from mortgage_sim.PaybackStrategy import PaybackStrategy
+from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
+from mortgage_sim.ResultCache import ResultCache
+from mortgage_sim.Scenario import Scenario
+from mortgage_sim.types import Percentage
+
+
+import itertools
+import pandas as pd
+import typing as ty
+from concurrent.futures import ProcessPoolExecutor
+
+
+TOverride = ty.TypeVar('TOverride')
+Override = ty.Optional[ty.Union[TOverride, ty.Mapping[str, TOverride]]]
+GridPoint = ty.Tuple[Override[Percentage], Override[Percentage], Override[RepaymentParameterSet], ty.Optional[ty.Type[PaybackStrategy]]]
+
+
+_worker_scenario: ty.Optional[Scenario] = None
+_worker_money: ty.Optional[Money] = None
+_worker_cache: ty.Optional[ResultCache] = None
+_worker_instrument: bool = False
+
+
+def _initialize_worker(scenario: Scenario, money: ty.Optional[Money], cache: ty.Optional[ResultCache] = None, instrument: bool = False) -> None:
+    global _worker_scenario, _worker_money, _worker_cache, _worker_instrument
+    _worker_scenario = scenario
+    _worker_money = money
+    _worker_cache = cache
+    _worker_instrument = instrument
+
+
+def _run_worker(point: GridPoint) -> ty.Tuple[ty.Dict[str, ty.Any], ty.Optional[ty.Dict[str, ty.Any]]]:
+    return ParameterSweep.run_instrumented_point(_worker_scenario, point, _worker_money, _worker_cache, _worker_instrument)
+
+
+class ParameterSweep(object):
+    def __init__(self, scenario: Scenario, interest_rates: ty.Optional[ty.Sequence[Override[Percentage]]] = None,
+                 payback_rates: ty.Optional[ty.Sequence[Override[Percentage]]] = None,
+                 repayment_parameter_sets: ty.Optional[ty.Sequence[Override[RepaymentParameterSet]]] = None,
+                 strategies: ty.Optional[ty.Sequence[ty.Type[PaybackStrategy]]] = None) -> None:
+        self._scenario: Scenario = scenario
+        self._interest_rates: ty.Sequence[Override[Percentage]] = interest_rates or [None]
+        self._payback_rates: ty.Sequence[Override[Percentage]] = payback_rates or [None]
+        self._repayment_parameter_sets: ty.Sequence[Override[RepaymentParameterSet]] = repayment_parameter_sets or [None]
+        self._strategies: ty.Sequence[ty.Optional[ty.Type[PaybackStrategy]]] = strategies or [None]
+
+    @property
+    def grid(self) -> ty.List[GridPoint]:
+        return list(itertools.product(self._interest_rates, self._payback_rates, self._repayment_parameter_sets, self._strategies))
+
+    @staticmethod
+    def _override_for(override: Override[TOverride], name: str) -> ty.Optional[TOverride]:
+        if isinstance(override, ty.Mapping):
+            return override.get(name, None)
+        return override
+
+    @classmethod
+    def apply(cls, scenario: Scenario, point: GridPoint) -> Scenario:
+        interest_rate, payback_rate, repayment_parameter_set, _ = point
+        for mortgage in scenario.mortgages:
+            when = mortgage.valid_from or scenario.start
+            if (value := cls._override_for(interest_rate, mortgage.name)) is not None:
+                mortgage.alter_interest_rate(when, value)
+            if (value := cls._override_for(payback_rate, mortgage.name)) is not None:
+                mortgage.alter_payback_rate(when, value)
+            if (value := cls._override_for(repayment_parameter_set, mortgage.name)) is not None:
+                mortgage.alter_repayment_parameter_set(when, value)
+        return scenario
+
+    @staticmethod
+    def _describe(override: ty.Any) -> ty.Any:
+        if override is None or isinstance(override, (str, int, float)):
+            return override
+        if isinstance(override, type):
+            return override.__name__
+        if isinstance(override, Percentage):
+            return override.percentage
+        return repr(override)
+
+    @classmethod
+    def run_point(cls, scenario: Scenario, point: GridPoint, money: ty.Optional[Money] = None, cache: ty.Optional[ResultCache] = None) -> ty.Dict[str, ty.Any]:
+        instance = cls.apply(scenario.instantiate(), point)
+        strategy = instance.create_strategy(point[3])
+        row = {
+            'Interest Rate': cls._describe(point[0]),
+            'Payback Rate': cls._describe(point[1]),
+            'Repayment Parameter Set': cls._describe(point[2]),
+            'Strategy': type(strategy).__name__,
+        }
+        row.update(cls.summarize(instance, strategy, money, cache))
+        return row
+
+    @classmethod
+    def run_instrumented_point(cls, scenario: Scenario, point: GridPoint, money: ty.Optional[Money] = None, cache: ty.Optional[ResultCache] = None,
+                               instrument: bool = False) -> ty.Tuple[ty.Dict[str, ty.Any], ty.Optional[ty.Dict[str, ty.Any]]]:
+        # The row of the point and the instrumentation report of its run, if instrumented
+        if not instrument:
+            return cls.run_point(scenario, point, money, cache), None
+        with Instrumentation() as instrumentation:
+            with instrumentation.timer('ParameterSweep.run_point'):
+                row = cls.run_point(scenario, point, money, cache)
+        return row, instrumentation.report()
+
+    @staticmethod
+    def summarize(instance: Scenario, strategy: PaybackStrategy, money: ty.Optional[Money] = None, cache: ty.Optional[ResultCache] = None) -> ty.Dict[str, ty.Any]:
+        summary = strategy.calculate_summary(instance.start, instance.finances, instance.wallet, money, cache)
+        return {
+            'Total Interest': summary.total_interest if not summary.overextension else None,
+            'Total Unscheduled': summary.total_unscheduled if not summary.overextension else None,
+            'Payoff Month': summary.payoff_month,
+            'Payoff Date': summary.payoff_date,
+            'Min Wallet': summary.min_wallet,
+            'Overextension': summary.overextension,
+        }
+
+    def run(self, processes: ty.Optional[int] = None, money: ty.Optional[Money] = None, chunksize: int = 1, cache: ty.Optional[ResultCache] = None,
+            instrumentation: ty.Optional[Instrumentation] = None) -> pd.DataFrame:
+        # With an instrumentation every point is instrumented on its worker and the reports are merged into it
+        grid = self.grid
+        instrument = instrumentation is not None
+        if processes == 1:
+            results = [self.run_instrumented_point(self._scenario, point, money, cache, instrument) for point in grid]
+        else:
+            with ProcessPoolExecutor(max_workers=processes, initializer=_initialize_worker, initargs=(self._scenario, money, cache, instrument)) as executor:
+                results = list(executor.map(_run_worker, grid, chunksize=chunksize))
+        if instrument:
+            for _, report in results:
+                instrumentation.merge(report)
+        return pd.DataFrame([row for row, _ in results])
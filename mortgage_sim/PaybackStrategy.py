@@ -1,35 +1,256 @@
 import abc
-import pandas as pd
+import numpy as np
 import typing as ty
 
-from decimal import Decimal
-
+from mortgage_sim.DecimalMoney import DecimalMoney
+from mortgage_sim.EventCalendar import EventCalendar, MORTGAGE_EVENTS
 from mortgage_sim.Finances import Finances
+from mortgage_sim.FinancesTimeline import FinancesTimeline
 from mortgage_sim.FinancialDate import FinancialDate
 from mortgage_sim.FinancialDelta import FinancialDelta
 
+from mortgage_sim.Money import Money
 from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.Overextension import Overextension
+from mortgage_sim.PaymentAggregates import PaymentAggregates
 from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.PaymentRecord import PaymentRecord
+from mortgage_sim.PaymentStream import PaymentStream
+from mortgage_sim.PaymentTotals import PaymentTotals
+from mortgage_sim.SimulationCheckpoint import SimulationCheckpoint
+from mortgage_sim.SimulationSummary import SimulationSummary
 from mortgage_sim.Wallet import Wallet
+from mortgage_sim.types import HORIZON
+
+if ty.TYPE_CHECKING:
+    import pandas as pd
+    from mortgage_sim.ResultCache import ResultCache
 
 
 class PaybackStrategy(abc.ABC):
-    def __init__(self, mortgages: ty.List[Mortgage]) -> None:
-        self._mortgages: ty.List[Mortgage] = mortgages
+    # Results of deterministic strategies only depend on their inputs and may be cached, strategies opt in explicitly
+    deterministic: bool = False
+    
+    def __init__(self, mortgages: ty.List[Mortgage], horizon: int = HORIZON) -> None:
+        if horizon < 1:
+            raise ValueError(f'horizon must be at least one month but is {horizon}')
+        self._horizon: int = horizon
+        # The given mortgages are the definitions, every run simulates state copies of them and leaves them untouched
+        self._definitions: ty.List[Mortgage] = mortgages
+        self._mortgages: ty.List[Mortgage] = list(mortgages)
         self._mortgages_history: ty.List[Mortgage] = list(mortgages)
+        self._money: Money = DecimalMoney()
+        self._sum_columns: ty.List[PaymentPlan.Column] = list()
+        self._payment_plan: ty.Optional[PaymentPlan] = None
+        self._checkpoints: ty.List[SimulationCheckpoint] = list()
                     
     @property
     def _is_active(self) -> bool:
-        return any(Decimal(0) < mortgage.current_amount for mortgage in self._mortgages)
+        return any(0 < mortgage._current_amount for mortgage in self._mortgages)
+    
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
     
     def _is_valid_mortgage(self, current_date: FinancialDate, mortgage: Mortgage):
         return mortgage.valid_from is None or mortgage.valid_from <= current_date
     
-    def calculate_payment_plan(self, start: FinancialDate, finances: Finances, wallet: Wallet) -> pd.DataFrame:     
-        payment_plan = PaymentPlan()
-           
-        for month in range(0, 30 * 12):
+    @property
+    def mortgages(self) -> ty.List[Mortgage]:
+        # Mortgages of the last run, including its follow-ups
+        return self._mortgages_history
+    
+    @property
+    def horizon(self) -> int:
+        return self._horizon
+    
+    @property
+    def payment_plan(self) -> ty.Optional[PaymentPlan]:
+        return self._payment_plan
+    
+    @property
+    def checkpoints(self) -> ty.List[SimulationCheckpoint]:
+        return self._checkpoints
+    
+    def calculate_payment_plan(self, start: FinancialDate, finances: Finances, wallet: Wallet, money: ty.Optional[Money] = None,
+                               numeric: bool = False, checkpoint_interval: ty.Optional[int] = None, cache: ty.Optional['ResultCache'] = None) -> 'pd.DataFrame':     
+        # A cached plan is returned without simulating: the wallet keeps its state instead of being charged, and mortgages
+        # holds the given mortgages without their follow-ups. With numeric amounts are integer cents instead of Decimal,
+        # which is the fast path of CentsMoney as its columns are handed over without conversion.
+        money = money or DecimalMoney()
+        key = None
+        if cache is not None and checkpoint_interval is None:
+            key = cache.key('payment_plan', start, finances, wallet, self._definitions, type(self), money, self._horizon)
+            payment_plan = cache.get_payment_plan(key, money) if key is not None else None
+            if payment_plan is not None:
+                self._start_run()
+                self._payment_plan = payment_plan
+                self._checkpoints = list()
+                return payment_plan.to_frame(numeric=numeric)
+        
+        payment_plan = self.record_payment_plan(start, finances, wallet, money, checkpoint_interval)
+        if key is not None:
+            cache.put_payment_plan(key, payment_plan, self._column_order())
+        return self._result(payment_plan, numeric)
+    
+    def record_payment_plan(self, start: FinancialDate, finances: Finances, wallet: Wallet, money: ty.Optional[Money] = None,
+                            checkpoint_interval: ty.Optional[int] = None) -> PaymentPlan:
+        # Like calculate_payment_plan but keeps the recorded columns, the plan stays available after an Overextension
+        money = money or DecimalMoney()
+        self._payment_plan = payment_plan = PaymentPlan(money, self._horizon)
+        self._checkpoints = list()
+        self._start_run()
+        self._simulate(start, finances, wallet, payment_plan, self._horizon, checkpoint_interval)
+        return payment_plan
+    
+    def stream_payment_plan(self, start: FinancialDate, finances: Finances, wallet: Wallet, money: ty.Optional[Money] = None) -> ty.Iterator[PaymentRecord]:
+        # Yields the row of every month as soon as it is simulated, amounts as Decimal. Only the current row is kept,
+        # so the memory does not grow with the months. An Overextension is raised after the row of its month.
+        money = money or DecimalMoney()
+        self._payment_plan = None
+        self._checkpoints = list()
+        self._start_run()
+        payment_stream = PaymentStream(money)
+        to_decimal = money.to_decimal
+        shape, index, columns, amount_columns = None, None, None, None
+        for _ in self._simulate_months(start, finances, wallet, payment_stream, self._horizon):
+            # Follow-ups add mortgages and columns, the index is shared by the records until they do
+            if shape != (len(self._mortgages_history), len(payment_stream.column_names)):
+                shape = (len(self._mortgages_history), len(payment_stream.column_names))
+                columns = self._column_order()
+                index = {column: position for position, column in enumerate(columns)}
+                amount_columns = [payment_stream.is_amount(column) for column in columns]
+            values = [payment_stream.value(column) for column in columns]
+            yield PaymentRecord(index, tuple(to_decimal(value) if is_amount and value is not None else value
+                                             for value, is_amount in zip(values, amount_columns)))
+    
+    def restore(self, checkpoint: SimulationCheckpoint, wallet: Wallet) -> None:
+        # Mortgages of the strategy take over the state of their namesakes in the checkpoint, mortgages created
+        # during the simulation, e.g. follow-ups, are taken over from the checkpoint
+        self._start_run()
+        mortgages = {mortgage.name: mortgage for mortgage in self._mortgages_history}
+        history = list()
+        for state in checkpoint.mortgages:
+            mortgage = mortgages.get(state.name, None)
+            if mortgage is None:
+                mortgage = state._state_copy()
+            mortgage._load_state(state)
+            history.append(mortgage)
+        self._mortgages_history = history
+        self._mortgages = [history[index] for index in checkpoint.active]
+        self._money = checkpoint.money
+        wallet.bind_money(checkpoint.money)
+        wallet._current_amount = checkpoint.wallet_amount
+    
+    def resume_payment_plan(self, checkpoint: SimulationCheckpoint, payment_plan: PaymentPlan, start: FinancialDate, finances: Finances, wallet: Wallet,
+                            numeric: bool = False, checkpoint_interval: ty.Optional[int] = None) -> 'pd.DataFrame':
+        # Continues a payment plan from a checkpoint of it, the strategy must be restored from the same checkpoint
+        self._payment_plan = payment_plan = payment_plan.copy(checkpoint.rows)
+        self._checkpoints = [checkpoint]
+        self._simulate(start, finances, wallet, payment_plan, self._horizon, checkpoint_interval, checkpoint.month)
+        return self._result(payment_plan, numeric)
+    
+    def _column_order(self) -> ty.List[str]:
+        column_order = ['Date', 'Month', 'Delta', 'Wallet', 'Income', 'Expense', 'Balance', 'Interest Sum', 'Mortgage Sum', 'Payment Sum']
+        for mortgage in self._mortgages_history:
+            column_order += mortgage.columns()
+        return column_order
+    
+    def _result(self, payment_plan: PaymentPlan, numeric: bool) -> 'pd.DataFrame':
+        return payment_plan.to_frame(self._column_order(), numeric)
+    
+    def calculate_summary(self, start: FinancialDate, finances: Finances, wallet: Wallet, money: ty.Optional[Money] = None,
+                          cache: ty.Optional['ResultCache'] = None) -> SimulationSummary:
+        money = money or DecimalMoney()
+        key = cache.key('summary', start, finances, wallet, self._definitions, type(self), money, self._horizon) if cache is not None else None
+        summary = cache.get_summary(key) if key is not None else None
+        if summary is not None:
+            return summary
+        
+        payment_totals = PaymentTotals(money)
+        summary = self._summarize_totals(start, finances, wallet, payment_totals)
+        if key is not None:
+            cache.put_summary(key, summary)
+        return summary
+    
+    def calculate_aggregates(self, start: FinancialDate, finances: Finances, wallet: Wallet, money: ty.Optional[Money] = None) -> PaymentAggregates:
+        # Per-year and lifetime sums of the payment flows, accumulated during the run instead of from kept monthly rows
+        payment_totals = PaymentTotals(money or DecimalMoney(), start)
+        summary = self._summarize_totals(start, finances, wallet, payment_totals)
+        balances = {'Wallet', 'Mortgage Sum'} | {mortgage.columns()[2] for mortgage in self._mortgages_history}
+        columns = [column for column in self._column_order() if payment_totals.is_amount(column) and column not in balances]
+        to_decimal = payment_totals.money.to_decimal
+        to_decimals = lambda totals: {column: to_decimal(total) for column, total in totals.items()}
+        annual_totals = {year: to_decimals(totals) for year, totals in payment_totals.annual_totals(columns).items()}
+        return PaymentAggregates(summary, to_decimals(payment_totals.totals(columns)), annual_totals)
+    
+    def _summarize_totals(self, start: FinancialDate, finances: Finances, wallet: Wallet, payment_totals: PaymentTotals) -> SimulationSummary:
+        overextension = None
+        self._start_run()
+        try:
+            self._simulate(start, finances, wallet, payment_totals, self._horizon)
+        except Overextension as exception:
+            overextension = exception
+        return self.summarize_payment_plan(start, payment_totals, wallet, overextension is not None)
+    
+    def summarize_payment_plan(self, start: FinancialDate, payment_plan: PaymentPlan, wallet: Wallet, overextension: bool = False) -> SimulationSummary:
+        # Summarizes the plan the strategy has just recorded, either kept in full or as totals
+        money = payment_plan.money
+        unscheduled = sum(payment_plan.total(mortgage.columns()[3]) for mortgage in self._mortgages_history)
+        min_wallet = payment_plan.minimum('Wallet') if payment_plan.rows else wallet._current_amount
+        if overextension:
+            min_wallet = min(min_wallet, wallet._current_amount)
+        return SimulationSummary(start, payment_plan.rows, money.to_decimal(payment_plan.total('Interest Sum')), money.to_decimal(unscheduled),
+                                 money.to_decimal(min_wallet), not self._is_active, overextension)
+    
+    def _start_run(self) -> None:
+        # State copies share the rates and parameter sets with the definitions, so a run only copies the current state
+        self._mortgages = [mortgage._state_copy() for mortgage in self._definitions]
+        self._mortgages_history = list(self._mortgages)
+    
+    def _checkpoint(self, month: int, when: FinancialDate, wallet: Wallet, payment_plan: PaymentPlan) -> None:
+        history = [mortgage._state_copy() for mortgage in self._mortgages_history]
+        positions = {id(mortgage): index for index, mortgage in enumerate(self._mortgages_history)}
+        active = [positions[id(mortgage)] for mortgage in self._mortgages]
+        self._checkpoints.append(SimulationCheckpoint(month, when, self._money, wallet._current_amount, history, active, payment_plan.rows))
+    
+    def _simulate(self, start: FinancialDate, finances: Finances, wallet: Wallet, payment_plan: PaymentPlan, months: int,
+                  checkpoint_interval: ty.Optional[int] = None, first_month: int = 0) -> None:
+        for _ in self._simulate_months(start, finances, wallet, payment_plan, months, checkpoint_interval, first_month):
+            pass
+    
+    def _simulate_months(self, start: FinancialDate, finances: Finances, wallet: Wallet, payment_plan: PaymentPlan, months: int,
+                         checkpoint_interval: ty.Optional[int] = None, first_month: int = 0) -> ty.Iterator[int]:
+        # Yields every month once its row has been recorded, fast-forwarded months are not yielded
+        self._money = money = payment_plan.money
+        wallet.bind_money(money)
+        wallet._reserve_saving_targets(start.ordinal, start.ordinal + months)
+        for mortgage in self._mortgages:
+            mortgage.bind_money(money)
+        
+        timeline = finances.timeline(start, months, money)
+        
+        date_column = payment_plan.column('Date')
+        month_column = payment_plan.column('Month', 0, np.int64)
+        delta_column = payment_plan.column('Delta')
+        wallet_column = payment_plan.amount_column('Wallet')
+        income_column = payment_plan.amount_column('Income')
+        expense_column = payment_plan.amount_column('Expense')
+        balance_column = payment_plan.amount_column('Balance')
+        self._sum_columns = [payment_plan.amount_column(column) for column in ('Interest Sum', 'Mortgage Sum', 'Payment Sum')]
+        for mortgage in self._mortgages:
+            mortgage._columns_of(payment_plan)
+        calendar = EventCalendar(start, months, self._mortgages) if isinstance(payment_plan, PaymentTotals) else None
+        
+        # The fast-forward is not attempted in months with a certain unscheduled payment, failed attempts are retried after
+        # a doubling gap, bounded by the next change of a mortgage and by the next January, when the unscheduled payments
+        # of the mortgages are possible again
+        retry_month, retry_gap = first_month, 1
+        month = first_month
+        while month < months:
             current_date = start + FinancialDelta(months=month)
+            if checkpoint_interval and month % checkpoint_interval == 0 and month != first_month:
+                self._checkpoint(month, current_date, wallet, payment_plan)
             
             for mortgage in self._mortgages:
                 mortgage.update_current_date(current_date)
@@ -37,47 +258,174 @@ class PaybackStrategy(abc.ABC):
             if not self._is_active:
                 break
             
+            if calendar is not None and retry_month <= month and not self._unscheduled_payment_due(current_date, month, timeline, wallet):
+                skipped_months = self._fast_forward(current_date, month, calendar, timeline, wallet, payment_plan)
+                if skipped_months:
+                    retry_month, retry_gap = month + skipped_months, 1
+                    month += skipped_months
+                    continue
+                next_january = month + ((-current_date.ordinal) % 12 or 12)
+                retry_month = min(month + retry_gap, calendar.next_change(month, MORTGAGE_EVENTS), next_january)
+                retry_gap *= 2
+            
             # Start a new row
             payment_plan.start_of_row()
             
             # Record income, expense and balance
             y, m = divmod(month, 12)
-            payment_plan.record('Date', current_date)
-            payment_plan.record('Month', int(month))
-            payment_plan.record('Delta', f'{y:02d}\'{m:02d}\'\'')
-            payment_plan.record('Wallet', wallet.current_amount)
-            payment_plan.record('Income', finances.get_effective_income_value(current_date))
-            payment_plan.record('Expense', finances.get_effective_expense_value(current_date))
-            payment_plan.record('Balance', finances.get_effective_balance(current_date))
+            date_column.record(current_date)
+            month_column.record(month)
+            delta_column.record(f'{y:02d}\'{m:02d}\'\'')
+            wallet_column.record(wallet._current_amount)
+            snapshot = timeline.snapshot(month)
+            income_column.record(snapshot.income)
+            expense_column.record(snapshot.expense)
+            balance_column.record(snapshot.balance)
             
-            wallet += finances.get_effective_balance(current_date)
+            wallet.book(snapshot)
             
             # Execute payments
             self._payback(current_date, payment_plan, wallet)
+            yield month
             
-            if wallet.current_amount < Decimal(0):
-                raise Exception(f'Overextension: {wallet.current_amount}')
+            if wallet._current_amount < 0:
+                raise Overextension(wallet.current_amount)
+            month += 1
+    
+    @staticmethod
+    def _column_sums(columns: ty.List[ty.List[ty.Any]], count: int) -> ty.List[ty.Any]:
+        if len(columns) == 0:
+            return [0] * count
+        return [sum(values) for values in zip(*columns)]
+    
+    def _unscheduled_payment_due(self, current_date: FinancialDate, month: int, timeline: FinancesTimeline, wallet: Wallet) -> bool:
+        # True if an unscheduled payment is certainly possible this month, which is checked without any stretch: no mortgage
+        # is charged more than its monthly amount, and a mortgage owing more than its monthly amount still owes afterwards
+        money = self._money
+        lowest_wallet = wallet._current_amount + timeline.balance[month]
+        candidates = list()
+        for mortgage in self._mortgages:
+            if not self._is_valid_mortgage(current_date, mortgage) or mortgage._current_amount == 0:
+                continue
+            monthly_amount = mortgage._current_month_state()[2]
+            lowest_wallet -= monthly_amount
+            if monthly_amount < mortgage._current_amount:
+                candidates.append(mortgage)
         
-        column_order = ['Date', 'Month', 'Delta', 'Wallet', 'Income', 'Expense', 'Balance', 'Interest Sum', 'Mortgage Sum', 'Payment Sum']
-        for mortgage in self._mortgages_history:
-            column_order += mortgage.columns()
+        # The minimum values are only computed while no candidate has been found
+        surplus = max(0, lowest_wallet - wallet._saving_policy_value_at(current_date.ordinal))
+        for mortgage in candidates:
+            monthly_amount = mortgage._current_month_state()[2]
+            if not money.is_negligible(mortgage._current_amount - monthly_amount) and not mortgage._unscheduled_payments_exhausted() \
+                    and mortgage.repayment_parameter_set.min_value(mortgage._initial_amount, money) <= surplus:
+                return True
+        return False
+    
+    def _fast_forward(self, current_date: FinancialDate, month: int, calendar: EventCalendar, timeline: FinancesTimeline, wallet: Wallet,
+                      payment_totals: PaymentTotals) -> int:
+        # Jumps over the months in which every mortgage follows its plain annuity, that is no rate changes, no follow-ups,
+        # no mortgage becomes valid and the surplus is too low for any unscheduled payment. Returns the skipped months.
+        ordinal = current_date.ordinal
+        valid_mortgages = [mortgage for mortgage in self._mortgages if self._is_valid_mortgage(current_date, mortgage)]
+        if any(mortgage.valid_until is not None and mortgage.valid_until <= current_date and mortgage._current_amount != 0 for mortgage in valid_mortgages):
+            return 0
+        count = calendar.stable_months(month, MORTGAGE_EVENTS)
+        if count < 2:
+            return 0
         
-        return payment_plan.result[column_order]
+        # Mortgages which have exhausted their unscheduled payments of the year cannot pay before the next January
+        money = self._money
+        january = (-ordinal) % 12 or 12
+        min_values = [mortgage.repayment_parameter_set.min_value(mortgage._initial_amount, money) if mortgage.repayment_parameter_set is not None else None
+                      for mortgage in valid_mortgages]
+        exhausted = [mortgage._unscheduled_payments_exhausted() for mortgage in valid_mortgages]
+        
+        idle = all(mortgage._current_amount == 0 for mortgage in self._mortgages if mortgage not in valid_mortgages)
+        
+        # The stretches are computed for a growing window, most attempts stop within the first months
+        balance = timeline.balance
+        window = min(count, 12)
+        while True:
+            stretches = [mortgage._annuity_stretch(window) for mortgage in valid_mortgages]
+            wallets = list()
+            current_amount = wallet._current_amount
+            stop = None
+            for index in range(window):
+                wallets.append(current_amount)
+                current_amount += balance[month + index]
+                for stretch in stretches:
+                    current_amount -= stretch[2][index]
+                if current_amount < 0:
+                    # The regular step raises the Overextension
+                    stop = index
+                    break
+                
+                # Stop before a month in which an unscheduled payment could be executed
+                min_value = min((value for value, is_exhausted, stretch in zip(min_values, exhausted, stretches)
+                                 if value is not None and not (is_exhausted and index < january) and 0 < stretch[3][index]), default=None)
+                if min_value is not None and min_value <= max(0, current_amount - wallet._saving_policy_value_at(ordinal + index)):
+                    stop = index
+                    break
+                
+                if idle and all(stretch[3][index] == 0 for stretch in stretches):
+                    stop = index + 1
+                    wallets.append(current_amount)
+                    break
+            else:
+                wallets.append(current_amount)
+            if stop is not None or window == count:
+                count = stop if stop is not None else window
+                break
+            window = min(count, window * 4)
+        if count < 1:
+            return 0
+        
+        # Advance the mortgages and the wallet to the last skipped month
+        initial_amounts = [mortgage._current_amount for mortgage in valid_mortgages]
+        for mortgage in self._mortgages:
+            mortgage._skip_months(count - 1, mortgage._current_amount)
+        for mortgage, stretch in zip(valid_mortgages, stretches):
+            mortgage._current_amount = stretch[3][count - 1]
+        wallet._current_amount = wallets[count]
+        
+        last_month = month + count - 1
+        y, m = divmod(last_month, 12)
+        values = {
+            payment_totals.column('Date'): [FinancialDate.from_ordinal(ordinal + count - 1)],
+            payment_totals.column('Month'): [last_month],
+            payment_totals.column('Delta'): [f'{y:02d}\'{m:02d}\'\''],
+            payment_totals.amount_column('Wallet'): wallets[:count],
+            payment_totals.amount_column('Income'): timeline.income[month:month + count],
+            payment_totals.amount_column('Expense'): timeline.expense[month:month + count],
+            payment_totals.amount_column('Balance'): balance[month:month + count],
+        }
+        interest_sum_column, mortgage_sum_column, payment_sum_column = self._sum_columns
+        values[interest_sum_column] = self._column_sums([stretch[0][:count] for stretch in stretches], count)
+        values[mortgage_sum_column] = self._column_sums([[amount] + stretch[3][:count - 1] for amount, stretch in zip(initial_amounts, stretches)], count)
+        values[payment_sum_column] = self._column_sums([stretch[1][:count] for stretch in stretches], count)
+        for mortgage, stretch in zip(valid_mortgages, stretches):
+            interest_column, payback_column, amount_column, _ = mortgage._columns_of(payment_totals)
+            values[interest_column] = stretch[0][:count]
+            values[payback_column] = stretch[1][:count]
+            values[amount_column] = stretch[3][:count]
+        payment_totals.skip_rows(count, values)
+        return count
     
     @abc.abstractmethod
     def _unscheduled_payments_order(self, mortgages: ty.List[Mortgage]) -> ty.List[Mortgage]:
         return None
             
-    def _payback(self, current_date: FinancialDate, payment_plan: PaymentPlan, wallet: Wallet) -> None:
+    def _replace_expired_mortgages(self, current_date: FinancialDate, payment_plan: PaymentPlan) -> None:
         # Replace mortgage if it is no more valid
         del_indices = []
         for index, mortgage in enumerate(self._mortgages):
-            if mortgage.valid_until is None or current_date < mortgage.valid_until or mortgage.current_amount == Decimal(0):
+            if mortgage.valid_until is None or current_date < mortgage.valid_until or mortgage._current_amount == 0:
                 continue
             del_indices.append(index)
             new_mortgage = mortgage.create_follow_up(payment_plan)
             if new_mortgage is None:
                 continue
+            new_mortgage.bind_money(self._money)
             new_mortgage.update_current_date(current_date)
             self._mortgages.append(new_mortgage)
             self._mortgages_history.append(new_mortgage)
@@ -85,26 +433,34 @@ class PaybackStrategy(abc.ABC):
         # Remove obsolete mortgages
         for index in sorted(del_indices, reverse=True):
             del self._mortgages[index]
-        
-        # Get only the valid mortgages
-        valid_mortgages = [mortgage for mortgage in self._mortgages if self._is_valid_mortgage(current_date, mortgage)]
-        
+
+    def _record_sums(self, valid_mortgages: ty.List[Mortgage]) -> None:
         # Sum monthly payment
-        interest_sum = sum(mortgage.interest_value for mortgage in valid_mortgages)
-        payment_plan.record('Interest Sum', interest_sum, 0)
+        interest_sum_column, mortgage_sum_column, payment_sum_column = self._sum_columns
+        interest_sum = sum(mortgage._interest_value() for mortgage in valid_mortgages)
+        interest_sum_column.record(interest_sum)
         
-        mortgage_sum = sum(mortgage.current_amount for mortgage in valid_mortgages)
-        payment_plan.record('Mortgage Sum', mortgage_sum, 0)
+        mortgage_sum = sum(mortgage._current_amount for mortgage in valid_mortgages)
+        mortgage_sum_column.record(mortgage_sum)
         
-        payment_sum = sum(mortgage.monthly_payment.payback_value for mortgage in valid_mortgages)
-        payment_plan.record('Payment Sum', payment_sum, 0)
-                
+        payment_sum = sum(mortgage._monthly_payment().payback_value for mortgage in valid_mortgages)
+        payment_sum_column.record(payment_sum)
+
+    def _execute_paybacks(self, valid_mortgages: ty.List[Mortgage], payment_plan: PaymentPlan, wallet: Wallet) -> None:
         # Pay mortgage if needed
         for mortgage in valid_mortgages:
             mortgage.execute_payback(payment_plan, wallet)
-            
-        # Unscheduled payments
+
+    def _execute_unscheduled_payments(self, valid_mortgages: ty.List[Mortgage], payment_plan: PaymentPlan, wallet: Wallet) -> None:
         for mortgage in self._unscheduled_payments_order(valid_mortgages):
             mortgage.execute_unscheduled_payment(payment_plan, wallet)
+
+    def _payback(self, current_date: FinancialDate, payment_plan: PaymentPlan, wallet: Wallet) -> None:
+        # The phases are separate methods, so the instrumentation can time them one by one
+        self._replace_expired_mortgages(current_date, payment_plan)
+        valid_mortgages = [mortgage for mortgage in self._mortgages if self._is_valid_mortgage(current_date, mortgage)]
+        self._record_sums(valid_mortgages)
+        self._execute_paybacks(valid_mortgages, payment_plan, wallet)
+        self._execute_unscheduled_payments(valid_mortgages, payment_plan, wallet)
         
 
@@ -0,0 +1,51 @@
+from mortgage_sim.SimulationSummary import SimulationSummary
+
+
+import typing as ty
+from decimal import Decimal
+
+if ty.TYPE_CHECKING:
+    import pandas as pd
+
+
+class PaymentAggregates(object):
+    # Sums of the payment flows per calendar year and over the whole run, next to the summary of the run.
+    # Balances like the wallet or the mortgage amounts are not summed.
+    def __init__(self, summary: SimulationSummary, totals: ty.Dict[str, ty.Any], annual_totals: ty.Dict[int, ty.Dict[str, ty.Any]]) -> None:
+        self._summary: SimulationSummary = summary
+        self._totals: ty.Dict[str, ty.Any] = totals
+        self._annual_totals: ty.Dict[int, ty.Dict[str, ty.Any]] = annual_totals
+
+    @property
+    def summary(self) -> SimulationSummary:
+        return self._summary
+
+    @property
+    def columns(self) -> ty.List[str]:
+        return list(self._totals)
+
+    @property
+    def years(self) -> ty.List[int]:
+        return list(self._annual_totals)
+
+    @property
+    def totals(self) -> ty.Dict[str, Decimal]:
+        return self._totals
+
+    @property
+    def annual_totals(self) -> ty.Dict[int, ty.Dict[str, Decimal]]:
+        return self._annual_totals
+
+    def year(self, year: int) -> ty.Dict[str, Decimal]:
+        totals = self._annual_totals.get(year, None)
+        if totals is None:
+            raise ValueError(f'{year} is not within the years {self.years}')
+        return totals
+
+    def to_frame(self) -> 'pd.DataFrame':
+        import pandas as pd
+
+        return pd.DataFrame.from_dict(self._annual_totals, orient='index', columns=self.columns)
+
+    def __repr__(self) -> str:
+        return f'<{__name__} years={self.years[:1] + self.years[-1:]} columns={self.columns}>'
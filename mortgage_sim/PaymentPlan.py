@@ -1,54 +1,164 @@
-from decimal import Decimal
+from mortgage_sim.DecimalMoney import DecimalMoney
+from mortgage_sim.Money import Money
 
 import numpy as np
-import pandas as pd
 import typing as ty
 
+if ty.TYPE_CHECKING:
+    import pandas as pd
 
-class PaymentPlan(object):    
-    class _Column(object):
-        def __init__(self, name: str, default_value: ty.Any, values: ty.List[ty.Any]) -> None:
+
+class PaymentPlan(object):
+    class Column(object):
+        def __init__(self, payment_plan: 'PaymentPlan', name: str, default_value: ty.Any, dtype: ty.Any) -> None:
+            self._payment_plan: PaymentPlan = payment_plan
             self._name: str = name
             self._default_value: ty.Any = default_value
-            self._values: ty.List[ty.Any] = values
-            
+            self._values: np.ndarray = np.full(payment_plan.capacity, default_value, dtype=dtype)
+
         @property
         def name(self) -> str:
             return self._name
-            
+
         @property
         def default_value(self) -> ty.Any:
             return self._default_value
-            
+
         @property
-        def values(self) -> ty.List[ty.Any]:
-            return self._values
-        
-        def start_of_row(self):
-            self._values.append(self._default_value)
-            
-        def record(self, value: ty.Any):
-            self._values[-1] = value
-        
-    def __init__(self) -> None:
-        self._columns: ty.Dict[str, PaymentPlan._Column] = dict()
+        def values(self) -> np.ndarray:
+            return self._values[:self._payment_plan.rows]
+
+        def grow(self, capacity: int) -> None:
+            values = np.full(capacity, self._default_value, dtype=self._values.dtype)
+            values[:len(self._values)] = self._values
+            self._values = values
+
+        def record(self, value: ty.Any) -> None:
+            self._values[self._payment_plan._row_index] = value
+
+    def __init__(self, money: ty.Optional[Money] = None, capacity: int = 0) -> None:
+        self._money: Money = money or DecimalMoney()
+        self._columns: ty.Dict[str, PaymentPlan.Column] = dict()
+        self._amount_columns: ty.Set[str] = set()
+        self._capacity: int = max(capacity, 1)
         self._row_index: int = -1
-                
+
+    @classmethod
+    def from_columns(cls, money: Money, columns: ty.Mapping[str, ty.Sequence[ty.Any]], amount_columns: ty.Iterable[str] = ()) -> 'PaymentPlan':
+        # Builds a plan from whole columns of equal length, amounts in the representation of the money. Integer arrays
+        # keep their dtype, other values are kept as objects.
+        amount_columns = set(amount_columns)
+        rows = {len(values) for values in columns.values()}
+        if 1 < len(rows):
+            raise ValueError(f'columns must have the same length but have the lengths {sorted(rows)}')
+        rows = rows.pop() if rows else 0
+        payment_plan = cls(money, rows)
+        for column_name, values in columns.items():
+            if column_name in amount_columns:
+                column = payment_plan.amount_column(column_name)
+            elif isinstance(values, np.ndarray) and values.dtype.kind == 'i':
+                column = payment_plan.column(column_name, values.dtype.type(0), values.dtype)
+            else:
+                column = payment_plan.column(column_name)
+            column._values[:rows] = values
+        payment_plan._row_index = rows - 1
+        return payment_plan
+
+    @property
+    def money(self) -> Money:
+        return self._money
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def rows(self) -> int:
+        return self._row_index + 1
+
+    @property
+    def column_names(self) -> ty.List[str]:
+        return list(self._columns.keys())
+
+    def is_amount(self, column_name: str) -> bool:
+        return column_name in self._amount_columns
+
     def start_of_row(self):
+        # Buffers are filled with their defaults up front, so a new row only has to fit
         self._row_index += 1
+        if self._row_index < self._capacity:
+            return
+        self._capacity *= 2
         for column in self._columns.values():
-            column.start_of_row()
-        
-    def record(self, column_name: str, value: ty.Any, default_value: ty.Optional[ty.Any] = None):
+            column.grow(self._capacity)
+
+    def copy(self, rows: ty.Optional[int] = None) -> 'PaymentPlan':
+        # Copies the first rows, the copy continues recording after them
+        rows = self.rows if rows is None else rows
+        payment_plan = PaymentPlan(self._money, self._capacity)
+        payment_plan._amount_columns = set(self._amount_columns)
+        for column_name, column in self._columns.items():
+            copied_column = PaymentPlan.Column(payment_plan, column_name, column.default_value, column._values.dtype)
+            copied_column._values[:rows] = column._values[:rows]
+            payment_plan._columns[column_name] = copied_column
+        payment_plan._row_index = rows - 1
+        return payment_plan
+
+    def column(self, column_name: str, default_value: ty.Optional[ty.Any] = None, dtype: ty.Any = object) -> 'PaymentPlan.Column':
+        column = self._columns.get(column_name, None)
+        if column is None:
+            self._columns[column_name] = column = PaymentPlan.Column(self, column_name, default_value, dtype)
+        return column
+
+    def amount_column(self, column_name: str) -> 'PaymentPlan.Column':
+        if column_name in self._amount_columns:
+            return self._columns[column_name]
+
+        self._amount_columns.add(column_name)
+        column = PaymentPlan.Column(self, column_name, self._money.zero, self._money.dtype)
+        existing = self._columns.get(column_name, None)
+        if existing is not None:
+            # Values recorded before the column was known as an amount column
+            zero = self._money.zero
+            column._values[:self.rows] = [self._money.coerce(value) if value is not None else zero for value in existing.values]
+        self._columns[column_name] = column
+        return column
+
+    def _check_row(self):
         if self._row_index < 0:
             raise ValueError('Row Index is -1. Please call start_of_row first.')
+
+    def record(self, column_name: str, value: ty.Any, default_value: ty.Optional[ty.Any] = None):
+        self._check_row()
+        if column_name in self._amount_columns:
+            value = self._money.coerce(value)
+        self.column(column_name, default_value).record(value)
+
+    def record_amount(self, column_name: str, amount: ty.Any):
+        self._check_row()
+        self.amount_column(column_name).record(amount)
+
+    def total(self, column_name: str) -> ty.Any:
+        if column_name not in self._amount_columns:
+            return self._money.zero
+        return sum(self._columns[column_name].values.tolist(), self._money.zero)
+
+    def minimum(self, column_name: str) -> ty.Any:
+        return min(self._columns[column_name].values.tolist())
+
+    def to_frame(self, columns: ty.Optional[ty.List[str]] = None, numeric: bool = False) -> 'pd.DataFrame':
+        import pandas as pd
         
-        if column_name not in self._columns.keys():
-            self._columns[column_name] = PaymentPlan._Column(column_name, default_value, [default_value for _ in range(0, self._row_index + 1)])
-        
-        self._columns[column_name].record(value)
-        
-    @property
-    def result(self) -> pd.DataFrame:
-        return pd.DataFrame({key: column.values for key, column in self._columns.items()})
+        # Columns are handed to pandas without copying, amounts are only converted if their representation differs,
+        # so numeric frames of CentsMoney and Decimal frames of DecimalMoney need no conversion at all
+        frame = dict()
+        for key in columns if columns is not None else self._columns.keys():
+            values = self._columns[key].values
+            if key in self._amount_columns:
+                values = self._money.to_cents_array(values) if numeric else self._money.to_decimal_array(values)
+            frame[key] = values
+        return pd.DataFrame(frame, copy=False)
 
+    @property
+    def result(self) -> 'pd.DataFrame':
+        return self.to_frame()
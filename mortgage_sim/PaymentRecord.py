@@ -0,0 +1,62 @@
+from mortgage_sim.FinancialDate import FinancialDate
+
+
+import typing as ty
+from decimal import Decimal
+
+
+class PaymentRecord(object):
+    # One simulated month, i.e. one row of the payment plan. Records of the same columns share the column index.
+    __slots__ = ('_index', '_values')
+
+    def __init__(self, index: ty.Dict[str, int], values: ty.Tuple[ty.Any, ...]) -> None:
+        self._index: ty.Dict[str, int] = index
+        self._values: ty.Tuple[ty.Any, ...] = values
+
+    @property
+    def columns(self) -> ty.List[str]:
+        return list(self._index)
+
+    @property
+    def values(self) -> ty.Tuple[ty.Any, ...]:
+        return self._values
+
+    @property
+    def date(self) -> FinancialDate:
+        return self['Date']
+
+    @property
+    def month(self) -> int:
+        return self['Month']
+
+    @property
+    def wallet(self) -> Decimal:
+        return self['Wallet']
+
+    @property
+    def income(self) -> Decimal:
+        return self['Income']
+
+    @property
+    def expense(self) -> Decimal:
+        return self['Expense']
+
+    @property
+    def balance(self) -> Decimal:
+        return self['Balance']
+
+    @property
+    def mortgage_sum(self) -> Decimal:
+        return self['Mortgage Sum']
+
+    def __getitem__(self, column: str) -> ty.Any:
+        return self._values[self._index[column]]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._index
+
+    def as_dict(self) -> ty.Dict[str, ty.Any]:
+        return dict(zip(self._index, self._values))
+
+    def __repr__(self) -> str:
+        return f'<{__name__} date={self.date} wallet={self.wallet} mortgage_sum={self.mortgage_sum}>'
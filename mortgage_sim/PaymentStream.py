@@ -0,0 +1,40 @@
+from mortgage_sim.Money import Money
+from mortgage_sim.PaymentPlan import PaymentPlan
+
+import typing as ty
+
+
+class PaymentStream(PaymentPlan):
+    # Keeps only the current row, every new row starts from the defaults. The memory does not grow with the months.
+    def __init__(self, money: ty.Optional[Money] = None) -> None:
+        super().__init__(money, 1)
+        self._rows: int = 0
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def start_of_row(self):
+        self._row_index = 0
+        self._rows += 1
+        for column in self._columns.values():
+            column._values[0] = column.default_value
+
+    def value(self, column_name: str) -> ty.Any:
+        column = self._columns.get(column_name, None)
+        if column is None or self._rows == 0:
+            return None
+        # As a Python value, e.g. an int instead of a numpy integer
+        return column._values[:1].tolist()[0]
+
+    def copy(self, rows: ty.Optional[int] = None) -> 'PaymentPlan':
+        raise ValueError(f'{__name__} does not keep its rows')
+
+    def total(self, column_name: str) -> ty.Any:
+        raise ValueError(f'{__name__} does not keep totals')
+
+    def minimum(self, column_name: str) -> ty.Any:
+        raise ValueError(f'{__name__} does not keep minimums')
+
+    def to_frame(self, columns: ty.Optional[ty.List[str]] = None, numeric: bool = False) -> ty.Any:
+        raise ValueError(f'{__name__} does not keep per-month values')
@@ -0,0 +1,147 @@
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Money import Money
+from mortgage_sim.PaymentPlan import PaymentPlan
+
+import typing as ty
+
+
+class PaymentTotals(PaymentPlan):
+    # Keeps only the current row of every column and folds amount columns into running totals and minimums
+    class Column(PaymentPlan.Column):
+        def __init__(self, payment_plan: 'PaymentTotals', name: str, default_value: ty.Any) -> None:
+            self._payment_plan: PaymentTotals = payment_plan
+            self._name: str = name
+            self._default_value: ty.Any = default_value
+            self._value: ty.Any = default_value
+            self._total: ty.Any = default_value
+            self._minimum: ty.Any = None
+
+        @property
+        def values(self) -> ty.Any:
+            raise ValueError(f'{__name__} does not keep the values of {self._name}')
+
+        @property
+        def value(self) -> ty.Any:
+            return self._value
+
+        @property
+        def total(self) -> ty.Any:
+            return self._total + self._value
+
+        @property
+        def minimum(self) -> ty.Any:
+            if self._minimum is None or self._value < self._minimum:
+                return self._value
+            return self._minimum
+
+        def grow(self, capacity: int) -> None:
+            pass
+
+        def fold_values(self, values: ty.List[ty.Any]) -> None:
+            # The last value stays pending like a value recorded in the current row
+            if len(values) > 1:
+                self._total += sum(values[:-1])
+                minimum = min(values[:-1])
+                if self._minimum is None or minimum < self._minimum:
+                    self._minimum = minimum
+            self._value = values[-1]
+            
+        def fold(self) -> None:
+            value = self._value
+            self._total += value
+            if self._minimum is None or value < self._minimum:
+                self._minimum = value
+            self._value = self._default_value
+
+        def record(self, value: ty.Any) -> None:
+            self._value = value
+
+    def __init__(self, money: ty.Optional[Money] = None, start: ty.Optional[FinancialDate] = None) -> None:
+        super().__init__(money)
+        self._folded_columns: ty.List[PaymentTotals.Column] = list()
+        # With the date of the first row the totals are also kept per calendar year. The totals of every column
+        # are remembered at the start of the current year and a year is closed with their differences.
+        self._first_ordinal: ty.Optional[int] = start.ordinal if start is not None else None
+        self._year: ty.Optional[int] = None
+        self._year_bases: ty.Dict[str, ty.Any] = dict()
+        self._annual_totals: ty.Dict[int, ty.Dict[str, ty.Any]] = dict()
+
+    def _current_year_totals(self, pending: bool) -> ty.Dict[str, ty.Any]:
+        zero = self._money.zero
+        return {column.name: (column.total if pending else column._total) - self._year_bases.get(column.name, zero) for column in self._folded_columns}
+
+    def start_of_row(self):
+        if 0 <= self._row_index:
+            for column in self._folded_columns:
+                column.fold()
+        self._row_index += 1
+        if self._first_ordinal is not None:
+            year = (self._first_ordinal + self._row_index) // 12
+            if year != self._year:
+                if self._year is not None:
+                    self._annual_totals[self._year] = self._current_year_totals(False)
+                    self._year_bases = {column.name: column._total for column in self._folded_columns}
+                self._year = year
+
+    def skip_rows(self, count: int, values: ty.Dict['PaymentTotals.Column', ty.List[ty.Any]]) -> None:
+        # Records count rows at once, columns without values keep their default. With annual totals the rows
+        # are recorded year by year.
+        offset = 0
+        while offset < count:
+            length = count - offset
+            if self._first_ordinal is not None:
+                length = min(length, 12 - (self._first_ordinal + self._row_index + 1) % 12)
+            self.start_of_row()
+            self._row_index += length - 1
+            for column in self._columns.values():
+                column_values = values.get(column, None)
+                if column in self._folded_columns:
+                    column.fold_values(column_values[offset:offset + length] if column_values is not None else [column.default_value] * length)
+                else:
+                    column.record(column_values[-1] if column_values is not None else column.default_value)
+            offset += length
+    
+    def column(self, column_name: str, default_value: ty.Optional[ty.Any] = None, dtype: ty.Any = object) -> 'PaymentTotals.Column':
+        column = self._columns.get(column_name, None)
+        if column is None:
+            self._columns[column_name] = column = PaymentTotals.Column(self, column_name, default_value)
+        return column
+
+    def amount_column(self, column_name: str) -> 'PaymentTotals.Column':
+        if column_name in self._amount_columns:
+            return self._columns[column_name]
+
+        self._amount_columns.add(column_name)
+        column = PaymentTotals.Column(self, column_name, self._money.zero)
+        existing = self._columns.get(column_name, None)
+        if existing is not None and existing.value is not None:
+            column.record(self._money.coerce(existing.value))
+        self._columns[column_name] = column
+        self._folded_columns.append(column)
+        return column
+
+    def total(self, column_name: str) -> ty.Any:
+        if column_name not in self._amount_columns:
+            return self._money.zero
+        return self._columns[column_name].total
+
+    def minimum(self, column_name: str) -> ty.Any:
+        return self._columns[column_name].minimum
+
+    def totals(self, columns: ty.Optional[ty.Iterable[str]] = None) -> ty.Dict[str, ty.Any]:
+        columns = columns if columns is not None else [column.name for column in self._folded_columns]
+        return {column: self.total(column) for column in columns}
+
+    def annual_totals(self, columns: ty.Optional[ty.Iterable[str]] = None) -> ty.Dict[int, ty.Dict[str, ty.Any]]:
+        # Totals per calendar year including the current one, columns which did not exist yet in a year are zero
+        if self._first_ordinal is None:
+            raise ValueError(f'{__name__} keeps annual totals only if it knows the date of its first row')
+        annual_totals = dict(self._annual_totals)
+        if self._year is not None:
+            annual_totals[self._year] = self._current_year_totals(True)
+        columns = list(columns) if columns is not None else [column.name for column in self._folded_columns]
+        zero = self._money.zero
+        return {year: {column: totals.get(column, zero) for column in columns} for year, totals in annual_totals.items()}
+
+    def to_frame(self, columns: ty.Optional[ty.List[str]] = None, numeric: bool = False) -> ty.Any:
+        raise ValueError(f'{__name__} does not keep per-month values')
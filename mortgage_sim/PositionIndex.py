@@ -0,0 +1,63 @@
+from mortgage_sim.FinancialPosition import FinancialPosition
+from mortgage_sim.TemporalCollection import TemporalCollection
+
+
+import typing as ty
+
+
+# A position is due within [start, end) in the months of its phase, keyed by its order in the collection
+Interval = ty.Tuple[int, int, int, FinancialPosition]
+
+
+class PositionIndex(object):
+    # Buckets the positions of a collection by their recurrence period and phase (month mod period), one-off positions
+    # by their month. A lookup only visits the positions paid in that month. The index follows the revision of the collection.
+    def __init__(self, collection: TemporalCollection[FinancialPosition]) -> None:
+        self._collection: TemporalCollection[FinancialPosition] = collection
+        self._revision: ty.Optional[int] = None
+        self._one_off: ty.Dict[int, ty.List[Interval]] = dict()
+        self._recurring: ty.Dict[int, ty.Dict[int, ty.List[Interval]]] = dict()
+
+    def _refresh(self) -> None:
+        if self._revision == self._collection.revision:
+            return
+
+        one_off, recurring = dict(), dict()
+        for order, temporal_value in enumerate(self._collection.temporal_values()):
+            changes = list(temporal_value.ordinal_items())
+            for index, (key, position) in enumerate(changes):
+                if position is None:
+                    continue
+                end = changes[index + 1][0] if index + 1 < len(changes) else None
+                when = position.when.ordinal
+                if position.recurrence is None:
+                    if key <= when and (end is None or when < end):
+                        one_off.setdefault(when, list()).append((when, when + 1, order, position))
+                    continue
+                period = abs(position.recurrence.months)
+                if period == 0:
+                    continue
+                start = max(key, when)
+                if end is None or start < end:
+                    recurring.setdefault(period, dict()).setdefault(when % period, list()).append((start, end, order, position))
+
+        self._one_off = one_off
+        self._recurring = recurring
+        self._revision = self._collection.revision
+
+    def positions_at(self, ordinal: int) -> ty.List[FinancialPosition]:
+        # Positions paid in the month, in the order of the collection
+        self._refresh()
+        intervals = list(self._one_off.get(ordinal, ()))
+        for period, phases in self._recurring.items():
+            for interval in phases.get(ordinal % period, ()):
+                start, end = interval[0], interval[1]
+                if start <= ordinal and (end is None or ordinal < end):
+                    intervals.append(interval)
+        if len(intervals) > 1:
+            intervals.sort(key=lambda interval: interval[2])
+        return [interval[3] for interval in intervals]
+
+    def __repr__(self) -> str:
+        self._refresh()
+        return f'<{__name__} one_off={len(self._one_off)} periods={sorted(self._recurring)}>'
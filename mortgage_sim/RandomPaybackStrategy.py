@@ -1,11 +1,17 @@
 from mortgage_sim.FinancialDate import FinancialDate
 from mortgage_sim.Mortgage import Mortgage
-from mortgage_sim.PaybackStrategy import PaybackStrategy
+from mortgage_sim.PaybackStrategy import HORIZON, PaybackStrategy
 
 import random
 import typing as ty
 
 
 class RandomPaybackStrategy(PaybackStrategy):
+    deterministic: bool = False
+    
+    def __init__(self, mortgages: ty.List[Mortgage], rng: ty.Optional[random.Random] = None, horizon: int = HORIZON) -> None:
+        super().__init__(mortgages, horizon)
+        self._rng: random.Random = rng or random.Random()
+        
     def _unscheduled_payments_order(self, mortgages: ty.List[Mortgage]) -> ty.List[Mortgage]:
-        return sorted(mortgages, key=lambda _: (random.randint(0, len(mortgages)), random.randint(0, len(mortgages))))
\ No newline at end of file
+        return sorted(mortgages, key=lambda _: (self._rng.randint(0, len(mortgages)), self._rng.randint(0, len(mortgages))))
\ No newline at end of file
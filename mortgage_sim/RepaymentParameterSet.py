@@ -1,6 +1,8 @@
+from mortgage_sim.Money import Money
 from mortgage_sim.types import Number, Percentage, as_decimal
 
 
+import typing as ty
 from decimal import Decimal
 
 
@@ -10,12 +12,20 @@ class RepaymentParameterSet(object):
         self._max_value: Number | Percentage = max_value
         self._payments_per_year: int = payments_per_year
 
-    def min_value(self, amount: Decimal) -> Decimal:
-        return round(self._min_value if isinstance(self._min_value, Number) else as_decimal(self._min_value) * amount, 2)
+    @staticmethod
+    def _value(value: Number | Percentage, amount: ty.Any, money: ty.Optional[Money]) -> ty.Any:
+        if money is None:
+            return round(value if isinstance(value, Number) else as_decimal(value) * amount, 2)
+        if isinstance(value, Number):
+            return money.round(money.coerce(value))
+        return money.scale(amount, money.rate(value))
 
-    def max_value(self, amount: Decimal) -> Decimal:
-        return round(self._max_value if isinstance(self._max_value, Number) else as_decimal(self._max_value) * amount, 2)
+    def min_value(self, amount: Decimal, money: ty.Optional[Money] = None) -> Decimal:
+        return self._value(self._min_value, amount, money)
+
+    def max_value(self, amount: Decimal, money: ty.Optional[Money] = None) -> Decimal:
+        return self._value(self._max_value, amount, money)
 
     @property
     def payments_per_year(self) -> int:
-        return self._payments_per_year
\ No newline at end of file
+        return self._payments_per_year
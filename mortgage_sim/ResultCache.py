@@ -0,0 +1,218 @@
+from mortgage_sim.AnnuityFollowUpCreator import AnnuityFollowUpCreator
+from mortgage_sim.Finances import Finances
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.FinancialDelta import FinancialDelta
+from mortgage_sim.FinancialPosition import FinancialPosition
+from mortgage_sim.Money import Money
+from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
+from mortgage_sim.Scenario import Scenario
+from mortgage_sim.SimulationSummary import SimulationSummary
+from mortgage_sim.TemporalCollection import TemporalCollection
+from mortgage_sim.TemporalValue import TemporalValue
+from mortgage_sim.Wallet import Wallet
+from mortgage_sim.types import Percentage
+
+
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import typing as ty
+from decimal import Decimal
+
+import numpy as np
+
+
+class ResultCache(object):
+    # Persists payment plans and summaries in a directory, keyed by the hash of everything the simulation depends on.
+    # Payment plans are stored column by column in an npz file, summaries as JSON. When the directory grows beyond
+    # max_bytes the least recently used results are removed.
+    
+    # Part of every key, bumped with every change of the simulation or of the stored format which alters the results
+    version: int = 1
+    
+    def __init__(self, directory: ty.Union[str, pathlib.Path], max_bytes: int = 256 * 1024 * 1024) -> None:
+        self._directory: pathlib.Path = pathlib.Path(directory)
+        self._max_bytes: int = max_bytes
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @classmethod
+    def _describe(cls, value: ty.Any) -> ty.Any:
+        # Canonical plain data of an input, raises TypeError for inputs whose behaviour cannot be described
+        if value is None or isinstance(value, (bool, int, str)):
+            return value
+        if isinstance(value, float):
+            return ['float', repr(value)]
+        if isinstance(value, Decimal):
+            return ['decimal', str(value)]
+        if isinstance(value, Percentage):
+            return ['percentage', str(value.percentage)]
+        if isinstance(value, FinancialDate):
+            return ['date', value.ordinal]
+        if isinstance(value, FinancialDelta):
+            return ['delta', value.months]
+        if isinstance(value, FinancialPosition):
+            return ['position', value.name, cls._describe(value.when), cls._describe(value.amount), cls._describe(value.recurrence)]
+        if isinstance(value, RepaymentParameterSet):
+            return ['repayment', cls._describe(value._min_value), cls._describe(value._max_value), value.payments_per_year]
+        if isinstance(value, TemporalValue):
+            return ['temporal', cls._describe(value._default_value), [[key, cls._describe(item)] for key, item in value.ordinal_items()]]
+        if isinstance(value, TemporalCollection):
+            return ['collection', [[temporal_value.name, cls._describe(temporal_value)] for temporal_value in value.temporal_values()]]
+        if isinstance(value, Finances):
+            return ['finances', cls._describe(value.current_wallet), cls._describe(value._incomes), cls._describe(value._expenses)]
+        if isinstance(value, Wallet):
+            return ['wallet', cls._describe(value.current_amount), cls._describe(value._saving_policies)]
+        if isinstance(value, AnnuityFollowUpCreator):
+            return ['annuity', cls._describe(value.interest_rate), cls._describe(value.min_payback_rate), value._suffix]
+        if isinstance(value, Scenario.BoundFollowUpCreator):
+            return cls._describe(value.follow_up_creator)
+        if isinstance(value, Mortgage):
+            money = value.money
+            return ['mortgage', value.name, cls._describe(value.initial_amount), cls._describe(value.current_amount),
+                    cls._describe(value._interest_rate), cls._describe(value._payback_rate), cls._describe(value._repayment_parameter_set),
+                    cls._describe(value.valid_from), cls._describe(value.valid_until), value._current_unscheduled_payments_count,
+                    cls._describe(money.to_decimal(value._current_unscheduled_payments_sum)), cls._describe(value._current_date),
+                    cls._describe(value._follow_up_creator)]
+        raise TypeError(f'Cannot describe {type(value).__name__} for a cache key')
+
+    @classmethod
+    def key(cls, kind: str, start: FinancialDate, finances: Finances, wallet: Wallet, mortgages: ty.List[Mortgage], strategy: type,
+            money: Money, months: int) -> ty.Optional[str]:
+        # None if the result cannot be cached, e.g. for a random strategy or an unknown follow-up creator
+        from mortgage_sim import __version__
+
+        if not getattr(strategy, 'deterministic', False):
+            return None
+        try:
+            description = [__version__, cls.version, kind, f'{strategy.__module__}.{strategy.__qualname__}', f'{type(money).__module__}.{type(money).__qualname__}',
+                           months, cls._describe(start), cls._describe(finances), cls._describe(wallet), [cls._describe(mortgage) for mortgage in mortgages]]
+        except TypeError:
+            return None
+        return hashlib.sha256(json.dumps(description, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> pathlib.Path:
+        return self._directory / f'{key}{suffix}'
+
+    def _touch(self, path: pathlib.Path) -> bool:
+        # The modification time orders the results by their last use
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _write(self, path: pathlib.Path, write: ty.Callable[[ty.BinaryIO], None]) -> None:
+        # Written next to the target and renamed, so concurrent readers never see a partial result
+        self._directory.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as stream:
+                write(stream)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        entries = list()
+        for path in self._directory.glob('*'):
+            if path.suffix not in ('.npz', '.json'):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self._max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for path in self._directory.glob('*'):
+            if path.suffix in ('.npz', '.json'):
+                path.unlink(missing_ok=True)
+
+    def get_payment_plan(self, key: str, money: Money) -> ty.Optional[PaymentPlan]:
+        path = self._path(key, '.npz')
+        if not self._touch(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                names = archive['names'].tolist()
+                kinds = archive['kinds'].tolist()
+                columns = [archive[f'column_{index}'] for index in range(len(names))]
+        except (OSError, KeyError, ValueError):
+            return None
+
+        plan_columns = dict()
+        for name, kind, values in zip(names, kinds, columns):
+            if kind == 'amount':
+                plan_columns[name] = values if values.dtype.kind == 'i' else [Decimal(value) for value in values.tolist()]
+            elif kind == 'date':
+                plan_columns[name] = [FinancialDate.from_ordinal(value) for value in values.tolist()]
+            else:
+                plan_columns[name] = values if values.dtype.kind == 'i' else values.tolist()
+        return PaymentPlan.from_columns(money, plan_columns, [name for name, kind in zip(names, kinds) if kind == 'amount'])
+
+    def put_payment_plan(self, key: str, payment_plan: PaymentPlan, columns: ty.List[str]) -> None:
+        arrays = dict()
+        kinds = list()
+        for index, name in enumerate(columns):
+            values = payment_plan.column(name).values
+            if payment_plan.is_amount(name):
+                kinds.append('amount')
+                values = values if values.dtype.kind == 'i' else np.array([str(value) for value in values.tolist()], dtype=str)
+            elif values.dtype.kind == 'O' and all(isinstance(value, FinancialDate) for value in values.tolist()):
+                kinds.append('date')
+                values = np.array([value.ordinal for value in values.tolist()], dtype=np.int64)
+            else:
+                kinds.append('value')
+                values = values if values.dtype.kind != 'O' else np.array([str(value) for value in values.tolist()], dtype=str)
+            arrays[f'column_{index}'] = values
+        arrays['names'] = np.array(columns, dtype=str)
+        arrays['kinds'] = np.array(kinds, dtype=str)
+        self._write(self._path(key, '.npz'), lambda stream: np.savez_compressed(stream, **arrays))
+
+    def get_summary(self, key: str) -> ty.Optional[SimulationSummary]:
+        path = self._path(key, '.json')
+        if not self._touch(path):
+            return None
+        try:
+            content = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return SimulationSummary(FinancialDate.from_ordinal(content['start']), content['months'], Decimal(content['total_interest']),
+                                 Decimal(content['total_unscheduled']), Decimal(content['min_wallet']), content['paid_off'], content['overextension'])
+
+    def put_summary(self, key: str, summary: SimulationSummary) -> None:
+        content = {
+            'start': summary.start.ordinal,
+            'months': summary.months,
+            'total_interest': str(summary.total_interest),
+            'total_unscheduled': str(summary.total_unscheduled),
+            'min_wallet': str(summary.min_wallet),
+            'paid_off': summary._paid_off,
+            'overextension': summary.overextension,
+        }
+        self._write(self._path(key, '.json'), lambda stream: stream.write(json.dumps(content).encode('utf-8')))
+
+    def __repr__(self) -> str:
+        return f'<{__name__} directory={self._directory} max_bytes={self._max_bytes}>'
@@ -0,0 +1,112 @@
+from mortgage_sim.Finances import Finances
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.MinRestDurationPaybackStrategy import MinRestDurationPaybackStrategy
+from mortgage_sim.Money import Money
+from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.PaybackStrategy import HORIZON, PaybackStrategy
+from mortgage_sim.PaymentAggregates import PaymentAggregates
+from mortgage_sim.PaymentPlan import PaymentPlan
+from mortgage_sim.PaymentRecord import PaymentRecord
+from mortgage_sim.SimulationSummary import SimulationSummary
+from mortgage_sim.Wallet import Wallet
+
+
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    import pandas as pd
+    from mortgage_sim.ResultCache import ResultCache
+
+
+FollowUpCreator = ty.Callable[[Mortgage, PaymentPlan, Wallet], ty.Optional[Mortgage]]
+
+
+class Scenario(object):
+    class BoundFollowUpCreator(object):
+        # Binds a follow-up creator to the wallet of an instance, unlike a closure it can be inspected and pickled
+        def __init__(self, follow_up_creator: FollowUpCreator, wallet: Wallet) -> None:
+            self._follow_up_creator: FollowUpCreator = follow_up_creator
+            self._wallet: Wallet = wallet
+
+        @property
+        def follow_up_creator(self) -> FollowUpCreator:
+            return self._follow_up_creator
+
+        def __call__(self, mortgage: Mortgage, payment_plan: PaymentPlan) -> ty.Optional[Mortgage]:
+            return self._follow_up_creator(mortgage, payment_plan, self._wallet)
+
+    def __init__(self, start: FinancialDate, finances: Finances, wallet: Wallet, mortgages: ty.List[Mortgage],
+                 follow_up_creator: ty.Optional[FollowUpCreator] = None,
+                 strategy: ty.Type[PaybackStrategy] = MinRestDurationPaybackStrategy, horizon: int = HORIZON) -> None:
+        self._start: FinancialDate = start
+        self._finances: Finances = finances
+        self._wallet: Wallet = wallet
+        self._mortgages: ty.List[Mortgage] = mortgages
+        self._follow_up_creator: ty.Optional[FollowUpCreator] = follow_up_creator
+        self._strategy: ty.Type[PaybackStrategy] = strategy
+        self._horizon: int = horizon
+
+    @property
+    def start(self) -> FinancialDate:
+        return self._start
+
+    @property
+    def finances(self) -> Finances:
+        return self._finances
+
+    @property
+    def wallet(self) -> Wallet:
+        return self._wallet
+
+    @property
+    def mortgages(self) -> ty.List[Mortgage]:
+        return self._mortgages
+
+    @property
+    def follow_up_creator(self) -> ty.Optional[FollowUpCreator]:
+        return self._follow_up_creator
+
+    @property
+    def strategy(self) -> ty.Type[PaybackStrategy]:
+        return self._strategy
+
+    @property
+    def horizon(self) -> int:
+        return self._horizon
+
+    def instantiate(self, follow_up_creator: ty.Optional[FollowUpCreator] = None) -> 'Scenario':
+        # Finances are only read during a simulation and can be shared, the wallet and the mortgages share their
+        # definitions with the scenario and copy them once the instance is altered
+        wallet = self._wallet._state_copy()
+        mortgages = [mortgage._state_copy() for mortgage in self._mortgages]
+        follow_up_creator = follow_up_creator or self._follow_up_creator
+        if follow_up_creator is not None:
+            for mortgage in mortgages:
+                mortgage.register_follow_up_creator(Scenario.BoundFollowUpCreator(follow_up_creator, wallet))
+        return Scenario(self._start, self._finances, wallet, mortgages, follow_up_creator, self._strategy, self._horizon)
+
+    def create_strategy(self, strategy: ty.Optional[ty.Type[PaybackStrategy]] = None, **kwargs: ty.Any) -> PaybackStrategy:
+        kwargs.setdefault('horizon', self._horizon)
+        return (strategy or self._strategy)(self._mortgages, **kwargs)
+
+    def simulate(self, strategy: ty.Optional[ty.Type[PaybackStrategy]] = None, money: ty.Optional[Money] = None,
+                 cache: ty.Optional['ResultCache'] = None) -> 'pd.DataFrame':
+        # Runs on an instance, so a cache hit, which skips the simulation and leaves the instance as it is, is not visible here
+        instance = self.instantiate()
+        return instance.create_strategy(strategy).calculate_payment_plan(instance.start, instance.finances, instance.wallet, money, cache=cache)
+
+    def stream(self, strategy: ty.Optional[ty.Type[PaybackStrategy]] = None, money: ty.Optional[Money] = None) -> ty.Iterator[PaymentRecord]:
+        instance = self.instantiate()
+        return instance.create_strategy(strategy).stream_payment_plan(instance.start, instance.finances, instance.wallet, money)
+
+    def summarize(self, strategy: ty.Optional[ty.Type[PaybackStrategy]] = None, money: ty.Optional[Money] = None,
+                  cache: ty.Optional['ResultCache'] = None) -> SimulationSummary:
+        instance = self.instantiate()
+        return instance.create_strategy(strategy).calculate_summary(instance.start, instance.finances, instance.wallet, money, cache)
+
+    def aggregate(self, strategy: ty.Optional[ty.Type[PaybackStrategy]] = None, money: ty.Optional[Money] = None) -> PaymentAggregates:
+        instance = self.instantiate()
+        return instance.create_strategy(strategy).calculate_aggregates(instance.start, instance.finances, instance.wallet, money)
+
+    def __repr__(self) -> str:
+        return f'<{__name__} start={self._start} mortgages={[mortgage.name for mortgage in self._mortgages]} strategy={self._strategy.__name__}>'
@@ -0,0 +1,350 @@
+from mortgage_sim.AnnuityFollowUpCreator import AnnuityFollowUpCreator
+from mortgage_sim.Finances import Finances
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.FinancialDelta import FinancialDelta
+from mortgage_sim.FinancialPosition import FinancialPosition
+from mortgage_sim.MinInterestRatePaybackStrategy import MinInterestRatePaybackStrategy
+from mortgage_sim.MinRestDurationPaybackStrategy import MinRestDurationPaybackStrategy
+from mortgage_sim.Mortgage import Mortgage
+from mortgage_sim.PaybackStrategy import HORIZON, PaybackStrategy
+from mortgage_sim.RandomPaybackStrategy import RandomPaybackStrategy
+from mortgage_sim.RepaymentParameterSet import RepaymentParameterSet
+from mortgage_sim.Scenario import Scenario
+from mortgage_sim.TemporalValue import TemporalValue
+from mortgage_sim.Wallet import Wallet
+from mortgage_sim.types import Percentage
+
+
+import hashlib
+import json
+import pathlib
+import tomllib
+import typing as ty
+from decimal import Decimal, InvalidOperation
+
+
+Document = ty.Dict[str, ty.Any]
+
+
+STRATEGIES: ty.Dict[str, ty.Type[PaybackStrategy]] = {
+    'min_rest_duration': MinRestDurationPaybackStrategy,
+    'min_interest_rate': MinInterestRatePaybackStrategy,
+    'random': RandomPaybackStrategy,
+}
+
+FOLLOW_UP_POLICIES: ty.FrozenSet[str] = frozenset({'annuity'})
+
+
+class ScenarioLoader(object):
+    # Reads scenarios from JSON, JSON Lines or TOML documents.
+    #
+    # A document is normalized first: it is validated, dates become 'YYYY-MM', numbers become decimal strings,
+    # positions are sorted by name and date and changes by date. The normalized document is plain data, it is
+    # cheap to send to worker processes and its canonical JSON form identifies the scenario.
+    #
+    #   start = "2024-01"
+    #   strategy = "min_rest_duration"
+    #   horizon = 30
+    #   [finances]
+    #   incomes = [{ name = "Salary", when = "2024-01", amount = 6000, recurrence = 1 }]
+    #   expenses = [{ name = "Living", when = "2024-01", amount = 2100, recurrence = 1 }]
+    #   [wallet]
+    #   amount = 5000
+    #   saving_policies = [{ name = "Reserve", when = "2024-01", amount = 10000 }]
+    #   [[mortgages]]
+    #   name = "Short"
+    #   amount = 200000
+    #   interest_rate = 3.73
+    #   payback_rate = 2
+    #   valid_from = "2024-01"
+    #   valid_until = "2034-01"
+    #   repayment = { min = 1000, max = "5%", payments_per_year = 12 }
+    #   interest_rate_changes = [{ when = "2030-01", value = 4 }]
+    #   [follow_up]
+    #   policy = "annuity"
+    #   interest_rate = 5
+    #   min_payback_rate = 1
+    #
+    # Positions with 'removed = true' remove the position of that name from their date onwards. The horizon is
+    # the number of simulated years.
+    _SCENARIO_KEYS = frozenset({'start', 'finances', 'wallet', 'mortgages', 'follow_up', 'strategy', 'horizon'})
+    _POSITION_KEYS = frozenset({'name', 'when', 'amount', 'recurrence', 'removed'})
+    _MORTGAGE_KEYS = frozenset({'name', 'amount', 'interest_rate', 'payback_rate', 'valid_from', 'valid_until', 'repayment',
+                                'interest_rate_changes', 'payback_rate_changes', 'repayment_changes'})
+
+    @staticmethod
+    def _fail(path: str, message: str) -> ty.NoReturn:
+        raise ValueError(f'{path}: {message}')
+
+    @classmethod
+    def _mapping(cls, value: ty.Any, path: str, keys: ty.FrozenSet[str], required: ty.Iterable[str] = ()) -> Document:
+        if not isinstance(value, dict):
+            cls._fail(path, f'must be a table but is {type(value).__name__}')
+        unknown = sorted(set(value) - keys)
+        if unknown:
+            cls._fail(path, f'unknown keys {unknown}')
+        missing = [key for key in required if key not in value]
+        if missing:
+            cls._fail(path, f'missing keys {missing}')
+        return value
+
+    @classmethod
+    def _list(cls, value: ty.Any, path: str) -> ty.List[ty.Any]:
+        if value is None:
+            return list()
+        if not isinstance(value, list):
+            cls._fail(path, f'must be a list but is {type(value).__name__}')
+        return value
+
+    @classmethod
+    def _name(cls, value: ty.Any, path: str) -> str:
+        if not isinstance(value, str) or not value:
+            cls._fail(path, 'must be a non-empty string')
+        return value
+
+    @classmethod
+    def _date(cls, value: ty.Any, path: str) -> str:
+        try:
+            year, month = str(value).split('-')
+            year, month = int(year), int(month)
+        except ValueError:
+            cls._fail(path, f'must be a date \'YYYY-MM\' but is {value!r}')
+        if not 1 <= month <= 12:
+            cls._fail(path, f'month must be between 1 and 12 but is {month}')
+        return f'{year:04d}-{month:02d}'
+
+    @classmethod
+    def _number(cls, value: ty.Any, path: str) -> str:
+        if isinstance(value, bool) or not isinstance(value, (int, float, str, Decimal)):
+            cls._fail(path, f'must be a number but is {value!r}')
+        try:
+            number = Decimal(str(value))
+        except InvalidOperation:
+            cls._fail(path, f'must be a number but is {value!r}')
+        if not number.is_finite():
+            cls._fail(path, f'must be finite but is {value!r}')
+        return f'{number.normalize():f}'
+
+    @classmethod
+    def _count(cls, value: ty.Any, path: str, minimum: int) -> int:
+        if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+            cls._fail(path, f'must be an integer of at least {minimum} but is {value!r}')
+        return value
+
+    @classmethod
+    def _limit(cls, value: ty.Any, path: str) -> str:
+        # Repayment limits are amounts or percentages of the initial amount like '5%'
+        if isinstance(value, str) and value.strip().endswith('%'):
+            return f'{cls._number(value.strip()[:-1], path)}%'
+        return cls._number(value, path)
+
+    @classmethod
+    def _position(cls, value: ty.Any, path: str) -> Document:
+        value = cls._mapping(value, path, cls._POSITION_KEYS, ('name', 'when'))
+        position = {'name': cls._name(value['name'], f'{path}.name'), 'when': cls._date(value['when'], f'{path}.when')}
+        if value.get('removed', False):
+            position['removed'] = True
+            return position
+        if 'amount' not in value:
+            cls._fail(path, 'missing keys [\'amount\']')
+        position['amount'] = cls._number(value['amount'], f'{path}.amount')
+        recurrence = value.get('recurrence', None)
+        position['recurrence'] = cls._count(recurrence, f'{path}.recurrence', 0) if recurrence is not None else None
+        return position
+
+    @classmethod
+    def _positions(cls, value: ty.Any, path: str) -> ty.List[Document]:
+        positions = [cls._position(item, f'{path}[{index}]') for index, item in enumerate(cls._list(value, path))]
+        return sorted(positions, key=lambda position: (position['name'], position['when']))
+
+    @classmethod
+    def _repayment(cls, value: ty.Any, path: str) -> ty.Optional[Document]:
+        if value is None:
+            return None
+        value = cls._mapping(value, path, frozenset({'min', 'max', 'payments_per_year'}), ('min', 'max', 'payments_per_year'))
+        return {'min': cls._limit(value['min'], f'{path}.min'), 'max': cls._limit(value['max'], f'{path}.max'),
+                'payments_per_year': cls._count(value['payments_per_year'], f'{path}.payments_per_year', 0)}
+
+    @classmethod
+    def _changes(cls, value: ty.Any, path: str, normalize: ty.Callable[[ty.Any, str], ty.Any]) -> ty.List[Document]:
+        changes = list()
+        for index, item in enumerate(cls._list(value, path)):
+            item_path = f'{path}[{index}]'
+            item = cls._mapping(item, item_path, frozenset({'when', 'value'}), ('when', 'value'))
+            changes.append({'when': cls._date(item['when'], f'{item_path}.when'), 'value': normalize(item['value'], f'{item_path}.value')})
+        return sorted(changes, key=lambda change: change['when'])
+
+    @classmethod
+    def _mortgage(cls, value: ty.Any, path: str) -> Document:
+        value = cls._mapping(value, path, cls._MORTGAGE_KEYS, ('name', 'amount', 'interest_rate', 'payback_rate'))
+        optional_date = lambda key: cls._date(value[key], f'{path}.{key}') if value.get(key, None) is not None else None
+        return {
+            'name': cls._name(value['name'], f'{path}.name'),
+            'amount': cls._number(value['amount'], f'{path}.amount'),
+            'interest_rate': cls._number(value['interest_rate'], f'{path}.interest_rate'),
+            'payback_rate': cls._number(value['payback_rate'], f'{path}.payback_rate'),
+            'valid_from': optional_date('valid_from'),
+            'valid_until': optional_date('valid_until'),
+            'repayment': cls._repayment(value.get('repayment', None), f'{path}.repayment'),
+            'interest_rate_changes': cls._changes(value.get('interest_rate_changes', None), f'{path}.interest_rate_changes', cls._number),
+            'payback_rate_changes': cls._changes(value.get('payback_rate_changes', None), f'{path}.payback_rate_changes', cls._number),
+            'repayment_changes': cls._changes(value.get('repayment_changes', None), f'{path}.repayment_changes', cls._repayment),
+        }
+
+    @classmethod
+    def _follow_up(cls, value: ty.Any, path: str) -> ty.Optional[Document]:
+        if value is None:
+            return None
+        value = cls._mapping(value, path, frozenset({'policy', 'interest_rate', 'min_payback_rate', 'suffix'}), ('policy', 'interest_rate', 'min_payback_rate'))
+        if value['policy'] not in FOLLOW_UP_POLICIES:
+            cls._fail(f'{path}.policy', f'must be one of {sorted(FOLLOW_UP_POLICIES)} but is {value["policy"]!r}')
+
+        # The interest rate is either fixed or a list of changes
+        interest_rate = value['interest_rate']
+        if isinstance(interest_rate, list):
+            interest_rate = cls._changes(interest_rate, f'{path}.interest_rate', cls._number)
+        else:
+            interest_rate = cls._number(interest_rate, f'{path}.interest_rate')
+        suffix = value.get('suffix', ' Follow')
+        if not isinstance(suffix, str):
+            cls._fail(f'{path}.suffix', 'must be a string')
+        return {'policy': value['policy'], 'interest_rate': interest_rate, 'min_payback_rate': cls._number(value['min_payback_rate'], f'{path}.min_payback_rate'),
+                'suffix': suffix}
+
+    @classmethod
+    def normalize(cls, document: ty.Any, path: str = 'scenario') -> Document:
+        document = cls._mapping(document, path, cls._SCENARIO_KEYS, ('start', 'mortgages'))
+        finances = cls._mapping(document.get('finances', None) or dict(), f'{path}.finances', frozenset({'current_wallet', 'incomes', 'expenses'}))
+        wallet = cls._mapping(document.get('wallet', None) or dict(), f'{path}.wallet', frozenset({'amount', 'saving_policies'}))
+        strategy = document.get('strategy', 'min_rest_duration')
+        if strategy not in STRATEGIES:
+            cls._fail(f'{path}.strategy', f'must be one of {sorted(STRATEGIES)} but is {strategy!r}')
+
+        mortgages = [cls._mortgage(item, f'{path}.mortgages[{index}]') for index, item in enumerate(cls._list(document['mortgages'], f'{path}.mortgages'))]
+        names = [mortgage['name'] for mortgage in mortgages]
+        if len(set(names)) != len(names):
+            cls._fail(f'{path}.mortgages', f'names must be unique but are {names}')
+        return {
+            'start': cls._date(document['start'], f'{path}.start'),
+            'finances': {
+                'current_wallet': cls._number(finances.get('current_wallet', 0), f'{path}.finances.current_wallet'),
+                'incomes': cls._positions(finances.get('incomes', None), f'{path}.finances.incomes'),
+                'expenses': cls._positions(finances.get('expenses', None), f'{path}.finances.expenses'),
+            },
+            'wallet': {
+                'amount': cls._number(wallet.get('amount', 0), f'{path}.wallet.amount'),
+                'saving_policies': cls._positions(wallet.get('saving_policies', None), f'{path}.wallet.saving_policies'),
+            },
+            'mortgages': mortgages,
+            'follow_up': cls._follow_up(document.get('follow_up', None), f'{path}.follow_up'),
+            'strategy': strategy,
+            'horizon': cls._count(document.get('horizon', HORIZON // 12), f'{path}.horizon', 1),
+        }
+
+    @staticmethod
+    def canonical(document: Document) -> str:
+        # Canonical JSON of a normalized document
+        return json.dumps(document, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+    @classmethod
+    def canonical_hash(cls, document: Document, normalized: bool = False) -> str:
+        if not normalized:
+            document = cls.normalize(document)
+        return hashlib.sha256(cls.canonical(document).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _to_date(value: str) -> FinancialDate:
+        year, month = value.split('-')
+        return FinancialDate(year=int(year), month=int(month))
+
+    @staticmethod
+    def _to_limit(value: str) -> Decimal | Percentage:
+        if value.endswith('%'):
+            return Percentage(Decimal(value[:-1]))
+        return Decimal(value)
+
+    @classmethod
+    def _to_parameter_set(cls, value: ty.Optional[Document]) -> ty.Optional[RepaymentParameterSet]:
+        if value is None:
+            return None
+        return RepaymentParameterSet(cls._to_limit(value['min']), cls._to_limit(value['max']), value['payments_per_year'])
+
+    @classmethod
+    def _to_positions(cls, positions: ty.List[Document]) -> ty.Tuple[ty.List[FinancialPosition], ty.List[ty.Tuple[str, FinancialDate]]]:
+        added, removed = list(), list()
+        for position in positions:
+            when = cls._to_date(position['when'])
+            if position.get('removed', False):
+                removed.append((position['name'], when))
+                continue
+            recurrence = FinancialDelta(months=position['recurrence']) if position['recurrence'] is not None else None
+            added.append(FinancialPosition(position['name'], when, Decimal(position['amount']), recurrence))
+        return added, removed
+
+    @classmethod
+    def _to_mortgage(cls, document: Document) -> Mortgage:
+        to_date = lambda value: cls._to_date(value) if value is not None else None
+        mortgage = Mortgage(document['name'], Decimal(document['amount']), Percentage(Decimal(document['interest_rate'])),
+                            Percentage(Decimal(document['payback_rate'])), to_date(document['valid_from']), to_date(document['valid_until']),
+                            cls._to_parameter_set(document['repayment']))
+        if document['interest_rate_changes']:
+            mortgage.alter_interest_rates([(cls._to_date(change['when']), Percentage(Decimal(change['value']))) for change in document['interest_rate_changes']])
+        if document['payback_rate_changes']:
+            mortgage.alter_payback_rates([(cls._to_date(change['when']), Percentage(Decimal(change['value']))) for change in document['payback_rate_changes']])
+        if document['repayment_changes']:
+            mortgage.alter_repayment_parameter_sets([(cls._to_date(change['when']), cls._to_parameter_set(change['value'])) for change in document['repayment_changes']])
+        return mortgage
+
+    @classmethod
+    def _to_follow_up_creator(cls, document: ty.Optional[Document]) -> ty.Optional[AnnuityFollowUpCreator]:
+        if document is None:
+            return None
+        interest_rate = document['interest_rate']
+        if isinstance(interest_rate, list):
+            interest_rate = TemporalValue[Percentage]().set_values([(cls._to_date(change['when']), Percentage(Decimal(change['value']))) for change in interest_rate])
+        else:
+            interest_rate = Percentage(Decimal(interest_rate))
+        return AnnuityFollowUpCreator(interest_rate, Percentage(Decimal(document['min_payback_rate'])), document['suffix'])
+
+    @classmethod
+    def build(cls, document: Document, normalized: bool = False) -> Scenario:
+        if not normalized:
+            document = cls.normalize(document)
+
+        finances = Finances(Decimal(document['finances']['current_wallet']))
+        finances.add_incomes(*cls._to_positions(document['finances']['incomes']))
+        finances.add_expenses(*cls._to_positions(document['finances']['expenses']))
+        wallet = Wallet(Decimal(document['wallet']['amount']))
+        wallet.add_saving_policies(*cls._to_positions(document['wallet']['saving_policies']))
+
+        mortgages = [cls._to_mortgage(mortgage) for mortgage in document['mortgages']]
+        return Scenario(cls._to_date(document['start']), finances, wallet, mortgages, cls._to_follow_up_creator(document['follow_up']),
+                        STRATEGIES[document['strategy']], document['horizon'] * 12)
+
+    @staticmethod
+    def parse(text: str, format: str = 'json') -> ty.List[Document]:
+        # A source holds one scenario, a list of scenarios or a table with a list of scenarios under 'scenarios'.
+        # Numbers are parsed as decimals to keep them exact.
+        if format == 'jsonl':
+            return [json.loads(line, parse_float=Decimal) for line in text.splitlines() if line.strip()]
+        if format == 'json':
+            content = json.loads(text, parse_float=Decimal)
+        elif format == 'toml':
+            content = tomllib.loads(text, parse_float=Decimal)
+        else:
+            raise ValueError(f'Unknown scenario format \'{format}\', expected one of [\'json\', \'jsonl\', \'toml\']')
+        if isinstance(content, dict) and 'scenarios' in content:
+            content = content['scenarios']
+        return content if isinstance(content, list) else [content]
+
+    @classmethod
+    def read(cls, path: ty.Union[str, pathlib.Path]) -> ty.List[Document]:
+        # Reads and normalizes all scenarios of a file, the format is chosen by the suffix
+        path = pathlib.Path(path)
+        format = path.suffix.lstrip('.').lower()
+        documents = cls.parse(path.read_text(encoding='utf-8'), format)
+        return [cls.normalize(document, f'{path.name}[{index}]') for index, document in enumerate(documents)]
+
+    @classmethod
+    def load(cls, path: ty.Union[str, pathlib.Path]) -> ty.List[Scenario]:
+        return [cls.build(document, normalized=True) for document in cls.read(path)]
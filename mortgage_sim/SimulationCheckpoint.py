@@ -0,0 +1,51 @@
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.Money import Money
+from mortgage_sim.Mortgage import Mortgage
+
+
+import typing as ty
+
+
+class SimulationCheckpoint(object):
+    # State of a payback strategy at the beginning of a month, before the mortgages have been advanced to it.
+    # The mortgages are shallow copies which share their rates with the simulated mortgages.
+    def __init__(self, month: int, when: FinancialDate, money: Money, wallet_amount: ty.Any, mortgages: ty.List[Mortgage],
+                 active: ty.List[int], rows: int) -> None:
+        self._month: int = month
+        self._when: FinancialDate = when
+        self._money: Money = money
+        self._wallet_amount: ty.Any = wallet_amount
+        self._mortgages: ty.List[Mortgage] = mortgages
+        self._active: ty.List[int] = active
+        self._rows: int = rows
+
+    @property
+    def month(self) -> int:
+        return self._month
+
+    @property
+    def when(self) -> FinancialDate:
+        return self._when
+
+    @property
+    def money(self) -> Money:
+        return self._money
+
+    @property
+    def wallet_amount(self) -> ty.Any:
+        return self._wallet_amount
+
+    @property
+    def mortgages(self) -> ty.List[Mortgage]:
+        return self._mortgages
+
+    @property
+    def active(self) -> ty.List[int]:
+        return self._active
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def __repr__(self) -> str:
+        return f'<{__name__} month={self._month} when={self._when} rows={self._rows}>'
@@ -0,0 +1,59 @@
+from mortgage_sim.FinancialDate import FinancialDate
+from mortgage_sim.FinancialDelta import FinancialDelta
+
+
+import typing as ty
+from decimal import Decimal
+
+
+class SimulationSummary(object):
+    def __init__(self, start: FinancialDate, months: int, total_interest: Decimal, total_unscheduled: Decimal, min_wallet: Decimal,
+                 paid_off: bool, overextension: bool) -> None:
+        self._start: FinancialDate = start
+        self._months: int = months
+        self._total_interest: Decimal = total_interest
+        self._total_unscheduled: Decimal = total_unscheduled
+        self._min_wallet: Decimal = min_wallet
+        self._paid_off: bool = paid_off
+        self._overextension: bool = overextension
+
+    @property
+    def start(self) -> FinancialDate:
+        return self._start
+
+    @property
+    def months(self) -> int:
+        return self._months
+
+    @property
+    def total_interest(self) -> Decimal:
+        return self._total_interest
+
+    @property
+    def total_unscheduled(self) -> Decimal:
+        return self._total_unscheduled
+
+    @property
+    def min_wallet(self) -> Decimal:
+        return self._min_wallet
+
+    @property
+    def paid_off(self) -> bool:
+        return self._paid_off and not self._overextension
+
+    @property
+    def overextension(self) -> bool:
+        return self._overextension
+
+    @property
+    def payoff_month(self) -> ty.Optional[int]:
+        return self._months if self.paid_off else None
+
+    @property
+    def payoff_date(self) -> ty.Optional[FinancialDate]:
+        if not self.paid_off or self._months == 0:
+            return None
+        return self._start + FinancialDelta(months=self._months - 1)
+
+    def __repr__(self) -> str:
+        return f'<{__name__} total_interest={self._total_interest} payoff_date={self.payoff_date} min_wallet={self._min_wallet} overextension={self._overextension}>'
@@ -3,7 +3,6 @@ from mortgage_sim.NamedTemporalValue import NamedTemporalValue
 
 
 import typing as ty
-from datetime import datetime
 
 
 TValue = ty.TypeVar('TValue')
@@ -12,16 +11,46 @@ TValue = ty.TypeVar('TValue')
 class TemporalCollection(ty.Generic[TValue]):
     def __init__(self) -> None:
         self._collection: ty.Dict[str, NamedTemporalValue[TValue]] = dict()
+        self._revision: int = 0
+        
+    @property
+    def revision(self) -> int:
+        return self._revision
         
     def set_value(self, key: str, when: FinancialDate, value: TValue) -> None:
+        self._revision += 1
         entry = self._collection.get(key, None)
         if entry is None:
             self._collection[key] = entry = NamedTemporalValue(key, None)
         entry.set_value(when, value)
 
-    def values(self, when: datetime) -> ty.Generator[ty.Tuple[str, TValue], None, None]:
+    def set_values(self, items: ty.Iterable[ty.Tuple[str, FinancialDate, ty.Optional[TValue]]]) -> None:
+        # Groups the values by key so that every temporal value is sorted once
+        grouped: ty.Dict[str, ty.List[ty.Tuple[FinancialDate, ty.Optional[TValue]]]] = dict()
+        for key, when, value in items:
+            grouped.setdefault(key, list()).append((when, value))
+        
+        self._revision += 1
+        for key, values in grouped.items():
+            entry = self._collection.get(key, None)
+            if entry is None:
+                self._collection[key] = entry = NamedTemporalValue(key, None)
+            entry.set_values(values)
+
+    def copy(self) -> 'TemporalCollection[TValue]':
+        # Copies every temporal value, altering the copy leaves this collection untouched and vice versa
+        duplicate = TemporalCollection[TValue]()
+        duplicate._collection = {key: entry.copy() for key, entry in self._collection.items()}
+        duplicate._revision = self._revision
+        return duplicate
+
+    def temporal_values(self) -> ty.Iterator[NamedTemporalValue[TValue]]:
+        return iter(self._collection.values())
+
+    def values(self, when: FinancialDate) -> ty.Generator[ty.Tuple[str, TValue], None, None]:
+        ordinal = when.ordinal
         for temporal_value in self._collection.values():
-            value = temporal_value.get_value(when)
+            value = temporal_value.get_value_at(ordinal)
             if value is None:
                 continue
             yield (temporal_value.name, value)
\ No newline at end of file
@@ -1,5 +1,7 @@
+import copy
 import typing as ty
-from bisect import bisect_left, insort_left
+from array import array
+from bisect import bisect_left, bisect_right
 from mortgage_sim.FinancialDate import FinancialDate
 
 
@@ -9,44 +11,79 @@ TValue = ty.TypeVar('TValue')
 class TemporalValue(ty.Generic[TValue]):
     def __init__(self, default_value: ty.Optional[TValue] = None) -> None:
         super().__init__()
-        self._collection: ty.List[ty.Tuple[FinancialDate, ty.Optional[TValue]]] = list()
+        self._keys: array = array('q')
+        self._values: ty.List[ty.Optional[TValue]] = list()
         self._default_value: ty.Optional[TValue] = default_value
-        
-    def _find(self, when: FinancialDate) -> ty.Optional[int]:
-        if not self._collection:
-            return None
-        
-        index = bisect_left(self._collection, when, key=lambda x: x[0])
-        if index == len(self._collection):
-            return index - 1
-        return index
+        self._revision: int = 0
+    
+    @property
+    def revision(self) -> int:
+        return self._revision
     
     def set_value(self, when: FinancialDate, value: ty.Optional[TValue]) -> ty.Self:
-        index = bisect_left(self._collection, when, key=lambda x: x[0])
-        if index == len(self._collection):
-            self._collection.append((when, value))
-            return self
-        
-        if self._collection[index][0] == when:
-            self._collection[index] = (when, value)
+        self._revision += 1
+        key = when.ordinal
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            self._values[index] = value
             return self
         
-        insort_left(self._collection, (when, value), key=lambda x: x[0])
+        self._keys.insert(index, key)
+        self._values.insert(index, value)
         return self
     
-    def get_value(self, when: FinancialDate) -> ty.Optional[TValue]:
-        if not self._collection:
-            return self._default_value or None
-        
-        index = bisect_left(self._collection, when, key=lambda x: x[0])
-        if index == len(self._collection) or when < self._collection[index][0]:
-            return self._collection[index - 1][1] if index != 0 else self._default_value or None
-        if index == 0 and when < self._collection[index][0]:
+    def set_values(self, items: ty.Iterable[ty.Tuple[FinancialDate, ty.Optional[TValue]]]) -> ty.Self:
+        # Sets many values at once with a single sort, later items win over earlier ones at the same date
+        self._revision += 1
+        values = dict(zip(self._keys, self._values))
+        values.update((when.ordinal, value) for when, value in items)
+        keys = sorted(values)
+        self._keys = array('q', keys)
+        self._values = [values[key] for key in keys]
+        return self
+    
+    def get_value_at(self, ordinal: int) -> ty.Optional[TValue]:
+        index = bisect_right(self._keys, ordinal)
+        if index == 0:
             return self._default_value or None
-        return self._collection[index][1]
+        return self._values[index - 1]
     
-    def __repr__(self) -> str:
-        return f'<{__name__} default_value={self._default_value} collection={self._collection}>'
+    def get_value(self, when: FinancialDate) -> ty.Optional[TValue]:
+        return self.get_value_at(when.ordinal)
+    
+    def next_change_at(self, ordinal: int) -> ty.Optional[int]:
+        index = bisect_right(self._keys, ordinal)
+        return self._keys[index] if index < len(self._keys) else None
+    
+    def get_values(self, start: FinancialDate, n_months: int) -> ty.List[ty.Optional[TValue]]:
+        first = start.ordinal
+        last = first + max(n_months, 0)
+        index = bisect_right(self._keys, first)
+        current = self._values[index - 1] if index != 0 else self._default_value or None
         
-
+        result = list()
+        position = first
+        while index < len(self._keys) and self._keys[index] < last:
+            key = self._keys[index]
+            result.extend([current] * (key - position))
+            current = self._values[index]
+            position = key
+            index += 1
+        result.extend([current] * (last - position))
+        return result
     
+    def copy(self) -> ty.Self:
+        # Copies the changes, altering the copy leaves this value untouched and vice versa
+        duplicate = copy.copy(self)
+        duplicate._keys = array('q', self._keys)
+        duplicate._values = list(self._values)
+        return duplicate
+    
+    def ordinal_items(self) -> ty.Iterator[ty.Tuple[int, ty.Optional[TValue]]]:
+        return zip(self._keys, self._values)
+    
+    def items(self) -> ty.Iterator[ty.Tuple[FinancialDate, ty.Optional[TValue]]]:
+        return ((FinancialDate.from_ordinal(key), value) for key, value in zip(self._keys, self._values))
+    
+    def __repr__(self) -> str:
+        return f'<{__name__} default_value={self._default_value} collection={list(self.items())}>'
@@ -1,47 +1,139 @@
+import copy
 from decimal import Decimal
 import typing as ty
+from mortgage_sim.DecimalMoney import DecimalMoney
+from mortgage_sim.FinancesSnapshot import FinancesSnapshot
 from mortgage_sim.FinancialDate import FinancialDate
 from mortgage_sim.FinancialDelta import FinancialDelta
 from mortgage_sim.FinancialPosition import FinancialPosition
+from mortgage_sim.Money import Money
 
-from mortgage_sim.types import Number
+from mortgage_sim.types import HORIZON, Number
 from mortgage_sim.TemporalCollection import TemporalCollection
 
 
 class Wallet(object):
     def __init__(self, amount: ty.Optional[Number] = None) -> None:
-        self.current_amount: Decimal = Decimal(amount) if amount else Decimal(0)
+        self._money: Money = DecimalMoney()
+        self._current_amount: ty.Any = Decimal(amount) if amount else Decimal(0)
         self._saving_policies: TemporalCollection[FinancialPosition] = TemporalCollection[FinancialPosition]()
+        self._saving_targets: ty.List[ty.Any] = list()
+        self._saving_targets_first: int = 0
+        self._saving_targets_signature: ty.Optional[ty.Tuple[int, Money]] = None
+        # Set once state copies share the saving policies, the first alteration then copies them
+        self._shared_definition: bool = False
         
     def __add__(self, other: Number) -> 'Wallet':
-        self.current_amount += Decimal(other)
+        self._current_amount += self._money.coerce(other)
         return self
         
     def __sub__(self, other: Number) -> 'Wallet':
-        self.current_amount -= Decimal(other)
+        self._current_amount -= self._money.coerce(other)
         return self
     
+    @property
+    def money(self) -> Money:
+        return self._money
+    
+    @property
+    def current_amount(self) -> Decimal:
+        return self._money.to_decimal(self._current_amount)
+    
+    @current_amount.setter
+    def current_amount(self, amount: Number) -> None:
+        self._current_amount = self._money.coerce(amount)
+    
+    def bind_money(self, money: Money) -> ty.Self:
+        if money is not self._money:
+            self._current_amount = money.coerce(self._money.to_decimal(self._current_amount))
+            self._money = money
+        return self
+    
+    def book(self, snapshot: FinancesSnapshot) -> ty.Self:
+        self._current_amount += snapshot.balance
+        return self
+    
+    def _withdraw(self, amount: ty.Any) -> None:
+        self._current_amount -= amount
+    
     def add_saving_policy(self, name: str, when: FinancialDate, amount: Number, recurrence: ty.Optional[FinancialDelta] = None) -> ty.Self:
         position = FinancialPosition(name, when, amount, recurrence)
+        self._own_definition()
         self._saving_policies.set_value(name, when, position)
         return self
     
+    def add_saving_policies(self, positions: ty.Iterable[FinancialPosition], removals: ty.Optional[ty.Iterable[ty.Tuple[str, FinancialDate]]] = None) -> ty.Self:
+        items = [(position.name, position.when, position) for position in positions]
+        items += [(name, when, None) for name, when in removals or ()]
+        self._own_definition()
+        self._saving_policies.set_values(items)
+        return self
+    
     def remove_saving_policy(self, name: str, when: FinancialDate) -> ty.Self:
+        self._own_definition()
         self._saving_policies.set_value(name, when, None)
         return self
     
-    def _get_saving_policy_values(self, when: FinancialDate) -> ty.Generator[Decimal, None, None]:
-        for _, value in self._saving_policies.values(when):
-            if value.recurrence is None:
-                yield value.amount
-                continue
-            factor = (when - value.when).months // value.recurrence.months
-            yield factor * value.amount
+    def _own_definition(self) -> None:
+        if self._shared_definition:
+            self._saving_policies = self._saving_policies.copy()
+            self._shared_definition = False
+    
+    def _state_copy(self) -> 'Wallet':
+        # Shares the saving policies, which are copied on write, and copies the current amount
+        self._shared_definition = True
+        return copy.copy(self)
+    
+    def _build_saving_targets(self, first: int, last: int) -> ty.List[ty.Any]:
+        # Saving targets of the months first to last, summed up in the order of the policies with recurring policies growing every period
+        money = self._money
+        months = last - first
+        totals = [0] * months
+        for temporal_value in self._saving_policies.temporal_values():
+            amount, position = None, None
+            for month, value in enumerate(temporal_value.get_values(FinancialDate.from_ordinal(first), months)):
+                if value is None:
+                    continue
+                if value is not position:
+                    amount, position = money.coerce(value.amount), value
+                if value.recurrence is None:
+                    totals[month] += amount
+                    continue
+                factor = (first + month - value.when.ordinal) // value.recurrence.months
+                totals[month] += factor * amount
+        return [money.round(total) for total in totals]
+    
+    def _reserve_saving_targets(self, first: int, last: int) -> None:
+        # Computes the targets of the months first to last unless they are known, e.g. for the horizon of a simulation.
+        # The targets are only recomputed after the policies have been altered.
+        signature = (self._saving_policies.revision, self._money)
+        if signature == self._saving_targets_signature:
+            known_first, known_last = self._saving_targets_first, self._saving_targets_first + len(self._saving_targets)
+            if known_first <= first and last <= known_last:
+                return
+            first, last = min(first, known_first), max(last, known_last)
+        self._saving_targets = self._build_saving_targets(first, last)
+        self._saving_targets_first = first
+        self._saving_targets_signature = signature
+    
+    def _saving_policy_value_at(self, ordinal: int) -> ty.Any:
+        signature = (self._saving_policies.revision, self._money)
+        index = ordinal - self._saving_targets_first
+        if signature == self._saving_targets_signature and 0 <= index < len(self._saving_targets):
+            return self._saving_targets[index]
+        
+        self._reserve_saving_targets(ordinal, ordinal + HORIZON)
+        return self._saving_targets[ordinal - self._saving_targets_first]
+    
+    def _saving_policy_value(self, when: FinancialDate) -> ty.Any:
+        return self._saving_policy_value_at(when.ordinal)
+    
+    def _surplus(self, when: FinancialDate) -> ty.Any:
+        surplus = self._current_amount - self._saving_policy_value(when)
+        return max(0, surplus)
     
     def get_effective_saving_policy_value(self, when: FinancialDate) -> Decimal:
-        return round(sum(self._get_saving_policy_values(when)), 2)
+        return self._money.to_decimal(self._saving_policy_value(when))
     
     def get_surplus(self, when: FinancialDate) -> Decimal:
-        surplus = self.current_amount - self.get_effective_saving_policy_value(when)
-        return max(0, surplus)
-    
\ No newline at end of file
+        return self._money.to_decimal(self._surplus(when))
@@ -0,0 +1,29 @@
+from mortgage_sim.BatchRunner import BatchRunner
+
+
+import argparse
+import sys
+import typing as ty
+
+
+def main(arguments: ty.Optional[ty.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m mortgage_sim', description='Simulates scenario files and streams the results as JSON Lines or CSV.')
+    parser.add_argument('sources', nargs='+', help='scenario files (.json, .jsonl, .toml), directories of them or - for JSON Lines on stdin')
+    parser.add_argument('-o', '--output', default='-', help='output file, .csv selects CSV (default: stdout)')
+    parser.add_argument('-f', '--format', choices=('jsonl', 'csv'), help='output format (default: by output suffix, else jsonl)')
+    parser.add_argument('-w', '--workers', type=int, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--plan', action='store_true', help='write the monthly rows of the payment plans before each summary')
+    parser.add_argument('--cents', action='store_true', help='simulate in integer cents')
+    parser.add_argument('--resume', action='store_true', help='skip the scenarios already summarized in the output file')
+    options = parser.parse_args(arguments)
+
+    try:
+        runner = BatchRunner(options.sources, options.output, options.format, options.workers, options.plan, options.cents, options.resume)
+        runner.run()
+    except (OSError, ValueError) as exception:
+        parser.exit(1, f'{parser.prog}: error: {exception}\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import re
+import typing as ty
+
+
+from babel.numbers import format_currency
+from decimal import Decimal
+from enum import Flag
+from IPython.display import HTML, display
+
+
+class ReferenceDisplayMode(Flag):
+    NONE = 0
+    MONTHLY = 2 ** 0
+    ANNUAL = 2 ** 1
+    TOTAL = 2 ** 2
+    FULL = MONTHLY | ANNUAL | TOTAL
+
+
+_EXCLUDE = {'Date', 'Month', 'Delta', 'Wallet', 'Mortgage Sum', '.* Amount'}
+_HIGHLIGHT = {'.* Unscheduled'}
+_EMPTY = "&#8212;"
+
+
+def _format_value(value: ty.Any) -> str:
+    if isinstance(value, Decimal):
+        return format_currency(value, 'EUR', locale='de_DE') if value != Decimal(0) else _EMPTY
+    return str(value)
+
+
+def _format_summary(values: ty.Optional[ty.Sequence[ty.Any]], index: int) -> str:
+    return _format_value(values[index]) if values is not None and index < len(values) else _EMPTY
+
+
+def _annual_sums(payment_plan: pd.DataFrame, summed_columns: ty.List[str], years: np.ndarray) -> pd.DataFrame:
+    # Rows are grouped by position, so a reference plan is summed over the same months as the payment plan
+    rows = min(len(payment_plan), len(years))
+    return payment_plan[summed_columns].iloc[:rows].groupby(years[:rows], sort=False).sum()
+
+
+def _summary_row(title: str, style: str, values: ty.List[ty.Optional[ty.Sequence[ty.Any]]], index: int) -> str:
+    cells = ''.join(f'<th style="font-weight: 600">{_format_summary(column_values, index)}</th>' for column_values in values)
+    return f'<tr style="{style}"><th>{title}</th>{cells}</tr>'
+
+
+def render_payment_plan(payment_plan: pd.DataFrame, reference_payment_plan: ty.Optional[pd.DataFrame] = None,
+                        reference_display_mode: ty.Optional[ReferenceDisplayMode] = None) -> ty.Iterator[str]:
+    # Yields the rows of a payment plan year by year, followed by the grand summary
+    reference_display_mode = (reference_display_mode or ReferenceDisplayMode.FULL) if reference_payment_plan is not None else ReferenceDisplayMode.NONE
+    columns = list(payment_plan.columns if reference_payment_plan is None or len(payment_plan.columns) <= len(reference_payment_plan.columns) else reference_payment_plan.columns)
+
+    # Classify the columns once
+    summed = [all(re.match(ex, column) is None for ex in _EXCLUDE) for column in columns]
+    highlighted = [any(re.match(h, column) is not None for h in _HIGHLIGHT) for column in columns]
+    wallet_index = columns.index('Wallet') if 'Wallet' in columns else -1
+    summed_columns = [column for column, is_summed in zip(columns, summed) if is_summed]
+
+    # Precompute the summaries
+    years = np.array([date.year for date in payment_plan['Date']], dtype=np.int64)
+    annual = _annual_sums(payment_plan, summed_columns, years)
+    total = payment_plan[summed_columns].sum()
+    if reference_payment_plan is not None:
+        reference_annual = _annual_sums(reference_payment_plan, summed_columns, years)
+        reference_total = reference_payment_plan[summed_columns].sum()
+
+    def _summary_values(sums: ty.Union[pd.DataFrame, pd.Series]) -> ty.List[ty.Optional[ty.Sequence[ty.Any]]]:
+        iterator = iter(sums[column].tolist() if isinstance(sums, pd.DataFrame) else [sums[column]] for column in summed_columns)
+        return [next(iterator) if is_summed else None for is_summed in summed]
+
+    def _delta_values(values: ty.List[ty.Optional[ty.Sequence[ty.Any]]], reference_values: ty.List[ty.Optional[ty.Sequence[ty.Any]]]) -> ty.List[ty.Optional[ty.Sequence[ty.Any]]]:
+        return [[v - r for v, r in zip(value, reference_value)] if value is not None else None for value, reference_value in zip(values, reference_values)]
+
+    annual_values = _summary_values(annual)
+    if reference_display_mode & ReferenceDisplayMode.ANNUAL == ReferenceDisplayMode.ANNUAL:
+        reference_annual_values = _summary_values(reference_annual)
+        delta_annual_values = _delta_values(annual_values, reference_annual_values)
+
+    _cell_style = 'background-color: #FFF;'
+    _normal_style = _cell_style + 'color: #000;'
+    _highlight_style = _cell_style + 'color: #018A8D;'
+    _reference_style = _cell_style + 'color: #666;'
+    _header_style = "background-color: #00B6B2; color: #FFF; font-weight: 700;"
+    header = f'<tr><th style="{_header_style}" />' + ''.join(f'<th style="{_header_style}">{column}</th>' for column in columns) + '</tr>'
+
+    values = [payment_plan[column].tolist() for column in columns]
+    mortgage_sums = payment_plan['Mortgage Sum'].tolist() if wallet_index >= 0 else None
+    if reference_display_mode & ReferenceDisplayMode.MONTHLY == ReferenceDisplayMode.MONTHLY:
+        reference_values = [reference_payment_plan[column].tolist() for column in columns]
+        reference_rows = len(reference_payment_plan)
+
+    rows = len(payment_plan)
+    year_index = -1
+    markup = list()
+    for row_index in range(rows):
+        if row_index == 0 or years[row_index] != years[row_index - 1]:
+            year_index += 1
+            markup.append(header)
+
+        # Show row
+        markup.append(f'<tr><td style="{_normal_style}" />')
+        for column_index, column_values in enumerate(values):
+            value = column_values[row_index]
+            style = _normal_style
+            if highlighted[column_index] and value > Decimal(0):
+                style = _highlight_style
+            elif column_index == wallet_index and mortgage_sums[row_index] < value:
+                style = _highlight_style
+            markup.append(f'<td style="{style}">{_format_value(value)}</td>')
+        markup.append('</tr>')
+
+        if reference_display_mode & ReferenceDisplayMode.MONTHLY == ReferenceDisplayMode.MONTHLY:
+            markup.append(f'<tr><td style="{_reference_style}">Reference:</td>')
+            for column_values in reference_values:
+                value = _format_value(column_values[row_index]) if row_index < reference_rows else _EMPTY
+                markup.append(f'<td style="{_reference_style}">{value}</td>')
+            markup.append('</tr>')
+
+        # Create annual summary
+        if row_index == rows - 1 or years[row_index] != years[row_index + 1]:
+            markup.append(_summary_row('Annual Summary', 'background-color: #FF9658; color: #000', annual_values, year_index))
+            if reference_display_mode & ReferenceDisplayMode.ANNUAL == ReferenceDisplayMode.ANNUAL:
+                markup.append(_summary_row('Reference Annual Summary', 'background-color: #F1F1F1; color: #999', reference_annual_values, year_index))
+                markup.append(_summary_row('Δ Annual Summary', 'background-color: #F1F1F1; color: #999', delta_annual_values, year_index))
+            yield ''.join(markup)
+            markup = list()
+
+    # Create grand summary
+    total_values = _summary_values(total)
+    markup.append(_summary_row('<b>Grand Summary</b>', 'background-color: #FD5A19; color: #000;', total_values, 0))
+    if reference_display_mode & ReferenceDisplayMode.TOTAL == ReferenceDisplayMode.TOTAL:
+        reference_total_values = _summary_values(reference_total)
+        markup.append(_summary_row('Reference Grand Summary', 'background-color: #FFF; color: #000', reference_total_values, 0))
+        markup.append(_summary_row('Δ Grand Summary', 'background-color: #FFF; color: #000', _delta_values(total_values, reference_total_values), 0))
+    yield ''.join(markup)
+
+
+def display_payment_plan(payment_plan: pd.DataFrame, reference_payment_plan: ty.Optional[pd.DataFrame] = None, reference_display_mode: ty.Optional[ReferenceDisplayMode] = None,
+                         years_per_page: ty.Optional[int] = None):
+    chunks = render_payment_plan(payment_plan, reference_payment_plan, reference_display_mode)
+    if years_per_page is None:
+        display(HTML("<table>" + ''.join(chunks) + "</table>"))
+        return
+
+    # Every page is displayed as soon as it is rendered instead of building the whole table first
+    page = list()
+    for chunk in chunks:
+        page.append(chunk)
+        if len(page) == years_per_page:
+            display(HTML("<table>" + ''.join(page) + "</table>"))
+            page = list()
+    if len(page) > 0:
+        display(HTML("<table>" + ''.join(page) + "</table>"))
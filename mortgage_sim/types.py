@@ -3,18 +3,40 @@ import typing as ty
 
 Number = ty.Union[Decimal, float, int]
 
+# Simulated months unless a strategy is created with another horizon
+HORIZON = 30 * 12
+
 
 class Percentage(object):
+    # Immutable and hashable, the decimal fraction is computed once
+    __slots__ = ('_value', '_decimal_fraction')
+
     def __init__(self, value: Number) -> None:
-        self._value: Decimal = Decimal(value)
+        object.__setattr__(self, '_value', Decimal(value))
+        object.__setattr__(self, '_decimal_fraction', self._value / Decimal(100))
 
     @property
     def decimal_fraction(self):
-        return self._value / Decimal(100)
+        return self._decimal_fraction
 
     @property
     def percentage(self):
         return self._value
+
+    def __setattr__(self, name: str, value: ty.Any) -> None:
+        raise AttributeError('Percentage is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('Percentage is immutable')
+
+    def __reduce__(self) -> ty.Tuple[ty.Any, ...]:
+        return Percentage, (self._value,)
+
+    def __copy__(self) -> 'Percentage':
+        return self
+
+    def __deepcopy__(self, memo: ty.Dict[int, ty.Any]) -> 'Percentage':
+        return self
     
     def __lt__(self, other: 'Percentage') -> bool:
         return self._value < other._value
@@ -28,11 +50,18 @@ class Percentage(object):
     def __ge__(self, other: 'Percentage') -> bool:
         return self._value >= other._value
     
-    def __eq__(self, other: 'Percentage') -> bool:
+    def __eq__(self, other: ty.Any) -> bool:
+        if not isinstance(other, Percentage):
+            return NotImplemented
         return self._value == other._value
     
-    def __ne__(self, other: 'Percentage') -> bool:
+    def __ne__(self, other: ty.Any) -> bool:
+        if not isinstance(other, Percentage):
+            return NotImplemented
         return self._value != other._value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
     
     def __repr__(self) -> str:
         return f'<Percentage value={self._value}%>'